@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+Batch Forest Plot Renderer
+NexVigilant Benefit-Risk Intelligence Toolkit
+
+Python counterpart of Forest_Plot_Generator.xlsx. Plots are drawn from a
+tidy estimates table, one row per line of the plot:
+
+    label     Row label (outcome, subgroup or study)
+    estimate  Point estimate
+    lower     Lower confidence limit
+    upper     Upper confidence limit
+    weight    Optional; marker area is proportional to it
+    group     Optional; section such as 'Benefit' / 'Risk', sets the colour
+    summary   Optional; True draws the row as a pooled-estimate diamond
+
+Every row type is drawn with one collection (all intervals in one
+LineCollection, all markers in one scatter, all diamonds in one
+PolyCollection), and the label and value columns are each one multi-line
+Text whose line spacing is fitted to the rows when drawn. A plot therefore
+has the same number of artists whatever its length, and render time grows
+only with the glyphs and markers actually drawn.
+Batches of plots are rendered to PNG/SVG/PDF in a process pool.
+
+Author: NexVigilant Capability Engineering
+Version: 1.0
+"""
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.text import Text
+from matplotlib.ticker import FuncFormatter, LogLocator, NullFormatter
+from matplotlib.transforms import offset_copy
+
+
+REQUIRED_COLUMNS = ('label', 'estimate', 'lower', 'upper')
+
+FORMATS = ('png', 'svg', 'pdf')
+
+GROUP_COLORS = {
+    'Benefit': '#2ecc71',
+    'Risk': '#e74c3c',
+}
+DEFAULT_COLOR = '#34495e'
+
+# Layout in inches: space per row, above the plot (title) and below it
+# (axis, favours labels, x label)
+ROW_HEIGHT = 0.28
+TOP_MARGIN = 0.5
+BOTTOM_MARGIN = 0.8
+FONT_SIZE = 9
+
+
+def _text_width(texts) -> float:
+    """Approximate width in inches of the longest string at FONT_SIZE."""
+    longest = max((len(t) for t in texts), default=0)
+    return 0.6 * FONT_SIZE / 72 * longest
+
+
+class _TextColumn(Text):
+    """
+    One text column of a forest plot (labels or values) as a single
+    multi-line Text at axes x, with line i drawn on data row y_top - i.
+
+    The row pitch in pixels depends on the final axes size, so the line
+    spacing is fitted at draw time: line pitch is affine in linespacing,
+    and two probe measurements give the value that matches the rows.
+    """
+
+    def __init__(self, ax: plt.Axes, x: float, y_top: float, lines: Sequence[str],
+                 transform, **kwargs):
+        # Centred on the middle row: every line box has the same height
+        super().__init__(x, y_top - (len(lines) - 1) / 2, "\n".join(lines),
+                         transform=transform, va='center', clip_on=False, **kwargs)
+        self._column_axes = ax
+        self._n_lines = len(lines)
+
+    def _line_pitch(self, renderer, linespacing: float) -> float:
+        heights = []
+        for text in ("lp", "lp\nlp"):
+            probe = Text(0, 0, text, fontproperties=self.get_fontproperties(),
+                         linespacing=linespacing)
+            probe.set_figure(self.get_figure())
+            heights.append(probe.get_window_extent(renderer).height)
+        return heights[1] - heights[0]
+
+    def draw(self, renderer):
+        if self._n_lines > 1 and self.get_visible():
+            transform = self._column_axes.transData
+            row_pitch = abs(transform.transform((0, 1))[1] - transform.transform((0, 0))[1])
+            one, two = self._line_pitch(renderer, 1.0), self._line_pitch(renderer, 2.0)
+            if two > one:
+                # Set directly: set_linespacing() would mark the figure stale mid-draw
+                self._linespacing = max(1.0 + (row_pitch - one) / (two - one), 0.0)
+        super().draw(renderer)
+
+
+def _validate(table: pd.DataFrame) -> pd.DataFrame:
+    """Check the tidy table and fill optional columns."""
+    missing = [c for c in REQUIRED_COLUMNS if c not in table.columns]
+    if missing:
+        raise ValueError(f"Forest plot table is missing columns: {missing}")
+    if table.empty:
+        raise ValueError("Forest plot table has no rows")
+
+    table = table.reset_index(drop=True)
+    values = table[['estimate', 'lower', 'upper']].to_numpy(dtype=float)
+    finite = np.isfinite(values).all(axis=1)
+    if ((values[finite, 1] > values[finite, 0]) | (values[finite, 0] > values[finite, 2])).any():
+        raise ValueError("Each row needs lower <= estimate <= upper")
+    if 'weight' not in table.columns:
+        table = table.assign(weight=1.0)
+    if 'group' not in table.columns:
+        table = table.assign(group=None)
+    if 'summary' not in table.columns:
+        table = table.assign(summary=False)
+    return table
+
+
+def forest_plot(table: pd.DataFrame,
+                ax: Optional[plt.Axes] = None,
+                null_value: float = 1.0,
+                log_scale: Optional[bool] = None,
+                title: Optional[str] = None,
+                xlabel: Optional[str] = None,
+                favors: Optional[Sequence[str]] = None,
+                show_values: bool = True,
+                colors: Optional[Mapping[str, str]] = None,
+                width: float = 10.0) -> plt.Figure:
+    """
+    Draw one forest plot.
+
+    Args:
+        table: Tidy estimates table (see module docstring); rows are
+               drawn top to bottom in table order
+        ax: Axes to draw on (a correctly sized figure is created if None)
+        null_value: Line of no effect (1 for ratios, 0 for differences)
+        log_scale: Log x-axis; defaults to True when null_value is 1
+        title: Plot title
+        xlabel: X-axis label
+        favors: Labels below the axis, left and right of the null line,
+                e.g. ('Favors Control', 'Favors Treatment')
+        show_values: Show "estimate (lower, upper)" on the right
+        colors: Group -> colour mapping (defaults to GROUP_COLORS)
+        width: Figure width in inches when ax is None
+
+    Returns:
+        matplotlib Figure
+    """
+    table = _validate(table)
+    if log_scale is None:
+        log_scale = null_value == 1.0
+    colors = {**GROUP_COLORS, **(colors or {})}
+
+    n_rows = len(table)
+    own_figure = ax is None
+    if own_figure:
+        fig, ax = plt.subplots(figsize=(width, TOP_MARGIN + BOTTOM_MARGIN + ROW_HEIGHT * n_rows))
+    else:
+        fig = ax.figure
+
+    y = np.arange(n_rows)[::-1].astype(float)
+    est = table['estimate'].to_numpy(dtype=float)
+    lo = table['lower'].to_numpy(dtype=float)
+    hi = table['upper'].to_numpy(dtype=float)
+    summary = table['summary'].to_numpy(dtype=bool)
+    row_colors = np.array([colors.get(g, DEFAULT_COLOR) for g in table['group']], dtype=object)
+    drawn = np.isfinite(est) & np.isfinite(lo) & np.isfinite(hi)
+    if log_scale:
+        drawn &= (lo > 0)
+
+    # Study/outcome rows: one LineCollection for CIs, one scatter for markers
+    rows = drawn & ~summary
+    segments = np.stack([np.column_stack([lo[rows], y[rows]]),
+                         np.column_stack([hi[rows], y[rows]])], axis=1)
+    ax.add_collection(LineCollection(segments, colors=list(row_colors[rows]), linewidths=1.5))
+    weight = table['weight'].to_numpy(dtype=float)[rows]
+    if len(weight) and np.nanmax(weight) > 0:
+        sizes = 20 + 130 * np.sqrt(np.nan_to_num(weight) / np.nanmax(weight))
+    else:
+        sizes = np.full(len(weight), 60.0)
+    ax.scatter(est[rows], y[rows], s=sizes, marker='s', c=list(row_colors[rows]), zorder=3)
+
+    # Pooled rows: one PolyCollection of diamonds
+    pooled = drawn & summary
+    if pooled.any():
+        half = 0.35
+        diamonds = np.stack([
+            np.column_stack([lo[pooled], y[pooled]]),
+            np.column_stack([est[pooled], y[pooled] + half]),
+            np.column_stack([hi[pooled], y[pooled]]),
+            np.column_stack([est[pooled], y[pooled] - half]),
+        ], axis=1)
+        ax.add_collection(PolyCollection(diamonds, facecolors=list(row_colors[pooled]),
+                                         edgecolors='black', linewidths=0.8, zorder=3))
+
+    ax.axvline(null_value, color='black', linestyle='--', linewidth=0.8, alpha=0.6)
+
+    if log_scale:
+        ax.set_xscale('log')
+        ax.xaxis.set_major_locator(LogLocator(subs=(1.0, 2.0, 3.0, 5.0)))
+        ax.xaxis.set_major_formatter(FuncFormatter(lambda value, _: f"{value:g}"))
+        ax.xaxis.set_minor_formatter(NullFormatter())
+    if drawn.any():
+        left = min(lo[drawn].min(), null_value)
+        right = max(hi[drawn].max(), null_value)
+        if log_scale:
+            pad = (right / left) ** 0.05
+            ax.set_xlim(left / pad, right * pad)
+        else:
+            pad = 0.05 * (right - left or 1.0)
+            ax.set_xlim(left - pad, right + pad)
+    ax.set_ylim(-0.75, n_rows - 0.25)
+
+    # Label and value columns are one multi-line Text each in the margins;
+    # tick labels or a Text per row would add artists for every row, all
+    # measured again by tight_layout() before every save
+    left_column = offset_copy(ax.get_yaxis_transform(), fig=fig, x=-6, units='points')
+    right_column = offset_copy(ax.get_yaxis_transform(), fig=fig, x=6, units='points')
+    labels = list(table['label'].astype(str))
+    ax.add_artist(_TextColumn(ax, 0, y[0], labels, left_column, ha='right',
+                              multialignment='right', fontsize=FONT_SIZE))
+    value_text = [f"{e:.2f} ({l:.2f}, {h:.2f})" if ok else ''
+                  for e, l, h, ok in zip(est, lo, hi, drawn)]
+    if show_values:
+        ax.add_artist(_TextColumn(ax, 1, y[0], value_text, right_column, ha='left',
+                                  multialignment='left', fontsize=FONT_SIZE))
+    ax.set_yticks([])
+    for side in ('top', 'right', 'left'):
+        ax.spines[side].set_visible(False)
+
+    if favors:
+        below_axis = offset_copy(ax.get_xaxis_transform(), fig=fig, y=-20, units='points')
+        ax.text(null_value, 0, f"← {favors[0]}  ", transform=below_axis,
+                ha='right', va='top', fontsize=8)
+        ax.text(null_value, 0, f"  {favors[1]} →", transform=below_axis,
+                ha='left', va='top', fontsize=8)
+    if xlabel:
+        ax.set_xlabel(xlabel, labelpad=20)
+    if title:
+        ax.set_title(title, fontweight='bold')
+
+    if own_figure:
+        # Margins from the longest label/value, so no layout pass is needed
+        height = fig.get_figheight()
+        label_width = _text_width(table['label'].astype(str)) + 0.15
+        value_width = _text_width(value_text) + 0.15 if show_values else 0.2
+        fig.subplots_adjust(left=min(label_width / width, 0.6),
+                            right=max(1 - value_width / width, 0.65),
+                            top=1 - TOP_MARGIN / height,
+                            bottom=BOTTOM_MARGIN / height)
+    return fig
+
+
+def _render_one(task) -> List[str]:
+    """Render one plot to every requested format (runs in a worker process)."""
+    name, table, output_dir, formats, dpi, kwargs = task
+    fig = forest_plot(table, **kwargs)
+    paths = []
+    for fmt in formats:
+        path = Path(output_dir) / f"{safe_filename(name)}.{fmt}"
+        fig.savefig(path, dpi=dpi)
+        paths.append(str(path))
+    plt.close(fig)
+    return paths
+
+
+def safe_filename(name: str) -> str:
+    """
+    File-system safe version of a plot name.
+
+    Names that had to be changed get a short hash of the original, so
+    names differing only in replaced characters ('eGFR<60', 'eGFR>60')
+    do not overwrite each other's files.
+    """
+    name = str(name)
+    cleaned = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in name).strip('_')
+    if cleaned == name:
+        return cleaned
+    digest = hashlib.sha1(name.encode('utf-8')).hexdigest()[:8]
+    return f"{cleaned or 'forest_plot'}_{digest}"
+
+
+def render_batch(tables: Mapping[str, pd.DataFrame],
+                 output_dir: str,
+                 formats: Sequence[str] = ('png',),
+                 n_jobs: Optional[int] = None,
+                 dpi: int = 150,
+                 **plot_kwargs) -> Dict[str, List[str]]:
+    """
+    Render many forest plots in parallel.
+
+    Args:
+        tables: Plot name -> tidy estimates table (the name is used as the
+                file name and, unless a title is given, as the title)
+        output_dir: Output directory (created if needed)
+        formats: Any of 'png', 'svg', 'pdf'
+        n_jobs: Worker processes (default: CPU count; 1 renders inline)
+        dpi: Resolution of raster output
+        **plot_kwargs: Passed to forest_plot()
+
+    Returns:
+        Plot name -> list of written file paths
+    """
+    bad = [f for f in formats if f not in FORMATS]
+    if bad:
+        raise ValueError(f"Unsupported formats {bad}; choose from {FORMATS}")
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    tasks = [(name, table, output_dir, tuple(formats), dpi,
+              {'title': str(name), **plot_kwargs})
+             for name, table in tables.items()]
+
+    n_jobs = n_jobs or os.cpu_count() or 1
+    if n_jobs == 1 or len(tasks) <= 1:
+        results = [_render_one(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(tasks))) as pool:
+            chunksize = max(1, len(tasks) // (4 * n_jobs))
+            results = list(pool.map(_render_one, tasks, chunksize=chunksize))
+    return dict(zip(tables.keys(), results))
+
+
+# =============================================================================
+# Adapters from the analysis engines
+# =============================================================================
+
+def from_effects_table(results: pd.DataFrame,
+                       measure: str = 'relative',
+                       by: Sequence[str] = ('Comparison', 'Subgroup')) -> Dict[str, pd.DataFrame]:
+    """
+    Split EffectsTableAnalysis.compute() output into one tidy table per plot.
+
+    Args:
+        results: Long Effects Table (one row per comparison x subgroup x outcome)
+        measure: 'relative' (RR/IRR; continuous outcomes, whose relative
+                 measure is an SMD, are left out so the axis stays a
+                 ratio scale) or 'difference'
+        by: Columns defining one plot each; remaining rows become plot rows
+
+    Returns:
+        Plot name -> tidy estimates table, rows ordered benefits first
+    """
+    columns = {'relative': ('relative', 'rel_lower', 'rel_upper'),
+               'difference': ('difference', 'diff_lower', 'diff_upper')}
+    if measure not in columns:
+        raise ValueError("measure must be 'relative' or 'difference'")
+    est, lo, hi = columns[measure]
+    if measure == 'relative':
+        results = results[results['measure'] != 'SMD']
+
+    tidy = pd.DataFrame({
+        'label': results['Outcome'] + (' (' + results['measure'] + ')'
+                                       if measure == 'relative' else ''),
+        'estimate': results[est],
+        'lower': results[lo],
+        'upper': results[hi],
+        'weight': results['n_treatment'] + results['n_control'],
+        'group': results['Category'],
+    })
+    keys = results[list(by)].astype(str).agg(' | '.join, axis=1)
+    order = np.argsort(np.where(tidy['group'] == 'Benefit', 0, 1), kind='stable')
+    tidy, keys = tidy.iloc[order], keys.iloc[order]
+    return {key: part.reset_index(drop=True) for key, part in tidy.groupby(keys, sort=False)}
+
+
+def from_meta_analysis(meta, method: str = 'REML', confidence: float = 0.95) -> pd.DataFrame:
+    """
+    Tidy table of study win ratios plus the pooled diamond from a
+    DOORMetaAnalysis.
+    """
+    studies = meta.study_table(confidence, method)
+    pooled = meta.pool(method, confidence)
+    table = pd.DataFrame({
+        'label': studies.index.astype(str),
+        'estimate': studies['win_ratio'].to_numpy(),
+        'lower': studies['wr_lower'].to_numpy(),
+        'upper': studies['wr_upper'].to_numpy(),
+        'weight': studies['weight'].to_numpy(),
+        'summary': False,
+    })
+    summary_row = pd.DataFrame([{'label': f"Pooled ({method})",
+                                 'estimate': pooled['win_ratio'],
+                                 'lower': pooled['wr_lower'],
+                                 'upper': pooled['wr_upper'],
+                                 'weight': np.nan,
+                                 'summary': True}])
+    return pd.concat([table, summary_row], ignore_index=True)
+
+
+def create_example_data(n_outcomes: int = 12, n_subgroups: int = 40,
+                        seed: int = 42) -> Dict[str, pd.DataFrame]:
+    """
+    Example batch: one relative-risk forest plot per subgroup.
+    """
+    rng = np.random.default_rng(seed)
+    tables = {}
+    for s in range(n_subgroups):
+        log_rr = rng.normal(0, 0.4, n_outcomes)
+        se = rng.uniform(0.08, 0.35, n_outcomes)
+        tables[f"Subgroup {s + 1:02d}"] = pd.DataFrame({
+            'label': [f"Outcome {k + 1}" for k in range(n_outcomes)],
+            'estimate': np.exp(log_rr),
+            'lower': np.exp(log_rr - 1.96 * se),
+            'upper': np.exp(log_rr + 1.96 * se),
+            'weight': 1 / se ** 2,
+            'group': np.where(np.arange(n_outcomes) < n_outcomes // 2, 'Benefit', 'Risk'),
+        })
+    return tables
+
+
+def main():
+    """
+    Render an example batch of forest plots.
+    """
+    import tempfile
+    import time
+
+    print("=" * 70)
+    print("BATCH FOREST PLOT RENDERER DEMONSTRATION")
+    print("NexVigilant Benefit-Risk Intelligence Toolkit")
+    print("=" * 70)
+    print()
+
+    tables = create_example_data()
+    output_dir = tempfile.mkdtemp(prefix='forest_plots_')
+    start = time.perf_counter()
+    written = render_batch(tables, output_dir, formats=('png', 'svg'),
+                           xlabel='Relative Risk (log scale)',
+                           favors=('Favors Control', 'Favors Treatment'))
+    elapsed = time.perf_counter() - start
+    n_files = sum(len(paths) for paths in written.values())
+    print(f"Rendered {len(written)} plots ({n_files} files) in {elapsed:.2f} s")
+    print(f"Output: {output_dir}")
+    print()
+
+    big = create_example_data(n_outcomes=500, n_subgroups=1)['Subgroup 01']
+    start = time.perf_counter()
+    fig = forest_plot(big, title='500-row forest plot')
+    fig.savefig(Path(output_dir) / 'large.png', dpi=100)
+    print(f"500-row plot rendered in {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,558 @@
+#!/usr/bin/env python3
+"""
+Local HTTP/JSON Analysis Service
+NexVigilant Benefit-Risk Intelligence Toolkit
+
+Keeps the DOOR and MCDA engines warm in one process so dashboards can
+call them over HTTP instead of starting a new Python process (and
+re-importing pandas/scipy/matplotlib) for every request.
+
+Endpoints (JSON in, JSON out):
+
+    GET  /health               Liveness check
+    GET  /stats                Cache and batching counters
+    POST /door/compare         DOOR comparison of two rank histograms
+    POST /door/report          Comparison plus the text report
+    POST /door/distribution    Outcome distribution per arm
+    POST /mcda/score           Total scores for one or more weight sets
+
+Concurrent requests are micro-batched: the service waits a few
+milliseconds for more work, then runs every DOOR comparison sharing a
+hierarchy through DOORAnalysis.compare_distribution_batch() and every MCDA
+request sharing a value matrix through a single weights @ values.T
+product. Results are kept in an LRU cache keyed by a hash of the input
+histograms or value matrix and weights.
+
+The server binds to 127.0.0.1 by default and uses only the standard
+library on top of the toolkit's own dependencies.
+
+Usage:
+    python analysis_service.py --port 8765
+
+    curl -s localhost:8765/door/compare -d '{
+        "hierarchy": ["Alive, no event", "Alive, event", "Death"],
+        "treatment_counts": [60, 30, 10],
+        "control_counts": [50, 35, 15]}'
+
+Author: NexVigilant Capability Engineering
+Version: 1.0
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from door_analysis import DOORAnalysis
+from mcda_analysis import MCDAAnalysis
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+BATCH_WINDOW = 0.002        # Seconds to wait for more requests
+MAX_BATCH = 512             # Requests per batch
+CACHE_SIZE = 4096           # Cached results
+ENGINE_CACHE_SIZE = 64      # Warm engines per kind (hierarchies, criteria sets)
+MAX_BODY = 64 * 1024 * 1024  # Bytes
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found',
+           405: 'Method Not Allowed', 413: 'Payload Too Large',
+           500: 'Internal Server Error'}
+
+
+class RequestError(ValueError):
+    """Invalid request; reported to the client with HTTP 400."""
+
+
+# =============================================================================
+# Cache and hashing
+# =============================================================================
+
+def _digest(*parts) -> str:
+    """Stable hash of arrays, strings and JSON-serialisable values."""
+    h = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            h.update(str((part.dtype.str, part.shape)).encode())
+            h.update(np.ascontiguousarray(part).tobytes())
+        else:
+            h.update(json.dumps(part, sort_keys=True, default=str).encode())
+        h.update(b'\x00')
+    return h.hexdigest()
+
+
+class LRUCache:
+    """Least-recently-used result cache with hit/miss counters."""
+
+    def __init__(self, max_entries: int = CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# =============================================================================
+# Request parsing
+# =============================================================================
+
+def _json_safe(value):
+    """Convert numpy scalars and non-finite floats for strict JSON."""
+    if isinstance(value, dict):
+        return {str(k): _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _require(payload: dict, key: str):
+    if key not in payload:
+        raise RequestError(f"Missing field '{key}'")
+    return payload[key]
+
+
+def _histogram(door: DOORAnalysis, payload: dict, arm: str) -> np.ndarray:
+    """
+    Rank histogram for one arm from '<arm>_counts', '<arm>_outcomes'
+    (category labels) or '<arm>_ranks'.
+    """
+    if f'{arm}_counts' in payload:
+        counts = np.asarray(payload[f'{arm}_counts'], dtype=float)
+        if counts.shape != (door.n_categories,) or (counts < 0).any() \
+                or (counts != np.round(counts)).any():
+            raise RequestError(f"'{arm}_counts' must be {door.n_categories} "
+                               f"non-negative integers")
+        return counts.astype(np.int64)
+    if f'{arm}_outcomes' in payload:
+        outcomes = payload[f'{arm}_outcomes']
+        unknown = set(outcomes) - set(door.rank_map)
+        if unknown:
+            raise RequestError(f"Unknown outcomes: {sorted(unknown)[:5]}")
+        return door.rank_histogram([door.rank_map[o] for o in outcomes])
+    if f'{arm}_ranks' in payload:
+        return door.rank_histogram(payload[f'{arm}_ranks'])
+    raise RequestError(f"Provide '{arm}_counts', '{arm}_outcomes' or '{arm}_ranks'")
+
+
+@dataclass
+class _Job:
+    """One queued request waiting for its batch."""
+    kind: str                   # 'door' or 'mcda'
+    group: str                  # Requests in the same group are vectorized together
+    key: str                    # Result cache key
+    inputs: tuple
+    future: asyncio.Future = field(repr=False)
+
+
+# =============================================================================
+# Service
+# =============================================================================
+
+class AnalysisService:
+    """
+    Warm DOOR/MCDA engines behind an asyncio HTTP server.
+
+    Args:
+        batch_window: Seconds to wait for further requests before
+                      running a batch
+        max_batch: Maximum requests per batch
+        cache_size: Maximum cached results
+        engine_cache_size: Maximum warm engines kept per kind
+    """
+
+    def __init__(self, batch_window: float = BATCH_WINDOW, max_batch: int = MAX_BATCH,
+                 cache_size: int = CACHE_SIZE, engine_cache_size: int = ENGINE_CACHE_SIZE):
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.cache = LRUCache(cache_size)
+        # Keyed by hierarchy tuple and criteria digest respectively
+        self._door_engines = LRUCache(engine_cache_size)
+        self._mcda_engines = LRUCache(engine_cache_size)
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # Batches run one at a time off the event loop, on a dedicated thread
+        # so they never queue behind other work in the default executor
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='batch')
+        self.stats = {'requests': 0, 'batches': 0, 'batched_jobs': 0, 'largest_batch': 0}
+        self.started = time.time()
+
+    # ------------------------------------------------------------------ engines
+
+    def door_engine(self, hierarchy) -> DOORAnalysis:
+        """DOORAnalysis for a hierarchy, created once and reused."""
+        if not isinstance(hierarchy, list) or len(hierarchy) < 2:
+            raise RequestError("'hierarchy' must list at least two outcome categories")
+        key = tuple(str(h) for h in hierarchy)
+        if len(set(key)) != len(key):
+            raise RequestError("'hierarchy' categories must be unique")
+        door = self._door_engines.get(key)
+        if door is None:
+            door = DOORAnalysis(outcome_hierarchy=list(key))
+            self._door_engines.put(key, door)
+        return door
+
+    def mcda_engine(self, criteria) -> Tuple[str, MCDAAnalysis]:
+        """MCDAAnalysis for a criteria definition, created once and reused."""
+        if not isinstance(criteria, dict) or not criteria:
+            raise RequestError("'criteria' must map criterion names to definitions")
+        key = _digest(criteria)
+        mcda = self._mcda_engines.get(key)
+        if mcda is None:
+            for name, info in criteria.items():
+                if info.get('direction') not in ('higher_better', 'lower_better'):
+                    raise RequestError(f"Criterion '{name}' needs direction "
+                                       f"'higher_better' or 'lower_better'")
+            mcda = MCDAAnalysis(criteria)
+            self._mcda_engines.put(key, mcda)
+        return key, mcda
+
+    # ------------------------------------------------------------------ handlers
+
+    async def door_compare(self, payload: dict) -> dict:
+        door = self.door_engine(_require(payload, 'hierarchy'))
+        trt = _histogram(door, payload, 'treatment')
+        ctrl = _histogram(door, payload, 'control')
+        if trt.sum() == 0 or ctrl.sum() == 0:
+            raise RequestError("Both arms need at least one patient")
+        group = _digest(door.outcome_hierarchy)
+        return await self._submit('door', group, _digest('door', group, trt, ctrl),
+                                  (door, trt, ctrl))
+
+    async def door_report(self, payload: dict) -> dict:
+        results = await self.door_compare(payload)
+        door = self.door_engine(payload['hierarchy'])
+        return {'results': results, 'report': door.generate_report(results)}
+
+    async def door_distribution(self, payload: dict) -> dict:
+        door = self.door_engine(_require(payload, 'hierarchy'))
+        arms = _require(payload, 'arms')
+        if not isinstance(arms, dict) or not arms:
+            raise RequestError("'arms' must map arm names to counts, outcomes or ranks")
+
+        distribution = {}
+        for arm, spec in arms.items():
+            spec = spec if isinstance(spec, dict) else {'counts': spec}
+            counts = _histogram(door, {f'arm_{k}': v for k, v in spec.items()}, 'arm')
+            total = counts.sum()
+            distribution[arm] = {
+                category: {'count': int(n), 'percent': 100 * n / total if total else 0.0}
+                for category, n in zip(door.outcome_hierarchy, counts)
+            }
+        return {'distribution': distribution}
+
+    async def mcda_score(self, payload: dict) -> dict:
+        criteria_key, mcda = self.mcda_engine(_require(payload, 'criteria'))
+        treatment_col = payload.get('treatment_column', 'Treatment')
+        values, treatments = self._value_matrix(mcda, payload, treatment_col)
+
+        weight_sets = _require(payload, 'weights')
+        if isinstance(weight_sets, dict) and set(weight_sets) <= set(mcda.criterion_names) \
+                and all(not isinstance(v, dict) for v in weight_sets.values()):
+            weight_sets = {'Base': weight_sets}
+        try:
+            weights, scenarios = mcda.weight_matrix(weight_sets)
+        except (ValueError, TypeError) as e:
+            raise RequestError(str(e))
+
+        group = _digest(criteria_key, values, list(treatments))
+        key = _digest('mcda', group, weights, [str(s) for s in scenarios])
+        return await self._submit('mcda', group, key,
+                                  (values, list(treatments), weights, [str(s) for s in scenarios]))
+
+    def _value_matrix(self, mcda: MCDAAnalysis, payload: dict, treatment_col: str):
+        """0-100 value matrix from 'raw_data' (scored here) or 'values'."""
+        try:
+            if 'values' in payload:
+                values = np.asarray(payload['values'], dtype=float)
+                treatments = _require(payload, 'treatments')
+                if values.shape != (len(treatments), mcda.n_criteria):
+                    raise RequestError(f"'values' must be {len(treatments)} x {mcda.n_criteria}")
+                return values, pd.Index(treatments)
+            raw = pd.DataFrame(_require(payload, 'raw_data'))
+            bounds = {c: tuple(b) for c, b in payload.get('bounds', {}).items()}
+            scored = mcda.score(raw, bounds)
+            return mcda.value_matrix(scored, treatment_col)
+        except RequestError:
+            raise
+        except KeyError as e:
+            raise RequestError(f"Missing column {e} in 'raw_data'")
+        except (ValueError, TypeError) as e:
+            raise RequestError(f"Invalid MCDA input: {e}")
+
+    # ------------------------------------------------------------------ batching
+
+    async def _submit(self, kind: str, group: str, key: str, inputs: tuple):
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_Job(kind, group, key, inputs, future))
+        return await future
+
+    async def _batch_worker(self):
+        """Collect jobs for batch_window seconds, then run them together."""
+        loop = asyncio.get_running_loop()
+        while True:
+            jobs = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(jobs) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    jobs.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            self.stats['batches'] += 1
+            self.stats['batched_jobs'] += len(jobs)
+            self.stats['largest_batch'] = max(self.stats['largest_batch'], len(jobs))
+            try:
+                results = await loop.run_in_executor(self._executor, self._run_batch, jobs)
+            except Exception as e:  # Fail every job in the batch, keep serving
+                results = [e] * len(jobs)
+            for job, result in zip(jobs, results):
+                if job.future.done():
+                    continue
+                if isinstance(result, Exception):
+                    job.future.set_exception(result)
+                else:
+                    self.cache.put(job.key, result)
+                    job.future.set_result(result)
+
+    def _run_batch(self, jobs: List[_Job]) -> list:
+        """Vectorize each (kind, group) of jobs; runs in a worker thread."""
+        groups = defaultdict(list)
+        for i, job in enumerate(jobs):
+            groups[(job.kind, job.group)].append(i)
+
+        results: list = [None] * len(jobs)
+        for (kind, _), indices in groups.items():
+            batch = [jobs[i] for i in indices]
+            try:
+                outputs = (self._run_door(batch) if kind == 'door'
+                           else self._run_mcda(batch))
+            except Exception as e:
+                outputs = [e] * len(batch)
+            for i, output in zip(indices, outputs):
+                results[i] = output
+        return results
+
+    @staticmethod
+    def _run_door(jobs: List[_Job]) -> list:
+        door = jobs[0].inputs[0]
+        trt = np.stack([job.inputs[1] for job in jobs])
+        ctrl = np.stack([job.inputs[2] for job in jobs])
+        # Cached unsanitised: /door/report formats an infinite win ratio, and
+        # _respond makes every response JSON-safe anyway
+        return door.compare_distribution_batch(trt, ctrl)
+
+    @staticmethod
+    def _run_mcda(jobs: List[_Job]) -> list:
+        values, treatments = jobs[0].inputs[0], jobs[0].inputs[1]
+        weights = np.vstack([job.inputs[2] for job in jobs])
+        scores = weights @ values.T
+
+        outputs, start = [], 0
+        for job in jobs:
+            scenarios = job.inputs[3]
+            block = scores[start:start + len(scenarios)]
+            start += len(scenarios)
+            outputs.append({
+                'treatments': treatments,
+                'scores': {s: dict(zip(treatments, row.tolist()))
+                           for s, row in zip(scenarios, block)},
+                'preferred': {s: treatments[int(np.argmax(row))]
+                              for s, row in zip(scenarios, block)},
+            })
+        return outputs
+
+    # ------------------------------------------------------------------ HTTP
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, dict]:
+        """Route one request to its handler; returns (status, JSON body)."""
+        self.stats['requests'] += 1
+        get_routes = {'/health': self._health, '/stats': self._stats}
+        post_routes = {'/door/compare': self.door_compare, '/door/report': self.door_report,
+                       '/door/distribution': self.door_distribution,
+                       '/mcda/score': self.mcda_score}
+        path = path.split('?', 1)[0].rstrip('/') or '/'
+
+        if path in get_routes:
+            if method != 'GET':
+                return 405, {'error': f"{path} expects GET"}
+            return 200, get_routes[path]()
+        if path not in post_routes:
+            return 404, {'error': f"Unknown endpoint {path}"}
+        if method != 'POST':
+            return 405, {'error': f"{path} expects POST"}
+
+        try:
+            payload = json.loads(body or b'{}')
+            if not isinstance(payload, dict):
+                raise RequestError("Request body must be a JSON object")
+            return 200, await post_routes[path](payload)
+        except json.JSONDecodeError as e:
+            return 400, {'error': f"Invalid JSON: {e}"}
+        except ValueError as e:  # RequestError and engine input validation
+            return 400, {'error': str(e)}
+
+    def _health(self) -> dict:
+        return {'status': 'ok', 'uptime_seconds': time.time() - self.started}
+
+    def _stats(self) -> dict:
+        return {**self.stats,
+                'cache_entries': len(self.cache),
+                'cache_hits': self.cache.hits,
+                'cache_misses': self.cache.misses,
+                'door_engines': len(self._door_engines),
+                'mcda_engines': len(self._mcda_engines)}
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter):
+        """Minimal HTTP/1.1 with keep-alive and Content-Length bodies."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, 400, {'error': 'Malformed request line'}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get('content-length', 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, 400, {'error': 'Invalid Content-Length'}, False)
+                    break
+                if length > MAX_BODY:
+                    await self._respond(writer, 413, {'error': 'Request body too large'}, False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                keep_alive = (headers.get('connection', '').lower() != 'close'
+                              and version.upper() == 'HTTP/1.1')
+                try:
+                    status, response = await self.dispatch(method.upper(), target, body)
+                except Exception as e:
+                    status, response = 500, {'error': f"{type(e).__name__}: {e}"}
+                await self._respond(writer, status, response, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload: dict,
+                       keep_alive: bool):
+        body = json.dumps(_json_safe(payload), allow_nan=False).encode()
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+    async def start(self, host: str = DEFAULT_HOST,
+                    port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+        """
+        Start the batch worker and HTTP server on the running event loop.
+
+        Args:
+            host: Interface to bind (localhost by default)
+            port: TCP port; 0 picks a free port
+
+        Returns:
+            asyncio server (server.sockets[0].getsockname() gives the port)
+        """
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._batch_worker())
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+    async def stop(self, server: asyncio.AbstractServer):
+        server.close()
+        await server.wait_closed()
+        if self._worker is not None:
+            self._worker.cancel()
+        self._executor.shutdown(wait=False)
+
+
+def main():
+    """
+    Run the analysis service until interrupted.
+    """
+    parser = argparse.ArgumentParser(description="NexVigilant B-R analysis service")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="Interface to bind")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="TCP port")
+    parser.add_argument('--batch-window-ms', type=float, default=BATCH_WINDOW * 1000,
+                        help="Milliseconds to collect requests into one batch")
+    parser.add_argument('--max-batch', type=int, default=MAX_BATCH)
+    parser.add_argument('--cache-size', type=int, default=CACHE_SIZE)
+    args = parser.parse_args()
+
+    async def serve():
+        service = AnalysisService(args.batch_window_ms / 1000, args.max_batch, args.cache_size)
+        server = await service.start(args.host, args.port)
+        host, port = server.sockets[0].getsockname()[:2]
+        print("=" * 70)
+        print("NEXVIGILANT B-R ANALYSIS SERVICE")
+        print("=" * 70)
+        print(f"Listening on http://{host}:{port}  (Ctrl+C to stop)")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print("\nService stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,7 @@ import pandas as pd
 import numpy as np
 from scipy import stats
 from collections import Counter
+from pathlib import Path
 import matplotlib.pyplot as plt
 
 
@@ -58,29 +59,38 @@ class DOORAnalysis:
         self.rank_map = {outcome: rank + 1 
                          for rank, outcome in enumerate(outcome_hierarchy)}
         self.results = None
+        self.bayesian_results = None
         
     def assign_outcomes(self, patient_data: pd.DataFrame, 
-                        outcome_column: str) -> pd.DataFrame:
+                        outcome_column: str,
+                        allow_missing: bool = False) -> pd.DataFrame:
         """
         Assign each patient to their DOOR outcome category.
         
         Args:
             patient_data: DataFrame with patient-level data
             outcome_column: Name of column containing outcome category
+            allow_missing: Keep patients with a missing (NaN/None) outcome;
+                           their door_rank is <NA> (nullable Int64) so
+                           they can be imputed with door_imputation.py
             
         Returns:
             DataFrame with added 'door_rank' column
         """
         data = patient_data.copy()
+        missing = data[outcome_column].isna() if allow_missing else None
         
         # Validate all outcomes are in hierarchy
-        unique_outcomes = data[outcome_column].unique()
+        observed = data[outcome_column] if missing is None else data.loc[~missing, outcome_column]
+        unique_outcomes = observed.unique()
         invalid = set(unique_outcomes) - set(self.outcome_hierarchy)
         if invalid:
             raise ValueError(f"Unknown outcomes: {invalid}")
             
         # Assign ranks
         data['door_rank'] = data[outcome_column].map(self.rank_map)
+        if missing is not None:
+            data['door_rank'] = data['door_rank'].astype('Int64')
         data['door_category'] = data[outcome_column]
         
         return data
@@ -109,57 +119,280 @@ class DOORAnalysis:
         trt = data[data[treatment_column] == treatment_arm]['door_rank'].values
         ctrl = data[data[treatment_column] == control_arm]['door_rank'].values
         
-        # Perform all pairwise comparisons
-        n_trt = len(trt)
-        n_ctrl = len(ctrl)
-        n_pairs = n_trt * n_ctrl
+        # Every pair is decided by the two ranks alone, so compare the
+        # rank histograms instead of looping over all n_trt x n_ctrl pairs
+        return self.compare_distributions(self.rank_histogram(trt),
+                                          self.rank_histogram(ctrl))
+    
+    def rank_histogram(self, ranks) -> np.ndarray:
+        """
+        Count patients in each DOOR rank.
         
-        trt_wins = 0  # Treatment patient has better (lower) rank
-        ctrl_wins = 0  # Control patient has better (lower) rank
-        ties = 0  # Same rank
+        Args:
+            ranks: DOOR ranks (1 = best)
+            
+        Returns:
+            Integer array of length n_categories; index 0 holds rank 1
+        """
+        ranks = np.asarray(ranks, dtype=np.int64)
+        if ranks.size and (ranks.min() < 1 or ranks.max() > self.n_categories):
+            raise ValueError(f"DOOR ranks must lie between 1 and {self.n_categories}")
+        return np.bincount(ranks - 1, minlength=self.n_categories)
+    
+    def compare_distributions(self, treatment_counts, control_counts) -> dict:
+        """
+        Perform the DOOR pairwise comparison from rank histograms.
         
-        for t in trt:
-            for c in ctrl:
-                if t < c:
-                    trt_wins += 1
-                elif t > c:
-                    ctrl_wins += 1
-                else:
-                    ties += 1
+        A treatment patient in rank k beats every control patient in a
+        worse rank and ties with every control patient in rank k, so win
+        and tie counts follow from cumulative sums over the categories:
+        O(n_categories) instead of O(n_trt x n_ctrl). Results match
+        compare_treatments() on the underlying patients, including the
+        Mann-Whitney U test.
         
-        # Calculate statistics
-        p_trt_better = trt_wins / n_pairs
-        p_ctrl_better = ctrl_wins / n_pairs
-        p_tie = ties / n_pairs
+        Args:
+            treatment_counts: Patients per rank in the treatment arm
+            control_counts: Patients per rank in the control arm
+            
+        Returns:
+            Dictionary with comparison results and statistics
+        """
+        trt_counts = np.asarray(treatment_counts, dtype=np.int64)
+        ctrl_counts = np.asarray(control_counts, dtype=np.int64)
+        if trt_counts.shape != (self.n_categories,) or ctrl_counts.shape != (self.n_categories,):
+            raise ValueError(f"Histograms must have {self.n_categories} categories")
         
-        # Win ratio (treatment wins / control wins)
-        win_ratio = trt_wins / ctrl_wins if ctrl_wins > 0 else float('inf')
+        # Store results
+        self.results = self.compare_distribution_batch(trt_counts[None, :],
+                                                       ctrl_counts[None, :])[0]
+        return self.results
+    
+    def compare_distribution_batch(self, treatment_counts, control_counts) -> list:
+        """
+        Run many histogram comparisons in one vectorized pass.
+        
+        Row i of treatment_counts is compared with row i of control_counts,
+        e.g. one row per stratum, bootstrap replicate or service request.
+        Unlike compare_distributions(), self.results is left unchanged.
+        
+        Args:
+            treatment_counts: Array (n_comparisons, n_categories)
+            control_counts: Array (n_comparisons, n_categories)
+            
+        Returns:
+            List of result dictionaries, one per row
+        """
+        trt_counts = np.asarray(treatment_counts, dtype=np.int64)
+        ctrl_counts = np.asarray(control_counts, dtype=np.int64)
+        if (trt_counts.ndim != 2 or trt_counts.shape != ctrl_counts.shape
+                or trt_counts.shape[1] != self.n_categories):
+            raise ValueError(f"Histograms must have shape (n, {self.n_categories})")
+        if (trt_counts < 0).any() or (ctrl_counts < 0).any():
+            raise ValueError("Histogram counts must be non-negative")
+        
+        n_trt = trt_counts.sum(axis=1)
+        n_ctrl = ctrl_counts.sum(axis=1)
+        n_pairs = n_trt * n_ctrl
+        if (n_pairs == 0).any():
+            raise ValueError("Both arms need at least one patient")
         
-        # Net benefit (P(trt better) - P(ctrl better))
-        net_benefit = p_trt_better - p_ctrl_better
+        # Control patients strictly worse / strictly better than each rank
+        ctrl_cum = np.cumsum(ctrl_counts, axis=1)
+        ctrl_worse = n_ctrl[:, None] - ctrl_cum
+        ctrl_better = ctrl_cum - ctrl_counts
+        
+        trt_wins = np.einsum('bk,bk->b', trt_counts, ctrl_worse)
+        ctrl_wins = np.einsum('bk,bk->b', trt_counts, ctrl_better)
+        ties = np.einsum('bk,bk->b', trt_counts, ctrl_counts)
         
         # Mann-Whitney U test for statistical significance
-        u_stat, p_value = stats.mannwhitneyu(trt, ctrl, alternative='less')
+        u_stats, p_values = self._mann_whitney_less(trt_counts, ctrl_counts,
+                                                    ctrl_wins, ties)
         
-        # Store results
-        self.results = {
-            'n_treatment': n_trt,
-            'n_control': n_ctrl,
-            'n_pairs': n_pairs,
-            'treatment_wins': trt_wins,
-            'control_wins': ctrl_wins,
-            'ties': ties,
-            'p_treatment_better': p_trt_better,
-            'p_control_better': p_ctrl_better,
-            'p_tie': p_tie,
+        results = []
+        for i in range(len(n_pairs)):
+            pairs = int(n_pairs[i])
+            wins, losses, tied = int(trt_wins[i]), int(ctrl_wins[i]), int(ties[i])
+            
+            # Calculate statistics
+            p_trt_better = wins / pairs
+            p_ctrl_better = losses / pairs
+            
+            results.append({
+                'n_treatment': int(n_trt[i]),
+                'n_control': int(n_ctrl[i]),
+                'n_pairs': pairs,
+                'treatment_wins': wins,
+                'control_wins': losses,
+                'ties': tied,
+                'p_treatment_better': p_trt_better,
+                'p_control_better': p_ctrl_better,
+                'p_tie': tied / pairs,
+                # Win ratio (treatment wins / control wins)
+                'win_ratio': wins / losses if losses > 0 else float('inf'),
+                # Net benefit (P(trt better) - P(ctrl better))
+                'net_benefit': p_trt_better - p_ctrl_better,
+                'mann_whitney_u': float(u_stats[i]),
+                'p_value': float(p_values[i])
+            })
+        
+        return results
+    
+    def _mann_whitney_less(self, trt_counts: np.ndarray, ctrl_counts: np.ndarray,
+                           ctrl_wins: np.ndarray, ties: np.ndarray):
+        """
+        One-sided Mann-Whitney U test (treatment ranks lower) from histograms.
+        
+        Reproduces scipy.stats.mannwhitneyu(trt, ctrl, alternative='less')
+        row by row: the tie-corrected normal approximation with continuity
+        correction, or scipy's exact test for small samples without ties.
+        """
+        n_trt = trt_counts.sum(axis=1)
+        n_ctrl = ctrl_counts.sum(axis=1)
+        pooled = trt_counts + ctrl_counts
+        
+        # U1 counts pairs where the treatment rank is higher (worse)
+        u1 = ctrl_wins + 0.5 * ties
+        u2 = n_trt * n_ctrl - u1
+        n = n_trt + n_ctrl
+        tie_term = np.sum(pooled.astype(float) ** 3 - pooled, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sigma = np.sqrt(n_trt * n_ctrl / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+            z = (u2 - n_trt * n_ctrl / 2 - 0.5) / sigma
+        p_values = np.clip(stats.norm.sf(z), 0.0, 1.0)
+        
+        exact = ((n_trt <= 8) | (n_ctrl <= 8)) & ~(pooled > 1).any(axis=1)
+        ranks = np.arange(1, self.n_categories + 1)
+        for i in np.flatnonzero(exact):
+            u1[i], p_values[i] = stats.mannwhitneyu(np.repeat(ranks, trt_counts[i]),
+                                                    np.repeat(ranks, ctrl_counts[i]),
+                                                    alternative='less')
+        return u1, p_values
+
+    def compare_distributions_bayesian(self, treatment_counts, control_counts,
+                                       prior=1.0,
+                                       n_draws: int = 1_000_000,
+                                       credible_level: float = 0.95,
+                                       seed=None,
+                                       batch_size: int = 1 << 17,
+                                       return_draws: bool = False) -> dict:
+        """
+        Bayesian DOOR comparison with Dirichlet posteriors on each arm.
+
+        Each arm's category probabilities get a Dirichlet(prior) prior, so
+        the posterior is Dirichlet(prior + counts). For every posterior
+        draw (p, q) the pairwise probabilities follow from the cumulative
+        control probabilities Q = cumsum(q), without simulating patients:
+
+            P(treatment better) = sum_k p_k (1 - Q_k)
+            P(control better)   = sum_k p_k (Q_k - q_k)
+            P(tie)              = sum_k p_k q_k
+
+        Suited to small trials where a posterior for the win ratio is more
+        useful than a p-value.
+
+        Args:
+            treatment_counts: Patients per rank in the treatment arm
+            control_counts: Patients per rank in the control arm
+            prior: Dirichlet concentration; a scalar (1 = uniform, 0.5 =
+                   Jeffreys) or one value per category
+            n_draws: Posterior draws
+            credible_level: Mass of the equal-tailed credible intervals
+            seed: Seed or numpy Generator for reproducible draws
+            batch_size: Draws generated per vectorized batch
+            return_draws: Also return the per-draw metric arrays
+
+        Returns:
+            Dictionary with posterior mean, median and credible interval
+            of the win ratio, net benefit and DOOR probability
+            (P(treatment better) + P(tie) / 2), and P(win ratio > 1)
+        """
+        trt_counts = np.asarray(treatment_counts, dtype=float)
+        ctrl_counts = np.asarray(control_counts, dtype=float)
+        if trt_counts.shape != (self.n_categories,) or ctrl_counts.shape != (self.n_categories,):
+            raise ValueError(f"Histograms must have {self.n_categories} categories")
+        if (trt_counts < 0).any() or (ctrl_counts < 0).any():
+            raise ValueError("Histogram counts must be non-negative")
+
+        prior = np.broadcast_to(np.asarray(prior, dtype=float), (self.n_categories,))
+        if (prior <= 0).any():
+            raise ValueError("Dirichlet prior concentrations must be positive")
+        if not 0 < credible_level < 1:
+            raise ValueError("credible_level must lie between 0 and 1")
+        if n_draws < 1:
+            raise ValueError("n_draws must be at least 1")
+
+        rng = np.random.default_rng(seed)
+        alpha_trt = prior + trt_counts
+        alpha_ctrl = prior + ctrl_counts
+
+        trt_better = np.empty(n_draws)
+        ctrl_better = np.empty(n_draws)
+        tie = np.empty(n_draws)
+        for start in range(0, n_draws, batch_size):
+            stop = min(start + batch_size, n_draws)
+            # Dirichlet draws as normalised gamma variates, one row per draw
+            p = rng.standard_gamma(alpha_trt, size=(stop - start, self.n_categories))
+            p /= p.sum(axis=1, keepdims=True)
+            q = rng.standard_gamma(alpha_ctrl, size=(stop - start, self.n_categories))
+            q /= q.sum(axis=1, keepdims=True)
+
+            q_cum = np.cumsum(q, axis=1)
+            trt_better[start:stop] = np.einsum('dk,dk->d', p, 1 - q_cum)
+            ctrl_better[start:stop] = np.einsum('dk,dk->d', p, q_cum - q)
+            tie[start:stop] = np.einsum('dk,dk->d', p, q)
+
+        with np.errstate(divide='ignore'):
+            win_ratio = trt_better / ctrl_better
+        metrics = {
             'win_ratio': win_ratio,
-            'net_benefit': net_benefit,
-            'mann_whitney_u': u_stat,
-            'p_value': p_value
+            'net_benefit': trt_better - ctrl_better,
+            'door_probability': trt_better + 0.5 * tie,
         }
-        
-        return self.results
-    
+
+        tail = (1 - credible_level) / 2
+        summary = {}
+        for name, values in metrics.items():
+            lower, median, upper = np.quantile(values, [tail, 0.5, 1 - tail])
+            summary[name] = {
+                'mean': float(values.mean()),
+                'median': float(median),
+                'lower': float(lower),
+                'upper': float(upper),
+            }
+
+        self.bayesian_results = {
+            'n_treatment': int(trt_counts.sum()),
+            'n_control': int(ctrl_counts.sum()),
+            'n_draws': n_draws,
+            'prior': prior.tolist(),
+            'credible_level': credible_level,
+            **summary,
+            'p_win_ratio_gt_1': float((win_ratio > 1).mean()),
+            'p_treatment_better': float(trt_better.mean()),
+            'p_control_better': float(ctrl_better.mean()),
+            'p_tie': float(tie.mean()),
+        }
+        if return_draws:
+            self.bayesian_results['draws'] = metrics
+        return self.bayesian_results
+
+    def compare_treatments_bayesian(self, data: pd.DataFrame,
+                                    treatment_column: str,
+                                    treatment_arm: str,
+                                    control_arm: str,
+                                    **kwargs) -> dict:
+        """
+        Bayesian DOOR comparison of two arms of patient-level data.
+
+        Builds the rank histograms and calls
+        compare_distributions_bayesian(); keyword arguments are passed on.
+        """
+        trt = data[data[treatment_column] == treatment_arm]['door_rank'].values
+        ctrl = data[data[treatment_column] == control_arm]['door_rank'].values
+        return self.compare_distributions_bayesian(self.rank_histogram(trt),
+                                                   self.rank_histogram(ctrl), **kwargs)
+
     def get_outcome_distribution(self, data: pd.DataFrame,
                                  treatment_column: str) -> pd.DataFrame:
         """
@@ -169,7 +402,7 @@ class DOORAnalysis:
             DataFrame with counts and percentages per category per group
         """
         # Calculate distribution
-        dist = data.groupby([treatment_column, 'door_category']).size()
+        dist = data.groupby([treatment_column, 'door_category'], observed=True).size()
         dist = dist.unstack(fill_value=0)
         
         # Reorder columns by hierarchy
@@ -193,7 +426,7 @@ class DOORAnalysis:
         Create stacked bar chart of outcome distributions.
         """
         # Get distribution
-        dist = data.groupby([treatment_column, 'door_category']).size()
+        dist = data.groupby([treatment_column, 'door_category'], observed=True).size()
         dist = dist.unstack(fill_value=0)
         dist = dist[[c for c in self.outcome_hierarchy if c in dist.columns]]
         
@@ -221,15 +454,18 @@ class DOORAnalysis:
         plt.tight_layout()
         return fig
     
-    def generate_report(self) -> str:
+    def generate_report(self, results: dict = None) -> str:
         """
         Generate text report of DOOR analysis results.
+        
+        Args:
+            results: Results dictionary to report; defaults to the last
+                     compare_treatments()/compare_distributions() call
         """
-        if self.results is None:
+        r = results if results is not None else self.results
+        if r is None:
             return "No analysis results available. Run compare_treatments() first."
         
-        r = self.results
-        
         report = f"""
 ╔══════════════════════════════════════════════════════════════════════╗
 ║                    DOOR ANALYSIS RESULTS                              ║
@@ -343,10 +579,18 @@ def create_example_data():
     return data, outcomes
 
 
-def main():
+def main(output_dir: str = '.', results_format: str = 'parquet'):
     """
     Demonstrate DOOR analysis with example data.
+    
+    Args:
+        output_dir: Directory for the plot and results files
+        results_format: 'parquet' or 'csv'
     """
+    from door_io import write_results
+    
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
     print("=" * 70)
     print("DOOR ANALYSIS DEMONSTRATION")
     print("NexVigilant Benefit-Risk Intelligence Toolkit")
@@ -396,15 +640,15 @@ def main():
         treatment_column='treatment',
         title='DOOR Outcome Distribution: Drug A vs Placebo'
     )
-    fig.savefig('door_analysis_plot.png', 
+    plot_path = output_dir / 'door_analysis_plot.png'
+    fig.savefig(plot_path, 
                 dpi=150, bbox_inches='tight')
-    print("Visualization saved to: door_analysis_plot.png")
+    print(f"Visualization saved to: {plot_path}")
     print()
     
-    # Export results to CSV
-    results_df = pd.DataFrame([results])
-    results_df.to_csv('door_results.csv', index=False)
-    print("Results exported to: door_results.csv")
+    # Export results
+    results_path = write_results(results, output_dir / f'door_results.{results_format}')
+    print(f"Results exported to: {results_path}")
     
     return door, data, results
 
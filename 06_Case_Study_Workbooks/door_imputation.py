@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+Multiple Imputation for Missing DOOR Outcomes
+NexVigilant Benefit-Risk Intelligence Toolkit
+
+Patients with an unknown final outcome are imputed M times, each
+completed dataset is analysed with the histogram DOOR engine, and the
+log win ratio and net benefit are pooled with Rubin's rules.
+
+Imputation methods:
+
+    - 'ordinal'     Proportional-odds (cumulative logit) model on arm and
+                    covariates, fitted to the observed patients. Each
+                    imputation draws the model parameters from their
+                    approximate posterior N(estimate, inverse information)
+                    before drawing categories, so imputations are proper.
+    - 'arm'         Arm-specific category probabilities drawn from a
+                    Dirichlet posterior; no covariates
+    - 'worst_case'  Missing treatment patients get the worst category and
+                    missing control patients the best
+    - 'best_case'   The reverse of 'worst_case'
+
+Imputations only change the counts of missing patients, so each one is
+analysed as observed histogram + imputed histogram. Chunks of
+imputations are drawn and analysed in a process pool.
+
+Author: NexVigilant Capability Engineering
+Version: 1.0
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy import optimize, stats
+from scipy.special import expit
+
+from door_analysis import DOORAnalysis
+from door_meta_analysis import log_win_ratio, win_loss_statistics
+
+
+METHODS = ('ordinal', 'arm', 'worst_case', 'best_case')
+
+# Imputations per process-pool task
+CHUNK_IMPUTATIONS = 10
+
+
+# =============================================================================
+# Proportional-odds model
+# =============================================================================
+
+class OrdinalLogitModel:
+    """
+    Cumulative logit model P(rank <= k | x) = expit(theta_k - x @ beta).
+
+    Cut-points are parameterised as theta_1 and log increments so they
+    stay ordered during optimisation.
+    """
+
+    def __init__(self, n_categories: int):
+        self.n_categories = n_categories
+        self.params: Optional[np.ndarray] = None
+        self.covariance: Optional[np.ndarray] = None
+
+    def _split(self, params: np.ndarray):
+        n_cuts = self.n_categories - 1
+        raw, beta = params[..., :n_cuts], params[..., n_cuts:]
+        increments = np.exp(raw[..., 1:])
+        theta = np.concatenate([raw[..., :1], raw[..., :1] + np.cumsum(increments, axis=-1)],
+                               axis=-1)
+        return theta, beta, increments
+
+    def _negative_log_likelihood(self, params, X, y):
+        theta, beta, increments = self._split(params)
+        eta = theta[None, :] - (X @ beta)[:, None]
+        F = np.hstack([np.zeros((len(y), 1)), expit(eta), np.ones((len(y), 1))])
+        prob = np.maximum(F[np.arange(len(y)), y + 1] - F[np.arange(len(y)), y], 1e-300)
+
+        # Gradient with respect to eta at the upper and lower cut of each patient
+        f = np.hstack([np.zeros((len(y), 1)), F[:, 1:-1] * (1 - F[:, 1:-1]), np.zeros((len(y), 1))])
+        d_upper = f[np.arange(len(y)), y + 1] / prob
+        d_lower = -f[np.arange(len(y)), y] / prob
+
+        n_cuts = self.n_categories - 1
+        d_eta = np.zeros((len(y), n_cuts + 2))
+        np.add.at(d_eta, (np.arange(len(y)), y + 1), d_upper)
+        np.add.at(d_eta, (np.arange(len(y)), y), d_lower)
+        d_theta = d_eta[:, 1:-1].sum(axis=0)
+        d_beta = -X.T @ d_eta[:, 1:-1].sum(axis=1)
+
+        # Chain rule through theta_1 + cumulative exp increments
+        d_raw = np.empty(n_cuts)
+        d_raw[0] = d_theta.sum()
+        d_raw[1:] = increments * np.cumsum(d_theta[::-1])[::-1][1:]
+        return -np.log(prob).sum(), -np.concatenate([d_raw, d_beta])
+
+    def fit(self, X: np.ndarray, ranks: np.ndarray) -> 'OrdinalLogitModel':
+        """
+        Maximum-likelihood fit.
+
+        Args:
+            X: Covariate matrix (n_patients, n_covariates), no intercept
+            ranks: Observed DOOR ranks (1-based)
+
+        Returns:
+            self, with params and their covariance (inverse observed
+            information, from finite differences of the analytic gradient)
+        """
+        y = np.asarray(ranks, dtype=np.int64) - 1
+        X = np.asarray(X, dtype=float)
+        counts = np.bincount(y, minlength=self.n_categories)
+        cum = np.cumsum(counts)[:-1] / len(y)
+        logits = np.log(np.clip(cum, 1e-3, 1 - 1e-3) / (1 - np.clip(cum, 1e-3, 1 - 1e-3)))
+        start = np.concatenate([logits[:1], np.log(np.maximum(np.diff(logits), 1e-2)),
+                                np.zeros(X.shape[1])])
+
+        fit = optimize.minimize(self._negative_log_likelihood, start, args=(X, y),
+                                jac=True, method='L-BFGS-B')
+        self.params = fit.x
+
+        # Observed information by central differences of the gradient
+        n_params = len(self.params)
+        hessian = np.empty((n_params, n_params))
+        step = 1e-5 * np.maximum(1.0, np.abs(self.params))
+        for j in range(n_params):
+            delta = np.zeros(n_params)
+            delta[j] = step[j]
+            upper = self._negative_log_likelihood(self.params + delta, X, y)[1]
+            lower = self._negative_log_likelihood(self.params - delta, X, y)[1]
+            hessian[:, j] = (upper - lower) / (2 * step[j])
+        hessian = (hessian + hessian.T) / 2
+        self.covariance = np.linalg.pinv(hessian + 1e-8 * np.eye(n_params))
+        return self
+
+    def sample_parameters(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        """Draw n parameter vectors from N(params, covariance)."""
+        return rng.multivariate_normal(self.params, self.covariance, size=n, method='eigh')
+
+    def cumulative_probabilities(self, X: np.ndarray, params: np.ndarray) -> np.ndarray:
+        """P(rank <= k) for k = 1..K-1, shape (n_patients, K - 1)."""
+        theta, beta, _ = self._split(params)
+        return expit(theta[None, :] - (X @ beta)[:, None])
+
+
+# =============================================================================
+# Imputation workers
+# =============================================================================
+
+def _analyse(trt_hist: np.ndarray, ctrl_hist: np.ndarray) -> np.ndarray:
+    """
+    Per-imputation estimates and variances, shape (m, 4):
+    log win ratio, its variance, net benefit, its variance.
+
+    The log win ratio of an imputation with no wins or no losses gets
+    log_win_ratio()'s continuity correction, so Rubin pooling stays finite.
+    """
+    wins, losses, var_w, var_l, cov_wl = win_loss_statistics(trt_hist, ctrl_hist)
+    log_wr, var_log_wr = log_win_ratio(trt_hist, ctrl_hist)
+    return np.column_stack([log_wr, var_log_wr, wins - losses, var_w + var_l - 2 * cov_wl])
+
+
+def _impute_chunk(task) -> np.ndarray:
+    """
+    Draw and analyse one chunk of imputations (runs in a worker process).
+
+    Returns:
+        Array (m, 4 + 2 * n_categories): analysis columns from _analyse()
+        followed by the completed treatment and control histograms
+    """
+    (method, seed, n_imputations, n_categories, observed, missing_arms,
+     X_missing, model, param_draws, arm_probs) = task
+    rng = np.random.default_rng(seed)
+    n_arms = observed.shape[0]
+    histograms = np.repeat(observed[None, :, :], n_imputations, axis=0).astype(float)
+
+    for m in range(n_imputations):
+        if method == 'ordinal':
+            cum = model.cumulative_probabilities(X_missing, param_draws[m])
+            u = rng.random(len(X_missing))
+            imputed = (u[:, None] > cum).sum(axis=1)
+            np.add.at(histograms[m], (missing_arms, imputed), 1)
+        else:  # 'arm': multinomial counts per arm from Dirichlet-drawn probabilities
+            n_missing = np.bincount(missing_arms, minlength=n_arms)
+            for a in range(n_arms):
+                if n_missing[a]:
+                    probs = rng.dirichlet(arm_probs[a])
+                    histograms[m, a] += rng.multinomial(n_missing[a], probs)
+
+    trt, ctrl = histograms[:, 0], histograms[:, 1]
+    return np.hstack([_analyse(trt, ctrl), trt, ctrl])
+
+
+# =============================================================================
+# Rubin's rules
+# =============================================================================
+
+def rubin_pool(estimates, variances, confidence: float = 0.95) -> Dict[str, float]:
+    """
+    Pool M estimates with Rubin's rules.
+
+    Args:
+        estimates: Per-imputation point estimates
+        variances: Per-imputation (within-imputation) variances
+        confidence: Confidence level
+
+    Returns:
+        Dictionary with estimate, within/between/total variance, degrees
+        of freedom, fraction of missing information, CI and p-value
+    """
+    q = np.asarray(estimates, dtype=float)
+    u = np.asarray(variances, dtype=float)
+    m = len(q)
+    q_bar, u_bar = q.mean(), u.mean()
+    b = q.var(ddof=1) if m > 1 else 0.0
+    t = u_bar + (1 + 1 / m) * b
+
+    if b > 0:
+        r = (1 + 1 / m) * b / u_bar
+        df = (m - 1) * (1 + 1 / r) ** 2
+        crit = stats.t.ppf(0.5 + confidence / 2, df)
+        p_value = 2 * stats.t.sf(abs(q_bar) / np.sqrt(t), df)
+    else:
+        df = float('inf')
+        crit = stats.norm.ppf(0.5 + confidence / 2)
+        p_value = 2 * stats.norm.sf(abs(q_bar) / np.sqrt(t))
+
+    return {
+        'estimate': float(q_bar),
+        'within_variance': float(u_bar),
+        'between_variance': float(b),
+        'total_variance': float(t),
+        'se': float(np.sqrt(t)),
+        'df': float(df),
+        'fraction_missing_info': float((1 + 1 / m) * b / t) if t > 0 else 0.0,
+        'lower': float(q_bar - crit * np.sqrt(t)),
+        'upper': float(q_bar + crit * np.sqrt(t)),
+        'p_value': float(p_value),
+    }
+
+
+# =============================================================================
+# Driver
+# =============================================================================
+
+def _design_matrix(data: pd.DataFrame, arm_codes: np.ndarray, n_arms: int,
+                   covariates: Sequence[str]) -> np.ndarray:
+    """Arm dummies (first arm is the reference) plus covariates."""
+    arms = np.eye(n_arms)[arm_codes][:, 1:]
+    if not covariates:
+        return arms
+    covs = pd.get_dummies(data[list(covariates)], drop_first=True, dtype=float)
+    if covs.isna().any().any():
+        raise ValueError("Covariates used for imputation must not be missing")
+    values = covs.to_numpy(dtype=float)
+    scale = values.std(axis=0)
+    values = (values - values.mean(axis=0)) / np.where(scale > 0, scale, 1.0)
+    return np.hstack([arms, values])
+
+
+def impute_door(door: DOORAnalysis,
+                data: pd.DataFrame,
+                outcome_column: str,
+                treatment_column: str,
+                treatment_arm,
+                control_arm,
+                method: str = 'ordinal',
+                covariates: Optional[Sequence[str]] = None,
+                n_imputations: int = 20,
+                seed: Optional[int] = None,
+                n_jobs: Optional[int] = None,
+                confidence: float = 0.95) -> dict:
+    """
+    Multiple-imputation DOOR comparison of two arms.
+
+    Args:
+        door: DOORAnalysis defining the hierarchy
+        data: Patient data; missing outcomes are NaN/None
+        outcome_column: Outcome category column
+        treatment_column: Arm column
+        treatment_arm: Treatment arm label
+        control_arm: Control arm label
+        method: One of 'ordinal', 'arm', 'worst_case', 'best_case'
+        covariates: Covariate columns for the 'ordinal' model
+        n_imputations: Number of imputations M (1 for worst/best case)
+        seed: Root seed; chunk i uses the i-th spawned SeedSequence
+        n_jobs: Worker processes (default: CPU count; 1 runs inline)
+        confidence: Confidence level of the pooled intervals
+
+    Returns:
+        Dictionary with Rubin-pooled 'log_win_ratio' and 'net_benefit'
+        (and 'win_ratio' on the original scale), missing-data counts and
+        a per-imputation DataFrame
+    """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}")
+    if n_imputations < 1:
+        raise ValueError("n_imputations must be at least 1")
+
+    data = data[data[treatment_column].isin([treatment_arm, control_arm])]
+    assigned = door.assign_outcomes(data, outcome_column, allow_missing=True)
+    arm_codes = np.where(assigned[treatment_column] == treatment_arm, 0, 1)
+    missing = assigned['door_rank'].isna().to_numpy()
+    ranks = assigned['door_rank'].to_numpy(dtype=float, na_value=np.nan)
+
+    K = door.n_categories
+    observed = np.zeros((2, K))
+    np.add.at(observed, (arm_codes[~missing], ranks[~missing].astype(int) - 1), 1)
+    if (observed.sum(axis=1) == 0).any():
+        raise ValueError("Each arm needs at least one observed outcome")
+    missing_arms = arm_codes[missing]
+
+    model = param_draws = arm_probs = X_missing = None
+    if method in ('worst_case', 'best_case'):
+        # Deterministic: a single imputation, no between-imputation variance
+        n_imputations = 1
+        n_missing = np.bincount(missing_arms, minlength=2)
+        trt_cat, ctrl_cat = (K - 1, 0) if method == 'worst_case' else (0, K - 1)
+        completed = observed.copy()
+        completed[0, trt_cat] += n_missing[0]
+        completed[1, ctrl_cat] += n_missing[1]
+        rows = np.hstack([_analyse(completed[None, 0], completed[None, 1]),
+                          completed[None, 0], completed[None, 1]])
+    else:
+        root = np.random.SeedSequence(seed)
+        rng = np.random.default_rng(root.spawn(1)[0])
+        if method == 'ordinal':
+            X = _design_matrix(assigned, arm_codes, 2, covariates or [])
+            model = OrdinalLogitModel(K).fit(X[~missing], ranks[~missing])
+            param_draws = model.sample_parameters(rng, n_imputations)
+            X_missing = X[missing]
+        else:
+            arm_probs = observed + 1.0  # Dirichlet(1 + observed counts) per arm
+
+        chunks = range(0, n_imputations, CHUNK_IMPUTATIONS)
+        seeds = root.spawn(len(chunks))
+        tasks = [(method, seeds[i], min(CHUNK_IMPUTATIONS, n_imputations - start), K, observed,
+                  missing_arms, X_missing, model,
+                  None if param_draws is None else param_draws[start:start + CHUNK_IMPUTATIONS],
+                  arm_probs)
+                 for i, start in enumerate(chunks)]
+
+        n_jobs = n_jobs or os.cpu_count() or 1
+        if n_jobs == 1 or len(tasks) == 1:
+            rows = np.vstack([_impute_chunk(task) for task in tasks])
+        else:
+            with ProcessPoolExecutor(max_workers=min(n_jobs, len(tasks))) as pool:
+                rows = np.vstack(list(pool.map(_impute_chunk, tasks)))
+
+    per_imputation = pd.DataFrame(rows[:, :4], columns=['log_win_ratio', 'var_log_win_ratio',
+                                                        'net_benefit', 'var_net_benefit'])
+    per_imputation.index.name = 'imputation'
+    per_imputation['win_ratio'] = np.exp(per_imputation['log_win_ratio'])
+
+    log_wr = rubin_pool(per_imputation['log_win_ratio'], per_imputation['var_log_win_ratio'],
+                        confidence)
+    net_benefit = rubin_pool(per_imputation['net_benefit'], per_imputation['var_net_benefit'],
+                             confidence)
+
+    return {
+        'method': method,
+        'n_imputations': n_imputations,
+        'n_treatment': int((arm_codes == 0).sum()),
+        'n_control': int((arm_codes == 1).sum()),
+        'n_missing_treatment': int((missing_arms == 0).sum()),
+        'n_missing_control': int((missing_arms == 1).sum()),
+        'log_win_ratio': log_wr,
+        'win_ratio': {
+            'estimate': float(np.exp(log_wr['estimate'])),
+            'lower': float(np.exp(log_wr['lower'])),
+            'upper': float(np.exp(log_wr['upper'])),
+            'p_value': log_wr['p_value'],
+        },
+        'net_benefit': net_benefit,
+        'per_imputation': per_imputation,
+    }
+
+
+def create_example_data(n_patients: int = 2000, missing_rate: float = 0.12,
+                        seed: int = 42) -> tuple:
+    """
+    Example CV trial with covariate-dependent missing outcomes.
+
+    Older and frailer patients are both more likely to have a poor
+    outcome and more likely to be lost to follow-up (missing at random
+    given the covariates).
+
+    Returns:
+        Tuple of (DataFrame, outcome hierarchy)
+    """
+    from door_analysis import create_example_data as door_example
+
+    _, hierarchy = door_example()
+    rng = np.random.default_rng(seed)
+    treatment = np.where(rng.random(n_patients) < 0.5, 'Drug A', 'Placebo')
+    age = rng.normal(65, 10, n_patients)
+    frailty = rng.normal(0, 1, n_patients)
+
+    latent = (0.03 * (age - 65) + 0.5 * frailty - 0.35 * (treatment == 'Drug A')
+              + rng.logistic(size=n_patients))
+    cuts = np.array([-0.4, 0.1, 0.5, 0.9, 1.3, 1.8, 2.5])
+    ranks = (latent[:, None] > cuts).sum(axis=1)
+    outcome = np.array(hierarchy, dtype=object)[ranks]
+
+    p_missing = expit(np.log(missing_rate / (1 - missing_rate)) + 0.04 * (age - 65) + 0.4 * frailty)
+    outcome[rng.random(n_patients) < p_missing] = None
+
+    data = pd.DataFrame({'patient_id': np.arange(n_patients), 'treatment': treatment,
+                         'age': age, 'frailty': frailty, 'outcome': outcome})
+    return data, hierarchy
+
+
+def main():
+    """
+    Compare complete-case, multiple-imputation and worst/best-case DOOR.
+    """
+    print("=" * 70)
+    print("MULTIPLE-IMPUTATION DOOR DEMONSTRATION")
+    print("NexVigilant Benefit-Risk Intelligence Toolkit")
+    print("=" * 70)
+    print()
+
+    data, hierarchy = create_example_data()
+    door = DOORAnalysis(outcome_hierarchy=hierarchy)
+    print(f"Patients: {len(data):,}, missing outcomes: {data['outcome'].isna().mean():.1%}")
+    print()
+
+    complete = door.assign_outcomes(data.dropna(subset=['outcome']), 'outcome')
+    cc = door.compare_treatments(complete, 'treatment', 'Drug A', 'Placebo')
+    print(f"{'Complete case':<28} WR {cc['win_ratio']:.3f}")
+
+    for method, kwargs in [('ordinal', {'covariates': ['age', 'frailty']}),
+                           ('arm', {}), ('worst_case', {}), ('best_case', {})]:
+        result = impute_door(door, data, 'outcome', 'treatment', 'Drug A', 'Placebo',
+                             method=method, n_imputations=50, seed=1, **kwargs)
+        wr = result['win_ratio']
+        print(f"{method:<28} WR {wr['estimate']:.3f} "
+              f"({wr['lower']:.3f}-{wr['upper']:.3f}), "
+              f"FMI {result['log_win_ratio']['fraction_missing_info']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Columnar and Memory-Mapped I/O for Patient-Level DOOR Data
+NexVigilant Benefit-Risk Intelligence Toolkit
+
+Multi-GB cohorts should not be re-parsed from CSV text for every
+re-analysis. This module provides:
+
+    - read_patient_data()    Load only the needed columns (arm, outcome,
+                             strata, weight) from Parquet, Arrow/Feather
+                             or CSV, with categorical dtypes
+    - parquet_histograms()   Stream a Parquet file in record batches
+                             straight into DOOR rank histograms
+    - write_rank_store() /   Persist DOOR ranks as int8 .npy arrays and
+      open_rank_store()      memory-map them for later re-analysis
+    - write_results()        Write results dictionaries or tables as
+                             Parquet (or CSV by file extension)
+
+Histograms are indexed by stratum and arm and feed directly into
+DOORAnalysis.compare_distributions().
+
+Author: NexVigilant Capability Engineering
+Version: 1.0
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from door_analysis import DOORAnalysis
+
+
+PathLike = Union[str, Path]
+
+# Rows per record batch / memmap chunk when building histograms
+BATCH_ROWS = 1 << 20
+
+OVERALL = 'Overall'
+
+
+def _columns(*groups) -> List[str]:
+    """Flatten column arguments, dropping None and duplicates."""
+    seen = []
+    for group in groups:
+        if group is None:
+            continue
+        for column in ([group] if isinstance(group, str) else group):
+            if column not in seen:
+                seen.append(column)
+    return seen
+
+
+def read_patient_data(path: PathLike,
+                      arm_column: str,
+                      outcome_column: str,
+                      strata_columns: Optional[Sequence[str]] = None,
+                      weight_column: Optional[str] = None) -> pd.DataFrame:
+    """
+    Load only the columns a DOOR analysis needs.
+
+    Parquet and Arrow/Feather files are read column-selectively (Arrow
+    IPC files are memory-mapped); CSV files fall back to usecols. Arm,
+    outcome and strata columns are returned as categoricals.
+
+    Args:
+        path: .parquet, .arrow/.feather/.ipc or .csv file
+        arm_column: Treatment arm column
+        outcome_column: DOOR outcome category (or door_rank) column
+        strata_columns: Optional stratification columns
+        weight_column: Optional patient weight column
+
+    Returns:
+        DataFrame with just the requested columns
+    """
+    path = Path(path)
+    columns = _columns(arm_column, outcome_column, strata_columns, weight_column)
+    suffix = path.suffix.lower()
+
+    if suffix == '.parquet':
+        data = pd.read_parquet(path, columns=columns)
+    elif suffix in ('.arrow', '.feather', '.ipc'):
+        from pyarrow import feather
+        data = feather.read_table(path, columns=columns, memory_map=True).to_pandas()
+    elif suffix == '.csv':
+        data = pd.read_csv(path, usecols=columns)
+    else:
+        raise ValueError(f"Unsupported file type: {path.suffix}")
+
+    for column in _columns(arm_column, outcome_column, strata_columns):
+        if column != weight_column and not pd.api.types.is_numeric_dtype(data[column]):
+            data[column] = data[column].astype('category')
+
+    return data[columns]
+
+
+class _HistogramAccumulator:
+    """
+    Accumulates (stratum, arm, rank) counts across batches.
+
+    Arm and stratum labels are assigned codes as they are first seen,
+    so batches can be processed independently with np.bincount.
+    """
+
+    def __init__(self, n_categories: int):
+        self.n_categories = n_categories
+        self.arms: Dict[object, int] = {}
+        self.strata: Dict[object, int] = {}
+        self.counts = np.zeros((0, 0, n_categories), dtype=np.float64)
+
+    @staticmethod
+    def _encode(codes: np.ndarray, uniques, labels: Dict[object, int]) -> np.ndarray:
+        """Map batch-local factor codes onto the accumulator's global codes."""
+        if (codes < 0).any():
+            raise ValueError("Arm and strata columns must not contain missing values")
+        mapping = np.array([labels.setdefault(u, len(labels)) for u in uniques], dtype=np.int64)
+        return mapping[codes] if len(mapping) else codes.astype(np.int64)
+
+    def add(self, arms, ranks: np.ndarray, strata=None, weights: Optional[np.ndarray] = None):
+        """
+        Add one batch.
+
+        Args:
+            arms: Arm label per patient
+            ranks: DOOR rank per patient
+            strata: Optional (codes, labels) from _factorize_strata()
+            weights: Optional weight per patient
+        """
+        arm_codes = self._encode(*pd.factorize(arms), self.arms)
+        if strata is None:
+            stratum_codes = np.full(len(arm_codes), self.strata.setdefault(OVERALL, 0))
+        else:
+            stratum_codes = self._encode(*strata, self.strata)
+
+        # Grow the count cube when new labels appear
+        n_s, n_a = len(self.strata), len(self.arms)
+        if self.counts.shape[:2] != (n_s, n_a):
+            grown = np.zeros((n_s, n_a, self.n_categories))
+            s, a = self.counts.shape[:2]
+            grown[:s, :a] = self.counts
+            self.counts = grown
+
+        ranks = np.asarray(ranks, dtype=np.int64)
+        if ranks.size and (ranks.min() < 1 or ranks.max() > self.n_categories):
+            raise ValueError(f"DOOR ranks must lie between 1 and {self.n_categories}")
+
+        flat = (stratum_codes * n_a + arm_codes) * self.n_categories + ranks - 1
+        self.counts += np.bincount(flat, weights=weights,
+                                   minlength=self.counts.size).reshape(self.counts.shape)
+
+    def to_frame(self, weighted: bool) -> pd.DataFrame:
+        strata = sorted(self.strata, key=self.strata.get)
+        arms = sorted(self.arms, key=self.arms.get)
+        index = pd.MultiIndex.from_product([strata, arms], names=['stratum', 'arm'])
+        values = self.counts.reshape(-1, self.n_categories)
+        if not weighted:
+            values = values.astype(np.int64)
+        columns = pd.Index(np.arange(1, self.n_categories + 1), name='door_rank')
+        return pd.DataFrame(values, index=index, columns=columns)
+
+
+def _factorize_strata(batch: pd.DataFrame, strata_columns: Sequence[str]):
+    """
+    Factorize one or more strata columns into (codes, labels).
+
+    Multiple columns are combined on their codes, and labels such as
+    'EU | F' are only built for the distinct combinations.
+    """
+    if not strata_columns:
+        return None
+    if len(strata_columns) == 1:
+        codes, uniques = pd.factorize(batch[strata_columns[0]])
+        return codes, [str(u) for u in uniques]
+    factors = [pd.factorize(batch[c]) for c in strata_columns]
+    if any((codes < 0).any() for codes, _ in factors):
+        raise ValueError("Arm and strata columns must not contain missing values")
+    shape = tuple(max(len(uniques), 1) for _, uniques in factors)
+    combined = np.ravel_multi_index([codes for codes, _ in factors], shape)
+    present, codes = np.unique(combined, return_inverse=True)
+    labels = [' | '.join(str(uniques[i]) for (_, uniques), i in zip(factors, idx))
+              for idx in zip(*np.unravel_index(present, shape))]
+    return codes, labels
+
+
+def _batch_ranks(door: DOORAnalysis, batch: pd.DataFrame, outcome_column: str) -> np.ndarray:
+    """DOOR ranks for a batch holding either categories or numeric ranks."""
+    values = batch[outcome_column]
+    if pd.api.types.is_numeric_dtype(values):
+        return values.to_numpy(dtype=np.int64)
+    codes = pd.Categorical(values, categories=door.outcome_hierarchy).codes
+    if (codes < 0).any():
+        unknown = set(values[codes < 0].unique())
+        raise ValueError(f"Unknown outcomes: {unknown}")
+    return codes.astype(np.int64) + 1
+
+
+def parquet_histograms(path: PathLike,
+                       door: DOORAnalysis,
+                       arm_column: str,
+                       outcome_column: str,
+                       strata_columns: Optional[Sequence[str]] = None,
+                       weight_column: Optional[str] = None,
+                       batch_rows: int = BATCH_ROWS) -> pd.DataFrame:
+    """
+    Stream a Parquet file into DOOR rank histograms.
+
+    Only the needed columns are decoded, one record batch at a time, so
+    memory is bounded by the batch size rather than the cohort size.
+
+    Args:
+        path: Parquet file
+        door: DOORAnalysis defining the outcome hierarchy
+        arm_column: Treatment arm column
+        outcome_column: Outcome category column, or numeric DOOR ranks
+        strata_columns: Optional stratification columns
+        weight_column: Optional weights; gives weighted (float) totals
+                       for descriptive use. compare_distributions()
+                       needs the unweighted counts.
+        batch_rows: Rows per record batch
+
+    Returns:
+        DataFrame indexed by (stratum, arm) with one column per DOOR rank
+    """
+    import pyarrow.parquet as pq
+
+    strata_columns = list(strata_columns or [])
+    columns = _columns(arm_column, outcome_column, strata_columns, weight_column)
+    accumulator = _HistogramAccumulator(door.n_categories)
+
+    parquet = pq.ParquetFile(path)
+    for record_batch in parquet.iter_batches(batch_size=batch_rows, columns=columns):
+        batch = record_batch.to_pandas()
+        weights = None if weight_column is None else batch[weight_column].to_numpy(dtype=float)
+        accumulator.add(batch[arm_column],
+                        _batch_ranks(door, batch, outcome_column),
+                        _factorize_strata(batch, strata_columns),
+                        weights)
+
+    return accumulator.to_frame(weighted=weight_column is not None)
+
+
+def compare_histograms(door: DOORAnalysis, histograms: pd.DataFrame,
+                       treatment_arm, control_arm) -> pd.DataFrame:
+    """
+    Run the DOOR comparison in every stratum of a histogram table.
+
+    Returns:
+        DataFrame indexed by stratum with one column per result metric
+    """
+    strata = histograms.index.get_level_values('stratum').unique()
+    trt = histograms.xs(treatment_arm, level='arm').reindex(strata)
+    ctrl = histograms.xs(control_arm, level='arm').reindex(strata)
+    rows = door.compare_distribution_batch(trt.to_numpy(), ctrl.to_numpy())
+    return pd.DataFrame(rows, index=pd.Index(strata, name='stratum'))
+
+
+# =============================================================================
+# Memory-mapped rank store
+# =============================================================================
+
+@dataclass
+class RankStore:
+    """
+    Memory-mapped DOOR ranks with integer-coded arms and strata.
+
+    Arrays are opened read-only with np.load(mmap_mode='r'); pages are
+    only read from disk as chunks are processed.
+    """
+    directory: Path
+    ranks: np.ndarray
+    arms: np.ndarray
+    strata: Optional[np.ndarray]
+    hierarchy: List[str]
+    arm_labels: List[str]
+    strata_labels: List[str]
+
+    def __len__(self):
+        return len(self.ranks)
+
+    def histograms(self, chunk_rows: int = BATCH_ROWS) -> pd.DataFrame:
+        """Rank histograms by (stratum, arm), accumulated chunk by chunk."""
+        n_cat, n_arms = len(self.hierarchy), len(self.arm_labels)
+        n_strata = len(self.strata_labels) if self.strata is not None else 1
+        size = n_strata * n_arms * n_cat
+        counts = np.zeros(size, dtype=np.int64)
+
+        for start in range(0, len(self.ranks), chunk_rows):
+            stop = start + chunk_rows
+            ranks = self.ranks[start:stop].astype(np.int64)
+            arms = self.arms[start:stop].astype(np.int64)
+            strata = 0 if self.strata is None else self.strata[start:stop].astype(np.int64)
+            flat = (strata * n_arms + arms) * n_cat + ranks - 1
+            counts += np.bincount(flat, minlength=size)
+
+        strata_labels = self.strata_labels if self.strata is not None else [OVERALL]
+        index = pd.MultiIndex.from_product([strata_labels, self.arm_labels],
+                                           names=['stratum', 'arm'])
+        columns = pd.Index(np.arange(1, n_cat + 1), name='door_rank')
+        return pd.DataFrame(counts.reshape(-1, n_cat), index=index, columns=columns)
+
+
+def _small_int_dtype(n_values: int):
+    return np.int8 if n_values <= np.iinfo(np.int8).max else np.int32
+
+
+def write_rank_store(directory: PathLike,
+                     data: pd.DataFrame,
+                     door: DOORAnalysis,
+                     arm_column: str,
+                     rank_column: str = 'door_rank',
+                     strata_columns: Optional[Sequence[str]] = None) -> Path:
+    """
+    Persist DOOR ranks, arm codes and stratum codes as .npy arrays.
+
+    Ranks are stored as int8 (hierarchies of up to 127 categories), so
+    a 100-million-patient cohort takes about 100 MB per array.
+
+    Args:
+        directory: Output directory (created if needed)
+        data: DataFrame with ranks assigned (DOORAnalysis.assign_outcomes)
+        door: DOORAnalysis defining the hierarchy
+        arm_column: Treatment arm column
+        rank_column: DOOR rank column
+        strata_columns: Optional stratification columns
+
+    Returns:
+        Path of the store directory
+    """
+    if door.n_categories > np.iinfo(np.int8).max:
+        raise ValueError("int8 rank stores support at most 127 outcome categories")
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    arm_codes, arm_labels = pd.factorize(data[arm_column], sort=True)
+    meta = {
+        'hierarchy': list(door.outcome_hierarchy),
+        'arm_labels': [str(a) for a in arm_labels],
+        'strata_labels': [],
+    }
+
+    arrays = {
+        'ranks': data[rank_column].to_numpy(dtype=np.int8),
+        'arms': arm_codes.astype(_small_int_dtype(len(arm_labels))),
+    }
+    if strata_columns:
+        strata_codes, strata_labels = _factorize_strata(data, list(strata_columns))
+        arrays['strata'] = strata_codes.astype(_small_int_dtype(len(strata_labels)))
+        meta['strata_labels'] = [str(s) for s in strata_labels]
+
+    for name, array in arrays.items():
+        out = np.lib.format.open_memmap(directory / f"{name}.npy", mode='w+',
+                                        dtype=array.dtype, shape=array.shape)
+        out[:] = array
+        out.flush()
+        del out
+
+    with open(directory / 'meta.json', 'w') as f:
+        json.dump(meta, f, indent=2)
+
+    return directory
+
+
+def open_rank_store(directory: PathLike) -> RankStore:
+    """Memory-map a rank store written by write_rank_store()."""
+    directory = Path(directory)
+    with open(directory / 'meta.json') as f:
+        meta = json.load(f)
+
+    strata_path = directory / 'strata.npy'
+    return RankStore(
+        directory=directory,
+        ranks=np.load(directory / 'ranks.npy', mmap_mode='r'),
+        arms=np.load(directory / 'arms.npy', mmap_mode='r'),
+        strata=np.load(strata_path, mmap_mode='r') if strata_path.exists() else None,
+        hierarchy=meta['hierarchy'],
+        arm_labels=meta['arm_labels'],
+        strata_labels=meta['strata_labels'],
+    )
+
+
+# =============================================================================
+# Result writers
+# =============================================================================
+
+def write_results(results: Union[dict, pd.DataFrame], path: PathLike) -> Path:
+    """
+    Write DOOR results as Parquet (or CSV, by file extension).
+
+    Args:
+        results: Results dictionary (one row) or DataFrame
+        path: Output path ending in .parquet or .csv
+
+    Returns:
+        The output path
+    """
+    path = Path(path)
+    table = pd.DataFrame([results]) if isinstance(results, dict) else results.copy()
+
+    # Parquet requires string column names
+    table.columns = [str(c) for c in table.columns]
+
+    if path.suffix.lower() == '.parquet':
+        table.to_parquet(path)
+    elif path.suffix.lower() == '.csv':
+        table.to_csv(path, index=not isinstance(results, dict))
+    else:
+        raise ValueError(f"Unsupported output type: {path.suffix}")
+    return path
@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""
+Effects Table Computation from Patient-Level Data
+NexVigilant Benefit-Risk Intelligence Toolkit
+
+Computes the CIOMS WG XII Effects Table (templates/Effects_Table_Template.md,
+04_Assessment_Templates/Effects_Table_Template.xlsx) directly from
+patient-level trial data instead of filling it in by hand.
+
+Every outcome is a column of one patient x outcome array. Group sums,
+counts and sums of squares for all arms, subgroups and outcomes come
+from a single matrix product with a patient x group indicator matrix,
+and all effect measures, confidence intervals, p-values and NNT/NNH
+are then computed on (subgroups x outcomes) arrays. Hundreds of
+outcomes across dozens of subgroups need no Python loop per outcome.
+
+Supported outcome types:
+    - binary         Rate (%), risk difference, relative risk, NNT/NNH
+    - continuous     Mean, mean difference (Welch), Hedges' g
+    - time_to_event  Event rate per 100 person-time units, rate
+                     difference, incidence rate ratio (approximates the
+                     hazard ratio under constant hazards)
+
+Author: NexVigilant Capability Engineering
+Version: 1.0
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from scipy import sparse, stats
+
+
+# Patients x groups x outcomes floats accumulated per block of patients
+ACCUMULATE_BLOCK_ELEMENTS = 20_000_000
+
+OUTCOME_TYPES = ('binary', 'continuous', 'time_to_event')
+
+RELATIVE_MEASURES = {
+    'binary': 'RR',
+    'continuous': 'SMD',
+    'time_to_event': 'IRR',
+}
+
+
+class EffectsTableAnalysis:
+    """
+    Computes Effects Table entries for many outcomes and subgroups at once.
+
+    Each outcome is described by a dict:
+        {
+            'type': 'binary' | 'continuous' | 'time_to_event',
+            'category': 'Benefit' | 'Risk',
+            'importance': 'Critical' | 'Important' | 'Moderate' | 'Minor',
+            'column': patient-level column (binary 0/1 or continuous value),
+            'time': follow-up time column (time_to_event only),
+            'event': 0/1 event indicator column (time_to_event only),
+            'direction': 'higher_better' | 'lower_better' (optional)
+        }
+
+    'direction' defaults to higher_better for binary and continuous
+    benefits and to lower_better for risks and for time-to-event
+    outcomes, whose events (death, progression) are undesirable.
+    Missing values (NaN) are excluded per outcome.
+    """
+
+    def __init__(self, outcomes: Dict[str, dict]):
+        """
+        Initialize the analysis.
+
+        Args:
+            outcomes: Dictionary of outcome name -> outcome specification
+        """
+        for name, spec in outcomes.items():
+            if spec.get('type') not in OUTCOME_TYPES:
+                raise ValueError(f"Outcome '{name}' has unknown type: {spec.get('type')}")
+            if spec['type'] == 'time_to_event':
+                if 'time' not in spec or 'event' not in spec:
+                    raise ValueError(f"Outcome '{name}' needs 'time' and 'event' columns")
+            elif 'column' not in spec:
+                raise ValueError(f"Outcome '{name}' needs a 'column'")
+
+        self.outcomes = outcomes
+        self.outcome_names = list(outcomes)
+        self.results = None
+
+    def _direction(self, spec: dict) -> str:
+        if 'direction' in spec:
+            return spec['direction']
+        if spec['type'] == 'time_to_event' or spec.get('category') == 'Risk':
+            return 'lower_better'
+        return 'higher_better'
+
+    def _outcome_arrays(self, data: pd.DataFrame):
+        """
+        Stack outcome values into one (patients x outcomes) array.
+
+        Binary and continuous outcomes contribute their value column;
+        time-to-event outcomes contribute the event indicator, with the
+        follow-up time returned separately (NaN for other outcomes).
+        """
+        plain = [j for j, name in enumerate(self.outcome_names)
+                 if self.outcomes[name]['type'] != 'time_to_event']
+        values = np.full((len(data), len(self.outcome_names)), np.nan)
+        times = np.full_like(values, np.nan)
+
+        columns = [self.outcomes[self.outcome_names[j]]['column'] for j in plain]
+        values[:, plain] = data[columns].to_numpy(dtype=float)
+
+        for j, name in enumerate(self.outcome_names):
+            spec = self.outcomes[name]
+            if spec['type'] == 'time_to_event':
+                event = data[spec['event']].to_numpy(dtype=float)
+                time = data[spec['time']].to_numpy(dtype=float)
+                missing = np.isnan(event) | np.isnan(time)
+                values[:, j] = np.where(missing, np.nan, event)
+                times[:, j] = np.where(missing, np.nan, time)
+
+        return values, times
+
+    @staticmethod
+    def _group_sums(groups: np.ndarray, values: np.ndarray, times: np.ndarray):
+        """
+        Per-group counts, sums, sums of squares and person-time.
+
+        groups is a boolean (patients x groups) indicator matrix, so
+        overlapping groups (e.g. 'Overall' plus each subgroup) are all
+        handled by the same product. It is applied as a sparse matrix:
+        each patient belongs to one arm and one level per subgroup
+        variable, so the cost scales with memberships, not groups.
+        Patients are processed in blocks to bound memory.
+        """
+        n_patients, n_outcomes = values.shape
+        totals = np.zeros((groups.shape[1], 4 * n_outcomes))
+
+        block = max(1, ACCUMULATE_BLOCK_ELEMENTS // max(n_outcomes * 4, 1))
+        for start in range(0, n_patients, block):
+            g = sparse.csr_matrix(groups[start:start + block].T, dtype=float)
+            x = values[start:start + block]
+            valid = ~np.isnan(x)
+            x = np.where(valid, x, 0.0)
+            t = np.where(np.isnan(times[start:start + block]), 0.0, times[start:start + block])
+
+            # One BLAS product for all four statistics
+            totals += g @ np.hstack([valid.astype(float), x, x * x, t])
+
+        counts, sums, squares, person_time = np.hsplit(totals, 4)
+        return counts, sums, squares, person_time
+
+    def compute(self, data: pd.DataFrame,
+                arm_column: str = 'treatment',
+                control_arm: Optional[str] = None,
+                subgroup_columns: Optional[List[str]] = None,
+                confidence: float = 0.95) -> pd.DataFrame:
+        """
+        Compute the Effects Table for every arm versus the control arm.
+
+        Args:
+            data: Patient-level DataFrame
+            arm_column: Column identifying the treatment arm
+            control_arm: Comparator arm (defaults to the last arm in
+                         sorted order)
+            subgroup_columns: Columns whose levels define subgroups;
+                              'Overall' is always included
+            confidence: Confidence level of the intervals
+
+        Returns:
+            Long DataFrame with one row per comparison x subgroup x outcome
+        """
+        arms = sorted(data[arm_column].unique())
+        if control_arm is None:
+            control_arm = arms[-1]
+        if control_arm not in arms:
+            raise ValueError(f"Control arm '{control_arm}' not found in '{arm_column}'")
+        active_arms = [a for a in arms if a != control_arm]
+        if not active_arms:
+            raise ValueError("Need at least one arm besides the control arm")
+
+        # Subgroup membership: (patients x subgroups), Overall first
+        labels = ['Overall']
+        members = [np.ones(len(data), dtype=bool)]
+        for col in subgroup_columns or []:
+            for level in sorted(data[col].dropna().unique()):
+                labels.append(f"{col}: {level}")
+                members.append((data[col] == level).to_numpy())
+        members = np.column_stack(members)
+        n_sub = len(labels)
+
+        # Groups are arm x subgroup, arm-major
+        arm_values = data[arm_column].to_numpy()
+        arm_order = active_arms + [control_arm]
+        groups = np.concatenate(
+            [members & (arm_values == arm)[:, None] for arm in arm_order], axis=1
+        )
+
+        values, times = self._outcome_arrays(data)
+        counts, sums, squares, person_time = self._group_sums(groups, values, times)
+
+        def arm_block(array, k):
+            return array[k * n_sub:(k + 1) * n_sub]
+
+        control = tuple(arm_block(a, len(active_arms))
+                        for a in (counts, sums, squares, person_time))
+
+        tables = []
+        for k, arm in enumerate(active_arms):
+            treated = tuple(arm_block(a, k) for a in (counts, sums, squares, person_time))
+            table = self._effects(treated, control, confidence)
+            table.insert(0, 'Comparison', f"{arm} vs {control_arm}")
+            table.insert(1, 'Subgroup', np.repeat(labels, len(self.outcome_names)))
+            tables.append(table)
+
+        result = pd.concat(tables, ignore_index=True)
+        self.results = result
+        return result
+
+    def _effects(self, treated, control, confidence: float) -> pd.DataFrame:
+        """Effect measures for one comparison on (subgroups x outcomes) arrays."""
+        n1, s1, q1, t1 = treated
+        n0, s0, q0, t0 = control
+        z = stats.norm.ppf(0.5 + confidence / 2)
+        shape = n1.shape
+
+        types = np.array([self.outcomes[o]['type'] for o in self.outcome_names])
+        binary = np.broadcast_to(types == 'binary', shape)
+        continuous = np.broadcast_to(types == 'continuous', shape)
+        tte = np.broadcast_to(types == 'time_to_event', shape)
+        sign = np.array([1.0 if self._direction(self.outcomes[o]) == 'higher_better' else -1.0
+                         for o in self.outcome_names])
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean1, mean0 = s1 / n1, s0 / n0
+            var1 = (q1 - n1 * mean1 ** 2) / (n1 - 1)
+            var0 = (q0 - n0 * mean0 ** 2) / (n0 - 1)
+
+            # Binary: proportions with a 0.5 correction for zero cells
+            p1, p0 = mean1, mean0
+            se_rd = np.sqrt(p1 * (1 - p1) / n1 + p0 * (1 - p0) / n0)
+            zero = (s1 == 0) | (s0 == 0) | (s1 == n1) | (s0 == n0)
+            cc = np.where(zero, 0.5, 0.0)
+            x1c, x0c, n1c, n0c = s1 + cc, s0 + cc, n1 + 2 * cc, n0 + 2 * cc
+            log_rr = np.log((x1c / n1c) / (x0c / n0c))
+            se_log_rr = np.sqrt(1 / x1c - 1 / n1c + 1 / x0c - 1 / n0c)
+            pooled = (s1 + s0) / (n1 + n0)
+            se_pooled = np.sqrt(pooled * (1 - pooled) * (1 / n1 + 1 / n0))
+
+            # Continuous: Welch mean difference and Hedges' g
+            se_md = np.sqrt(var1 / n1 + var0 / n0)
+            welch_df = se_md ** 4 / ((var1 / n1) ** 2 / (n1 - 1) + (var0 / n0) ** 2 / (n0 - 1))
+            sd_pooled = np.sqrt(((n1 - 1) * var1 + (n0 - 1) * var0) / (n1 + n0 - 2))
+            correction = 1 - 3 / (4 * (n1 + n0) - 9)
+            g = correction * (mean1 - mean0) / sd_pooled
+            se_g = np.sqrt((n1 + n0) / (n1 * n0) + g ** 2 / (2 * (n1 + n0)))
+
+            # Time-to-event: events per 100 person-time units
+            rate1, rate0 = 100 * s1 / t1, 100 * s0 / t0
+            se_rate_diff = 100 * np.sqrt(s1 / t1 ** 2 + s0 / t0 ** 2)
+            e1c = s1 + np.where((s1 == 0) | (s0 == 0), 0.5, 0.0)
+            e0c = s0 + (e1c - s1)
+            log_irr = np.log((e1c / t1) / (e0c / t0))
+            se_log_irr = np.sqrt(1 / e1c + 1 / e0c)
+
+            trt_value = np.select([binary, tte], [100 * p1, rate1], mean1)
+            ctrl_value = np.select([binary, tte], [100 * p0, rate0], mean0)
+            diff = trt_value - ctrl_value
+            se_diff = np.select([binary, tte], [100 * se_rd, se_rate_diff], se_md)
+            crit = np.where(continuous, stats.t.ppf(0.5 + confidence / 2, welch_df), z)
+            diff_lower, diff_upper = diff - crit * se_diff, diff + crit * se_diff
+
+            log_rel = np.select([binary, tte], [log_rr, log_irr], 0.0)
+            se_log_rel = np.select([binary, tte], [se_log_rr, se_log_irr], 0.0)
+            relative = np.where(continuous, g, np.exp(log_rel))
+            rel_lower = np.where(continuous, g - z * se_g, np.exp(log_rel - z * se_log_rel))
+            rel_upper = np.where(continuous, g + z * se_g, np.exp(log_rel + z * se_log_rel))
+
+            p_value = np.select(
+                [binary, tte],
+                [2 * stats.norm.sf(np.abs(p1 - p0) / se_pooled),
+                 2 * stats.norm.sf(np.abs(log_irr) / se_log_irr)],
+                2 * stats.t.sf(np.abs(mean1 - mean0) / se_md, welch_df),
+            )
+
+            # Differences oriented so that positive favours treatment
+            oriented_lo = np.where(sign > 0, diff_lower, -diff_upper)
+            oriented_hi = np.where(sign > 0, diff_upper, -diff_lower)
+
+            # NNT/NNH from the oriented risk difference; signed so that
+            # positive = NNT (benefit) and negative = NNH (harm). A CI
+            # crossing zero gives bounds on either side of infinity.
+            nnt = np.where(binary, 1 / (sign * (p1 - p0)), np.nan)
+            nnt_lower = np.where(binary, 100 / oriented_hi, np.nan)
+            nnt_upper = np.where(binary, 100 / oriented_lo, np.nan)
+
+        favors = np.select([oriented_lo > 0, oriented_hi < 0], ['T', 'C'], '=')
+
+        specs = [self.outcomes[o] for o in self.outcome_names]
+        n_sub = shape[0]
+
+        def column(values):
+            return np.asarray(values).ravel()
+
+        return pd.DataFrame({
+            'Outcome': np.tile(self.outcome_names, n_sub),
+            'Category': np.tile([spec.get('category') for spec in specs], n_sub),
+            'Importance': np.tile([spec.get('importance') for spec in specs], n_sub),
+            'Type': np.tile(types, n_sub),
+            'Direction': np.tile([self._direction(spec) for spec in specs], n_sub),
+            'n_treatment': column(n1).astype(int),
+            'n_control': column(n0).astype(int),
+            'treatment_value': column(trt_value),
+            'control_value': column(ctrl_value),
+            'difference': column(diff),
+            'diff_lower': column(diff_lower),
+            'diff_upper': column(diff_upper),
+            'measure': np.tile([RELATIVE_MEASURES[t] for t in types], n_sub),
+            'relative': column(relative),
+            'rel_lower': column(rel_lower),
+            'rel_upper': column(rel_upper),
+            'p_value': column(p_value),
+            'nnt': column(nnt),
+            'nnt_lower': column(nnt_lower),
+            'nnt_upper': column(nnt_upper),
+            'favors': column(favors),
+        })
+
+    def summary_table(self, comparison: Optional[str] = None,
+                      subgroup: str = 'Overall') -> pd.DataFrame:
+        """
+        Format one comparison and subgroup in the Effects Table template layout.
+
+        Returns:
+            DataFrame with Outcome, Importance, Treatment, Comparator,
+            Absolute Difference, Relative Measure, 95% CI, NNT/NNH, Favors
+        """
+        if self.results is None:
+            raise ValueError("No results available. Run compute() first.")
+
+        r = self.results
+        if comparison is None:
+            comparison = r['Comparison'].iloc[0]
+        r = r[(r['Comparison'] == comparison) & (r['Subgroup'] == subgroup)]
+
+        def value(row, v):
+            return f"{v:.1f}%" if row['Type'] == 'binary' else f"{v:.2f}"
+
+        def nnt(row):
+            if np.isnan(row['nnt']) or np.isinf(row['nnt']):
+                return ''
+            label = 'NNT' if row['nnt'] > 0 else 'NNH'
+            return f"{label} {np.ceil(abs(row['nnt'])):.0f}"
+
+        rows = []
+        for category in ('Benefit', 'Risk'):
+            for _, row in r[r['Category'] == category].iterrows():
+                rows.append({
+                    'Category': category,
+                    'Outcome': row['Outcome'],
+                    'Importance': row['Importance'],
+                    'Treatment': value(row, row['treatment_value']),
+                    'Comparator': value(row, row['control_value']),
+                    'Absolute Difference': f"{row['difference']:+.2f}",
+                    'Relative Measure': f"{row['measure']} {row['relative']:.2f}",
+                    '95% CI': f"[{row['rel_lower']:.2f}, {row['rel_upper']:.2f}]",
+                    'NNT/NNH': nnt(row),
+                    'Favors': row['favors'],
+                })
+
+        return pd.DataFrame(rows)
+
+
+def create_example_data(n_per_arm: int = 500, seed: int = 42):
+    """
+    Create example patient-level data for the Effects Table.
+
+    Mirrors the anti-inflammatory worked example in the Effects Table
+    template, with age and region subgroups.
+
+    Returns:
+        Tuple of (patient DataFrame, outcome specifications)
+    """
+    rng = np.random.default_rng(seed)
+    n = 2 * n_per_arm
+    treated = np.repeat([True, False], n_per_arm)
+
+    def binary(p_trt, p_ctrl):
+        return (rng.random(n) < np.where(treated, p_trt, p_ctrl)).astype(float)
+
+    data = pd.DataFrame({
+        'treatment': np.where(treated, 'Treatment', 'Placebo'),
+        'age_group': rng.choice(['<65', '>=65'], size=n, p=[0.7, 0.3]),
+        'region': rng.choice(['EU', 'NA', 'APAC'], size=n),
+        'acr20': binary(0.62, 0.35),
+        'das28_remission': binary(0.28, 0.08),
+        'pga_change': rng.normal(np.where(treated, -2.1, -0.8), 2.9),
+        'serious_infection': binary(0.032, 0.018),
+        'injection_site': binary(0.084, 0.021),
+        'ae_discontinuation': binary(0.056, 0.038),
+    })
+
+    # Time to first serious AE over up to 52 weeks of follow-up
+    hazard = np.where(treated, 0.0018, 0.0013)
+    event_time = rng.exponential(1 / hazard)
+    censor_time = rng.uniform(26, 52, size=n)
+    data['sae_weeks'] = np.minimum(event_time, censor_time)
+    data['sae_event'] = (event_time <= censor_time).astype(float)
+
+    # Some PGA values missing at random
+    data.loc[rng.random(n) < 0.05, 'pga_change'] = np.nan
+
+    outcomes = {
+        'ACR20 Response (W24)': {'type': 'binary', 'column': 'acr20',
+                                 'category': 'Benefit', 'importance': 'Critical'},
+        'DAS28 Remission (W52)': {'type': 'binary', 'column': 'das28_remission',
+                                  'category': 'Benefit', 'importance': 'Important'},
+        'Patient Global Assessment': {'type': 'continuous', 'column': 'pga_change',
+                                      'category': 'Benefit', 'importance': 'Moderate',
+                                      'direction': 'lower_better'},
+        'Serious Infection': {'type': 'binary', 'column': 'serious_infection',
+                              'category': 'Risk', 'importance': 'Critical'},
+        'Injection Site Reaction': {'type': 'binary', 'column': 'injection_site',
+                                    'category': 'Risk', 'importance': 'Moderate'},
+        'Discontinuation due to AE': {'type': 'binary', 'column': 'ae_discontinuation',
+                                      'category': 'Risk', 'importance': 'Important'},
+        'Time to First SAE': {'type': 'time_to_event', 'time': 'sae_weeks',
+                              'event': 'sae_event', 'category': 'Risk',
+                              'importance': 'Important'},
+    }
+
+    return data, outcomes
+
+
+def main():
+    """
+    Demonstrate Effects Table computation from patient-level data.
+    """
+    print("=" * 70)
+    print("EFFECTS TABLE COMPUTATION DEMONSTRATION")
+    print("NexVigilant Benefit-Risk Intelligence Toolkit")
+    print("=" * 70)
+    print()
+
+    data, outcomes = create_example_data()
+    analysis = EffectsTableAnalysis(outcomes)
+    results = analysis.compute(data, arm_column='treatment', control_arm='Placebo',
+                               subgroup_columns=['age_group', 'region'])
+
+    print("EFFECTS TABLE (Overall):")
+    print("-" * 70)
+    print(analysis.summary_table().to_string(index=False))
+    print()
+
+    print("ACR20 RESPONSE BY SUBGROUP:")
+    print("-" * 70)
+    acr = results[results['Outcome'] == 'ACR20 Response (W24)']
+    print(acr[['Subgroup', 'n_treatment', 'n_control', 'difference',
+               'diff_lower', 'diff_upper', 'nnt']].round(2).to_string(index=False))
+    print()
+
+    return analysis, results
+
+
+if __name__ == "__main__":
+    analysis, results = main()
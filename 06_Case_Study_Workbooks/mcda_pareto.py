@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Pareto-Front and Top-k Selection for Large-Alternative MCDA
+NexVigilant Benefit-Risk Intelligence Toolkit
+
+Dose-finding MCDA evaluates grids of 10^4-10^6 candidate regimens.
+Sorting and printing the whole table is unnecessary: only regimens
+on the Pareto front (not dominated on every benefit and risk score)
+can be optimal for any weighting, and stakeholders usually need just
+the top few regimens per weight vector.
+
+All functions work on scored value matrices (alternatives x criteria,
+0-100 scale, higher is better for every criterion, as produced by
+MCDAAnalysis.score_matrix), so benefit and risk criteria are handled
+alike.
+
+Author: NexVigilant Capability Engineering
+Version: 1.0
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+# Upper bound on floats held in one (weight sets x alternatives) block
+SCORE_BLOCK_ELEMENTS = 8_000_000
+
+# Grid cells used by the pre-filter, and the size at which it pays off
+PRUNE_CELL_BUDGET = 1 << 21
+PRUNE_MIN_ALTERNATIVES = 20_000
+
+
+def _cell_prefilter(values: np.ndarray, budget: int = PRUNE_CELL_BUDGET) -> np.ndarray:
+    """
+    Flag alternatives that survive a quantile-grid dominance screen.
+
+    Each criterion is cut into q quantile bins. If some occupied cell
+    has a strictly higher bin on every criterion, every point in that
+    cell strictly dominates every point in the lower cell, which can be
+    discarded without pairwise comparisons. The test is a reverse
+    cumulative OR over the occupancy grid, O(q^d).
+
+    Returns:
+        Boolean mask of alternatives that may be non-dominated
+    """
+    n, d = values.shape
+    q = int(budget ** (1 / d))
+    if q < 3:
+        return np.ones(n, dtype=bool)
+
+    bins = np.empty((n, d), dtype=np.int64)
+    for j in range(d):
+        edges = np.unique(np.quantile(values[:, j], np.linspace(0, 1, q + 1)[1:-1]))
+        bins[:, j] = np.searchsorted(edges, values[:, j], side='right')
+
+    occupied = np.zeros((q,) * d, dtype=bool)
+    occupied[tuple(bins.T)] = True
+
+    # above[b] = some occupied cell has bin >= b on every criterion
+    above = occupied
+    for axis in range(d):
+        above = np.flip(np.logical_or.accumulate(np.flip(above, axis), axis=axis), axis)
+
+    # Shift by one cell on every axis to require strictly higher bins
+    strictly_above = np.zeros_like(above)
+    strictly_above[(slice(0, -1),) * d] = above[(slice(1, None),) * d]
+
+    return ~strictly_above[tuple(bins.T)]
+
+
+def pareto_front(values: np.ndarray) -> np.ndarray:
+    """
+    Find the non-dominated alternatives with a sort-filter skyline.
+
+    Alternatives are visited in decreasing order of their score sum,
+    so a point can only be dominated by points visited before it. Each
+    newly confirmed front point removes, in one vectorized comparison,
+    every remaining candidate it dominates; the candidate set shrinks
+    quickly, giving roughly O(n x front size) work in numpy. Large
+    inputs are first screened with a quantile-grid pre-filter that
+    discards whole cells strictly dominated by another occupied cell.
+
+    Args:
+        values: (alternatives x criteria) scores, higher is better
+
+    Returns:
+        Sorted integer indices of the Pareto-optimal alternatives
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim != 2:
+        raise ValueError("values must be a 2-D (alternatives x criteria) array")
+
+    candidates = np.arange(len(values))
+    if len(values) >= PRUNE_MIN_ALTERNATIVES:
+        candidates = np.flatnonzero(_cell_prefilter(values))
+
+    order = candidates[np.argsort(-values[candidates].sum(axis=1), kind='stable')]
+    remaining = values[order]
+    remaining_idx = order
+    front = []
+
+    while len(remaining_idx):
+        best = remaining[0]
+        front.append(remaining_idx[0])
+
+        # Drop candidates weakly dominated by the new front point
+        # (exact duplicates survive and join the front on later passes)
+        rest = remaining[1:]
+        dominated = np.all(rest <= best, axis=1) & np.any(rest < best, axis=1)
+        keep = ~dominated
+        remaining = rest[keep]
+        remaining_idx = remaining_idx[1:][keep]
+
+    return np.sort(np.asarray(front, dtype=np.int64))
+
+
+def _as_weight_matrix(weights: np.ndarray, n_criteria: int) -> np.ndarray:
+    weights = np.atleast_2d(np.asarray(weights, dtype=float))
+    if weights.shape[1] != n_criteria:
+        raise ValueError(
+            f"Weights must have {n_criteria} columns, got {weights.shape[1]}"
+        )
+    if (weights < 0).any():
+        raise ValueError("Weights must be non-negative")
+    totals = weights.sum(axis=1, keepdims=True)
+    if (totals <= 0).any():
+        raise ValueError("Every weight vector needs a positive total")
+    return weights / totals
+
+
+def top_k(values: np.ndarray, weights: np.ndarray, k: int = 10,
+          candidates: Optional[np.ndarray] = None) -> pd.DataFrame:
+    """
+    Return the k best alternatives under one or many weight vectors.
+
+    Uses np.argpartition per weight vector, so only the k winners are
+    sorted. Scores are computed in blocks of weight vectors to bound
+    memory with very large grids.
+
+    Args:
+        values: (alternatives x criteria) scores, higher is better
+        weights: (criteria,) or (weight sets x criteria) weights;
+                 rows are normalised to sum to 1
+        k: Number of alternatives to return per weight vector
+        candidates: Optional subset of alternative indices to search,
+                    e.g. pareto_front(values) when k == 1
+
+    Returns:
+        Long DataFrame with weight_set, rank, alternative and score columns
+    """
+    values = np.asarray(values, dtype=float)
+    weights = _as_weight_matrix(weights, values.shape[1])
+
+    index = np.arange(len(values)) if candidates is None else np.asarray(candidates)
+    pool = values[index]
+    k = min(k, len(index))
+
+    block = max(1, SCORE_BLOCK_ELEMENTS // max(len(index), 1))
+    sets, ranks, alternatives, scores = [], [], [], []
+
+    for start in range(0, len(weights), block):
+        w = weights[start:start + block]
+        totals = w @ pool.T
+
+        # Unordered top-k per row, then order just those k
+        if k < totals.shape[1]:
+            part = np.argpartition(-totals, k - 1, axis=1)[:, :k]
+        else:
+            part = np.broadcast_to(np.arange(k), (len(w), k))
+        part_scores = np.take_along_axis(totals, part, axis=1)
+        order = np.argsort(-part_scores, axis=1, kind='stable')
+        winners = np.take_along_axis(part, order, axis=1)
+
+        sets.append(np.repeat(np.arange(start, start + len(w)), k))
+        ranks.append(np.tile(np.arange(1, k + 1), len(w)))
+        alternatives.append(index[winners].ravel())
+        scores.append(np.take_along_axis(part_scores, order, axis=1).ravel())
+
+    return pd.DataFrame({
+        'weight_set': np.concatenate(sets),
+        'rank': np.concatenate(ranks),
+        'alternative': np.concatenate(alternatives),
+        'score': np.concatenate(scores),
+    })
+
+
+def optimal_weight_regions(values: np.ndarray,
+                           front: Optional[np.ndarray] = None,
+                           n_samples: int = 100_000,
+                           criteria: Optional[Sequence[str]] = None,
+                           seed: int = 42) -> pd.DataFrame:
+    """
+    Describe the region of weight space where each Pareto alternative wins.
+
+    Weight vectors are sampled uniformly from the simplex (Dirichlet(1))
+    and each is assigned to its best front alternative. For every
+    alternative that wins somewhere, the region is summarised by its
+    share of the simplex, its centroid weight vector and the range of
+    each criterion's weight.
+
+    Args:
+        values: (alternatives x criteria) scores, higher is better
+        front: Pareto front indices (computed if omitted)
+        n_samples: Number of weight vectors to sample
+        criteria: Criterion names for the output columns
+        seed: Random seed for the weight samples
+
+    Returns:
+        DataFrame indexed by alternative with 'share' plus
+        '<criterion> mean', '<criterion> min', '<criterion> max' columns
+    """
+    values = np.asarray(values, dtype=float)
+    n_criteria = values.shape[1]
+    criteria = list(criteria) if criteria is not None else \
+        [f"criterion_{j}" for j in range(n_criteria)]
+    front = pareto_front(values) if front is None else np.asarray(front)
+
+    rng = np.random.default_rng(seed)
+    samples = rng.dirichlet(np.ones(n_criteria), size=n_samples)
+
+    block = max(1, SCORE_BLOCK_ELEMENTS // max(len(front), 1))
+    winner = np.concatenate([
+        np.argmax(samples[s:s + block] @ values[front].T, axis=1)
+        for s in range(0, n_samples, block)
+    ])
+
+    counts = np.bincount(winner, minlength=len(front))
+    wins = np.flatnonzero(counts)
+
+    # Per-region mean/min/max of each weight via sort-and-reduce
+    order = np.argsort(winner, kind='stable')
+    sorted_w = samples[order]
+    starts = np.searchsorted(winner[order], wins)
+    sums = np.add.reduceat(sorted_w, starts, axis=0)
+    mins = np.minimum.reduceat(sorted_w, starts, axis=0)
+    maxs = np.maximum.reduceat(sorted_w, starts, axis=0)
+
+    table = {'share': counts[wins] / n_samples}
+    for j, name in enumerate(criteria):
+        table[f"{name} mean"] = sums[:, j] / counts[wins]
+        table[f"{name} min"] = mins[:, j]
+        table[f"{name} max"] = maxs[:, j]
+
+    result = pd.DataFrame(table, index=pd.Index(front[wins], name='alternative'))
+    return result.sort_values('share', ascending=False)
+
+
+def simulate_regimen_grid(n_doses: int = 200, n_intervals: int = 50,
+                          seed: int = 42) -> pd.DataFrame:
+    """
+    Simulate a dose x dosing-interval grid from Emax exposure-response models.
+
+    Returns:
+        DataFrame with one row per regimen and columns 'Dose (mg)',
+        'Interval (h)', 'Response Rate', 'Grade 3-4 AEs' and 'Adherence'
+    """
+    rng = np.random.default_rng(seed)
+    dose = np.linspace(10, 400, n_doses)
+    interval = np.linspace(6, 48, n_intervals)
+    dd, ii = np.meshgrid(dose, interval, indexing='ij')
+    dd, ii = dd.ravel(), ii.ravel()
+
+    # Average exposure scales with dose per unit time
+    exposure = dd * 24 / ii
+    response = 70 * exposure / (exposure + 250)
+    toxicity = 5 + 45 * exposure ** 2 / (exposure ** 2 + 900 ** 2)
+    adherence = 95 - 25 * np.exp(-(ii - 6) / 10)
+
+    noise = rng.normal(0, 0.5, size=(3, dd.size))
+    return pd.DataFrame({
+        'Dose (mg)': dd,
+        'Interval (h)': ii,
+        'Response Rate': response + noise[0],
+        'Grade 3-4 AEs': toxicity + noise[1],
+        'Adherence': adherence + noise[2],
+    })
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Hierarchical Value Tree MCDA
+NexVigilant Benefit-Risk Intelligence Toolkit
+
+Python counterpart of the Value Tree Template and the Value Tree
+Builder workbook. Nodes carry local weights (normalised among their
+siblings), leaf criteria carry partial value functions, and each
+leaf's global weight is the product of the normalised local weights
+on its path from the root.
+
+Every node caches its 0-100 value for each alternative (the weighted
+average of its children). Because a node's value does not depend on
+the weights above it, editing one node's weight only re-aggregates
+its parent and the parent's ancestors, and only the global weights
+inside the parent's subtree change. An interactive workshop edit is
+therefore O(affected leaves x alternatives), not a full re-evaluation.
+
+Author: NexVigilant Capability Engineering
+Version: 1.0
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from value_functions import (LinearValueFunction, ValueFunction,
+                             value_function_from_spec)
+
+
+class ValueTreeNode:
+    """
+    A node of the value tree.
+
+    Internal nodes group criteria (e.g. "Benefits" > "Efficacy"); leaf
+    nodes are criteria scored by a value function. Cached arrays are
+    indexed by alternative in the order passed to ValueTree.evaluate().
+    """
+
+    def __init__(self, name: str, weight: float = 1.0,
+                 parent: Optional['ValueTreeNode'] = None,
+                 direction: Optional[str] = None,
+                 value_function: Optional[ValueFunction] = None,
+                 column: Optional[str] = None):
+        self.name = name
+        self.weight = float(weight)
+        self.parent = parent
+        self.children: List['ValueTreeNode'] = []
+
+        # Leaf-only attributes
+        self.direction = direction
+        self.value_function = value_function
+        self.column = column or name
+        self.raw: Optional[np.ndarray] = None
+
+        # Caches
+        self.value: Optional[np.ndarray] = None   # 0-100 per alternative
+        self.global_weight: Optional[float] = None
+        self._contribution: Optional[np.ndarray] = None
+        self._breakdown: Optional[pd.DataFrame] = None
+
+    @property
+    def is_leaf(self) -> bool:
+        return not self.children
+
+    @property
+    def local_weight(self) -> float:
+        """Weight normalised among siblings (1.0 for the root)."""
+        if self.parent is None:
+            return 1.0
+        return self.weight / self.parent._child_weight_total()
+
+    def _child_weight_total(self) -> float:
+        total = sum(child.weight for child in self.children)
+        if total <= 0:
+            raise ValueError(f"Children of '{self.name}' have zero total weight")
+        return total
+
+    @property
+    def contribution(self) -> np.ndarray:
+        """Contribution of this node to the total score per alternative."""
+        if self._contribution is None:
+            self._contribution = self.global_weight * self.value
+        return self._contribution
+
+    def iter_subtree(self):
+        """Yield this node and all of its descendants (depth-first)."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def leaves(self) -> List['ValueTreeNode']:
+        return [node for node in self.iter_subtree() if node.is_leaf]
+
+    def __repr__(self):
+        kind = "Criterion" if self.is_leaf else "Node"
+        return f"{kind}({self.name!r}, weight={self.weight:g})"
+
+
+class ValueTree:
+    """
+    Value tree with cached, incrementally updated MCDA scores.
+
+    Example:
+        tree = ValueTree("NEXONC Benefit-Risk")
+        tree.add_node("Benefits", weight=60)
+        tree.add_node("Risks", weight=40)
+        tree.add_criterion("Overall Survival", parent="Benefits",
+                           weight=100, direction="higher_better")
+        tree.add_criterion("Grade 3-4 AEs", parent="Risks",
+                           weight=100, direction="lower_better")
+        tree.evaluate(raw_data)
+        tree.set_weight("Risks", 55)       # incremental update
+        print(tree.totals)
+    """
+
+    def __init__(self, name: str = "Benefit-Risk Balance"):
+        self.root = ValueTreeNode(name)
+        self.nodes: Dict[str, ValueTreeNode] = {name: self.root}
+        self.alternatives: Optional[pd.Index] = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def add_node(self, name: str, parent: Optional[str] = None,
+                 weight: float = 1.0) -> ValueTreeNode:
+        """Add a grouping node under parent (default: the root)."""
+        return self._attach(ValueTreeNode(name, weight), parent)
+
+    def add_criterion(self, name: str, parent: Optional[str] = None,
+                      weight: float = 1.0,
+                      direction: str = 'higher_better',
+                      value_function=None,
+                      column: Optional[str] = None) -> ValueTreeNode:
+        """
+        Add a leaf criterion under parent (default: the root).
+
+        Args:
+            name: Criterion name
+            parent: Name of the parent node
+            weight: Local (swing) weight relative to siblings
+            direction: 'higher_better' or 'lower_better', used for the
+                       default linear value function
+            value_function: ValueFunction or spec dict; defaults to linear
+                            over the observed range
+            column: Raw data column (defaults to name)
+        """
+        if isinstance(value_function, dict):
+            value_function = value_function_from_spec(value_function)
+        node = ValueTreeNode(name, weight, direction=direction,
+                             value_function=value_function, column=column)
+        return self._attach(node, parent)
+
+    def _attach(self, node: ValueTreeNode, parent: Optional[str]) -> ValueTreeNode:
+        if node.name in self.nodes:
+            raise ValueError(f"Duplicate node name: {node.name}")
+        if node.weight < 0:
+            raise ValueError(f"Negative weight for node: {node.name}")
+
+        parent_node = self.nodes[parent] if parent is not None else self.root
+        node.parent = parent_node
+        parent_node.children.append(node)
+        self.nodes[node.name] = node
+
+        # Structure changed: cached results are no longer valid
+        self.alternatives = None
+        return node
+
+    @classmethod
+    def from_dict(cls, spec: dict) -> 'ValueTree':
+        """
+        Build a tree from a nested specification.
+
+        Example:
+            {'name': 'B-R', 'children': [
+                {'name': 'Benefits', 'weight': 60, 'children': [
+                    {'name': 'Overall Survival', 'weight': 100,
+                     'direction': 'higher_better'}]},
+                {'name': 'Risks', 'weight': 40, 'children': [...]}]}
+        """
+        tree = cls(spec.get('name', "Benefit-Risk Balance"))
+
+        def build(children, parent):
+            for child in children:
+                if child.get('children'):
+                    tree.add_node(child['name'], parent, child.get('weight', 1.0))
+                    build(child['children'], child['name'])
+                else:
+                    tree.add_criterion(
+                        child['name'], parent, child.get('weight', 1.0),
+                        direction=child.get('direction', 'higher_better'),
+                        value_function=child.get('value_function'),
+                        column=child.get('column'),
+                    )
+
+        build(spec.get('children', []), None)
+        return tree
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+
+    def evaluate(self, raw_data: pd.DataFrame,
+                 treatment_col: str = 'Treatment') -> pd.Series:
+        """
+        Fully evaluate the tree for the alternatives in raw_data.
+
+        Args:
+            raw_data: DataFrame with one row per alternative and one column
+                      per leaf criterion
+            treatment_col: Column holding alternative labels
+
+        Returns:
+            Series of total scores (0-100) per alternative
+        """
+        leaves = self.root.leaves()
+        missing = {leaf.column for leaf in leaves} - set(raw_data.columns)
+        if missing:
+            raise ValueError(f"Raw data missing criteria: {missing}")
+
+        self.alternatives = pd.Index(raw_data[treatment_col], name=treatment_col)
+
+        for leaf in leaves:
+            leaf.raw = raw_data[leaf.column].to_numpy(dtype=float)
+            leaf.value = self._leaf_value_function(leaf, leaf.raw)(leaf.raw)
+
+        # Post-order aggregation of values, then top-down global weights
+        for node in reversed(list(self.root.iter_subtree())):
+            if not node.is_leaf:
+                self._aggregate(node)
+        self._refresh_weights(self.root)
+
+        return self.totals
+
+    @staticmethod
+    def _leaf_value_function(leaf: ValueTreeNode, raw: np.ndarray) -> ValueFunction:
+        if leaf.value_function is not None:
+            return leaf.value_function
+        if leaf.direction == 'lower_better':
+            return LinearValueFunction(best=raw.min(), worst=raw.max())
+        return LinearValueFunction(best=raw.max(), worst=raw.min())
+
+    @staticmethod
+    def _aggregate(node: ValueTreeNode):
+        """Recompute a node's value from its children's cached values."""
+        total = node._child_weight_total()
+        value = np.zeros_like(node.children[0].value)
+        for child in node.children:
+            value += (child.weight / total) * child.value
+        node.value = value
+
+    @staticmethod
+    def _refresh_weights(top: ValueTreeNode):
+        """Recompute global weights and clear caches within a subtree."""
+        base = top.parent.global_weight if top.parent is not None else 1.0
+        top.global_weight = base * top.local_weight
+        for node in top.iter_subtree():
+            if node is not top:
+                node.global_weight = node.parent.global_weight * node.local_weight
+            node._contribution = None
+            node._breakdown = None
+
+    def _require_evaluated(self):
+        if self.alternatives is None:
+            raise RuntimeError("Value tree not evaluated. Run evaluate() first.")
+
+    def _propagate_up(self, node: Optional[ValueTreeNode]):
+        """Re-aggregate node and its ancestors, invalidating their caches."""
+        while node is not None:
+            self._aggregate(node)
+            node._contribution = None
+            node._breakdown = None
+            node = node.parent
+
+    # ------------------------------------------------------------------
+    # Incremental edits
+    # ------------------------------------------------------------------
+
+    def set_weight(self, name: str, weight: float) -> Optional[pd.Series]:
+        """
+        Change one node's local weight and update scores incrementally.
+
+        Only the parent's subtree (whose normalised weights change) and
+        the parent's ancestors (whose values change) are touched. Before
+        evaluate() has been called only the weight is stored.
+
+        Returns:
+            Updated total scores per alternative, or None if the tree has
+            not been evaluated yet
+        """
+        if weight < 0:
+            raise ValueError("Weights must be non-negative")
+        node = self.nodes[name]
+        if node.parent is None:
+            raise ValueError("The root node has no weight to edit")
+
+        siblings = sum(c.weight for c in node.parent.children if c is not node)
+        if siblings + weight <= 0:
+            raise ValueError(f"Children of '{node.parent.name}' would have zero total weight")
+
+        node.weight = float(weight)
+        if self.alternatives is None:
+            return None
+
+        parent = node.parent
+        self._propagate_up(parent)
+        for child in parent.children:
+            self._refresh_weights(child)
+
+        return self.totals
+
+    def set_value_function(self, name: str, value_function) -> pd.Series:
+        """
+        Replace a leaf's value function and update scores incrementally.
+
+        Requires the tree to have been evaluated; the leaf is re-scored
+        from the raw values cached by evaluate().
+        """
+        self._require_evaluated()
+        leaf = self.nodes[name]
+        if not leaf.is_leaf:
+            raise ValueError(f"'{name}' is not a criterion")
+        if isinstance(value_function, dict):
+            value_function = value_function_from_spec(value_function)
+
+        leaf.value_function = value_function
+        leaf.value = value_function(leaf.raw)
+        leaf._contribution = None
+        leaf._breakdown = None
+        self._propagate_up(leaf.parent)
+        return self.totals
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    @property
+    def totals(self) -> pd.Series:
+        """Total MCDA score per alternative."""
+        self._require_evaluated()
+        return pd.Series(self.root.value, index=self.alternatives,
+                         name='TOTAL SCORE')
+
+    def global_weights(self) -> pd.Series:
+        """Global weight of every leaf criterion (sums to 1)."""
+        self._require_evaluated()
+        leaves = self.root.leaves()
+        return pd.Series([leaf.global_weight for leaf in leaves],
+                         index=[leaf.name for leaf in leaves], name='Weight')
+
+    def contribution(self, name: str) -> pd.Series:
+        """Cached contribution of one node to the total score."""
+        self._require_evaluated()
+        node = self.nodes[name]
+        return pd.Series(node.contribution, index=self.alternatives, name=name)
+
+    def breakdown(self, name: Optional[str] = None) -> pd.DataFrame:
+        """
+        Contribution of each child of a node to the total score.
+
+        Columns are the node's children plus 'TOTAL' (the node's own
+        contribution); rows are alternatives. Results are cached on the
+        node until an edit affects them.
+        """
+        self._require_evaluated()
+        node = self.nodes[name] if name is not None else self.root
+        if node._breakdown is None:
+            parts = node.children or [node]
+            table = pd.DataFrame(
+                {part.name: part.contribution for part in parts},
+                index=self.alternatives,
+            )
+            table['TOTAL'] = node.contribution
+            node._breakdown = table
+        return node._breakdown
+
+    def criteria(self) -> Dict[str, dict]:
+        """
+        Flatten the leaves into an MCDAAnalysis criteria dictionary.
+
+        Each criterion's 'category' is its top-level branch (e.g.
+        'Benefits' or 'Risks').
+        """
+        flat = {}
+        for leaf in self.root.leaves():
+            branch = leaf
+            while branch.parent is not None and branch.parent is not self.root:
+                branch = branch.parent
+            info = {'category': branch.name,
+                    'direction': leaf.direction or 'higher_better'}
+            if leaf.value_function is not None:
+                info['value_function'] = leaf.value_function
+            flat[leaf.column] = info
+        return flat
+
+    def print_tree(self):
+        """Print the tree with local and global weights."""
+        def walk(node, depth):
+            weight = f"{node.global_weight:.1%}" if node.global_weight is not None else "-"
+            print(f"{'    ' * depth}{node.name}  (local {node.local_weight:.1%}, "
+                  f"global {weight})")
+            for child in node.children:
+                walk(child, depth + 1)
+        walk(self.root, 0)
+
+
+def create_example_tree() -> ValueTree:
+    """
+    Value tree for the oncology case in the MCDA Walkthrough Tutorial.
+    """
+    return ValueTree.from_dict({
+        'name': 'NEXONC Benefit-Risk',
+        'children': [
+            {'name': 'Benefits', 'weight': 230, 'children': [
+                {'name': 'Efficacy', 'weight': 185, 'children': [
+                    {'name': 'Overall Survival', 'weight': 100},
+                    {'name': 'Progression-Free Survival', 'weight': 55},
+                    {'name': 'Tumor Response', 'weight': 30},
+                ]},
+                {'name': 'Quality of Life', 'weight': 45},
+            ]},
+            {'name': 'Risks', 'weight': 70, 'children': [
+                {'name': 'Grade 3-4 AEs', 'weight': 100,
+                 'direction': 'lower_better'},
+            ]},
+        ],
+    })
@@ -0,0 +1,553 @@
+#!/usr/bin/env python3
+"""
+NexVigilant B-R Toolkit Benchmark Suite
+
+Times the DOOR, MCDA and QA hot paths across increasing problem sizes and
+keeps a JSON history of runs so performance regressions can be caught.
+
+Usage:
+    python benchmarks.py run                      # Run all benchmarks, append to history
+    python benchmarks.py run --quick              # Small sizes only (CI smoke run)
+    python benchmarks.py run -k door --label pr42 # Filter by name, label the run
+    python benchmarks.py compare                  # Latest run vs the one before
+    python benchmarks.py compare --base main --threshold 0.15
+    python benchmarks.py list                     # Show registered benchmarks
+
+Benchmarks:
+    door.*  - assign_outcomes, compare_treatments, get_outcome_distribution
+              at 10^3 - 10^7 patients
+    mcda.*  - scoring, weight-scenario sensitivity and Pareto screening at
+              increasing alternative and criterion counts
+    qa.*    - qa_suite.run_checks on synthetic documentation corpora, cold and
+              with a warm result cache; one --watch update after a page edit
+
+Educational Use Only:
+    NexVigilant | Empowerment Through Vigilance
+"""
+
+import argparse
+import atexit
+import io
+import itertools
+import json
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+# Handle Windows console encoding
+if sys.platform == "win32":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+
+# Configuration
+REPO_ROOT = Path(__file__).parent.parent
+WORKBOOKS_DIR = REPO_ROOT / "06_Case_Study_Workbooks"
+VISUALIZATION_DIR = REPO_ROOT / "05_Visualization_Tools"
+HISTORY_PATH = REPO_ROOT / ".benchmarks" / "history.json"
+DEFAULT_THRESHOLD = 0.25  # Flag slow-downs of more than 25% (timings are noisy)
+
+sys.path.insert(0, str(WORKBOOKS_DIR))
+sys.path.insert(0, str(VISUALIZATION_DIR))
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+
+@dataclass
+class Benchmark:
+    """A benchmark timed at each of its parameter values."""
+    name: str
+    setup: Callable[[object], Callable[[], object]]
+    params: Sequence[object]
+    quick_params: Sequence[object]
+    description: str = ""
+
+    def key(self, param) -> str:
+        return f"{self.name}[{param}]"
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, params: Sequence[object], quick: Sequence[object]):
+    """
+    Register a benchmark.
+
+    The decorated function receives one parameter value, does any untimed
+    setup, and returns the zero-argument callable that is timed.
+    """
+    def register(setup):
+        BENCHMARKS[name] = Benchmark(name, setup, list(params), list(quick),
+                                     (setup.__doc__ or "").strip())
+        return setup
+    return register
+
+
+# =============================================================================
+# DOOR BENCHMARKS
+# =============================================================================
+
+DOOR_SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+DOOR_QUICK = [1_000, 100_000]
+
+
+@lru_cache(maxsize=2)
+def _door_trial(n_patients: int):
+    """Two-arm synthetic trial with DOOR categories already assigned."""
+    from door_analysis import DOORAnalysis
+    from trial_simulator import cardiovascular_design, simulate_trial
+
+    design = cardiovascular_design()
+    design.arms.pop('Drug B')
+    data = simulate_trial(design, n_patients, seed=0)
+    door = DOORAnalysis(outcome_hierarchy=design.hierarchy)
+    return door, data, door.assign_outcomes(data, outcome_column='outcome')
+
+
+@benchmark("door.assign_outcomes", DOOR_SIZES, DOOR_QUICK)
+def bench_door_assign(n):
+    """DOORAnalysis.assign_outcomes on n patients."""
+    door, data, _ = _door_trial(n)
+    return lambda: door.assign_outcomes(data, outcome_column='outcome')
+
+
+@benchmark("door.compare_treatments", DOOR_SIZES, DOOR_QUICK)
+def bench_door_compare(n):
+    """DOORAnalysis.compare_treatments on n patients."""
+    door, _, assigned = _door_trial(n)
+    return lambda: door.compare_treatments(assigned, 'arm', 'Drug A', 'Placebo')
+
+
+@benchmark("door.get_outcome_distribution", DOOR_SIZES, DOOR_QUICK)
+def bench_door_distribution(n):
+    """DOORAnalysis.get_outcome_distribution on n patients."""
+    door, _, assigned = _door_trial(n)
+    return lambda: door.get_outcome_distribution(assigned, 'arm')
+
+
+# =============================================================================
+# MCDA BENCHMARKS
+# =============================================================================
+
+def _mcda_problem(n_alternatives: int, n_criteria: int, seed: int = 0):
+    """Random performance table with alternating benefit/risk criteria."""
+    import numpy as np
+    import pandas as pd
+    from mcda_analysis import MCDAAnalysis
+
+    rng = np.random.default_rng(seed)
+    criteria = {
+        f"C{j:02d}": {'category': 'Benefit' if j % 2 == 0 else 'Risk',
+                      'direction': 'higher_better' if j % 2 == 0 else 'lower_better'}
+        for j in range(n_criteria)
+    }
+    raw = pd.DataFrame(rng.uniform(0, 100, (n_alternatives, n_criteria)), columns=list(criteria))
+    raw.insert(0, 'Treatment', [f"A{i}" for i in range(n_alternatives)])
+    swing_points = dict(zip(criteria, rng.uniform(10, 100, n_criteria)))
+    return MCDAAnalysis(criteria), raw, swing_points
+
+
+def _shape(param: str):
+    n_alternatives, n_criteria = (int(v) for v in param.split('x'))
+    return n_alternatives, n_criteria
+
+
+@benchmark("mcda.score", ["10x5", "1000x10", "100000x20", "1000000x50"], ["10x5", "1000x10"])
+def bench_mcda_score(param):
+    """MCDAAnalysis.score on alternatives x criteria."""
+    mcda, raw, _ = _mcda_problem(*_shape(param))
+    return lambda: mcda.score(raw)
+
+
+@benchmark("mcda.run_scenarios", ["10x5", "100x10", "1000x20", "10000x20"], ["10x5", "100x10"])
+def bench_mcda_scenarios(param):
+    """MCDAAnalysis.run_scenarios over 1,000 respondent weight sets."""
+    from mcda_analysis import simulate_respondent_weights
+
+    mcda, raw, swing_points = _mcda_problem(*_shape(param))
+    scored = mcda.score(raw)
+    weights = simulate_respondent_weights(swing_points, n_respondents=1000)
+    return lambda: mcda.run_scenarios(scored, weights)
+
+
+@benchmark("mcda.pareto_front", ["100x5", "10000x5", "100000x3"], ["100x5"])
+def bench_mcda_pareto(param):
+    """MCDAAnalysis.pareto_front on alternatives x criteria."""
+    mcda, raw, _ = _mcda_problem(*_shape(param))
+    scored = mcda.score(raw)
+    return lambda: mcda.pareto_front(scored)
+
+
+# =============================================================================
+# VISUALIZATION BENCHMARKS
+# =============================================================================
+
+@benchmark("forest.render_png", [10, 100, 500], [10])
+def bench_forest_render(n_rows):
+    """Build and save one n-row forest plot to PNG."""
+    import matplotlib.pyplot as plt
+    from forest_plot import create_example_data, forest_plot
+
+    table = create_example_data(n_outcomes=n_rows, n_subgroups=1)['Subgroup 01']
+
+    def run():
+        fig = forest_plot(table)
+        fig.savefig(io.BytesIO(), format='png', dpi=100)
+        plt.close(fig)
+    return run
+
+
+@benchmark("heatmap.render_png", ["100x10", "500x60"], ["100x10"])
+def bench_heatmap_render(param):
+    """Cluster, build and save one rows x columns heatmap to PNG."""
+    import matplotlib.pyplot as plt
+    from heatmap import create_example_data, heatmap
+
+    n_rows, n_cols = _shape(param)
+    matrix = create_example_data(n_outcomes=n_rows, n_subgroups=n_cols)
+
+    def run():
+        fig = heatmap(matrix, cluster_rows=True, cluster_columns=True)
+        fig.savefig(io.BytesIO(), format='png', dpi=100)
+        plt.close(fig)
+    return run
+
+
+# =============================================================================
+# QA BENCHMARKS
+# =============================================================================
+
+def _build_corpus(root: Path, n_pages: int) -> Path:
+    """Copy the real docs tree and add n_pages synthetic pages."""
+    for name in ("docs", "notebooks", "templates"):
+        shutil.copytree(REPO_ROOT / name, root / name)
+    shutil.copy(REPO_ROOT / "mkdocs.yml", root / "mkdocs.yml")
+
+    modules = sorted(p.name for p in (REPO_ROOT / "docs" / "modules").glob("*.md"))
+    generated = root / "docs" / "generated"
+    generated.mkdir()
+    for i in range(n_pages):
+        module = modules[i % len(modules)]
+        body = "\n\n".join(
+            f"## Section {s}\n\nThe DOOR and MCDA methods, the Effects Table and the "
+            f"NNT are covered in [module {s}](../modules/{module}) and "
+            f"[page {(i + s) % n_pages}](page_{(i + s) % n_pages:05d}.md). "
+            f"See [CIOMS](https://cioms.ch/) for guidance."
+            for s in range(10)
+        )
+        (generated / f"page_{i:05d}.md").write_text(
+            f"# Generated page {i}\n\n{body}\n\n"
+            f"*Educational use only.* NexVigilant | Empowerment Through Vigilance\n",
+            encoding='utf-8')
+    return root
+
+
+@lru_cache(maxsize=1)
+def _corpus(n_pages: int) -> Path:
+    root = Path(tempfile.mkdtemp(prefix=f"qa_corpus_{n_pages}_"))
+    atexit.register(shutil.rmtree, root, ignore_errors=True)
+    return _build_corpus(root, n_pages)
+
+
+def _point_qa_suite_at(root: Path):
+    """Redirect qa_suite's path constants to a corpus root."""
+    import qa_suite
+
+    qa_suite.REPO_ROOT = root
+    qa_suite.DOCS_DIR = root / "docs"
+    qa_suite.NOTEBOOKS_DIR = root / "notebooks"
+    qa_suite.TEMPLATES_DIR = root / "templates"
+    qa_suite.MODULES_DIR = root / "docs" / "modules"
+    return qa_suite
+
+
+@benchmark("qa.run_checks", [0, 100, 1000, 5000], [0, 100])
+def bench_qa_run_checks(n_pages):
+    """qa_suite.run_checks on the docs plus n synthetic pages."""
+    qa_suite = _point_qa_suite_at(_corpus(n_pages))
+    return lambda: qa_suite.run_checks()
+
+
+@benchmark("qa.run_checks_cached", [0, 100, 1000, 5000], [0, 100])
+def bench_qa_run_checks_cached(n_pages):
+    """qa_suite.run_checks on an unchanged corpus with a warm result cache."""
+    root = _corpus(n_pages)
+    qa_suite = _point_qa_suite_at(root)
+    cache = qa_suite.ResultCache(root)
+    qa_suite.run_checks(index=qa_suite.DocumentIndex(cache))
+    cache.save()
+    return lambda: qa_suite.run_checks(index=qa_suite.DocumentIndex(qa_suite.ResultCache(root)))
+
+
+@benchmark("qa.watch_update", [0, 100, 1000, 5000], [0, 100])
+def bench_qa_watch_update(n_pages):
+    """qa_watch.QAWatcher.apply after one module page is saved."""
+    _point_qa_suite_at(_corpus(n_pages))
+    from qa_watch import QAWatcher
+
+    watcher = QAWatcher(jobs=1)
+    watcher.start()
+    page = watcher.index.modules_dir / "02-foundation.md"
+    texts = [page.read_text(encoding='utf-8') + suffix for suffix in ("\n", "\n\n")]
+    edits = itertools.cycle(texts)
+
+    def save_and_update():
+        page.write_text(next(edits), encoding='utf-8')
+        return watcher.apply([(page, "modified")])
+    return save_and_update
+
+
+# =============================================================================
+# TIMING AND HISTORY
+# =============================================================================
+
+def time_callable(func: Callable[[], object], repeat: int, min_time: float) -> Dict[str, float]:
+    """
+    Time a callable.
+
+    One warm-up call is made, then at least `repeat` timed calls, continuing
+    until `min_time` seconds have been spent (capped at 10 x repeat calls).
+    """
+    func()
+    times: List[float] = []
+    while len(times) < repeat or (sum(times) < min_time and len(times) < 10 * repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.fmean(times),
+        'repeats': len(times),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _environment() -> Dict[str, str]:
+    import numpy
+    import pandas
+
+    return {
+        'python': platform.python_version(),
+        'numpy': numpy.__version__,
+        'pandas': pandas.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+    }
+
+
+def load_history(path: Path) -> Dict[str, list]:
+    if not path.exists():
+        return {'runs': []}
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def save_history(history: Dict[str, list], path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(history, indent=2), encoding='utf-8')
+
+
+def run_benchmarks(pattern: Optional[str] = None,
+                   quick: bool = False,
+                   repeat: int = 5,
+                   min_time: float = 0.2,
+                   label: Optional[str] = None) -> Dict[str, object]:
+    """
+    Run the registered benchmarks.
+
+    Args:
+        pattern: Regular expression selecting benchmark names
+        quick: Use the small quick-mode parameter sets
+        repeat: Minimum timed calls per benchmark
+        min_time: Minimum total seconds per benchmark
+        label: Optional run label (e.g. branch name)
+
+    Returns:
+        Run record with environment and per-benchmark timings
+    """
+    results = {}
+    for bench in BENCHMARKS.values():
+        if pattern and not re.search(pattern, bench.name):
+            continue
+        for param in (bench.quick_params if quick else bench.params):
+            func = bench.setup(param)
+            timing = time_callable(func, repeat, min_time)
+            results[bench.key(param)] = timing
+            print(f"  {bench.key(param):<45} {_format_seconds(timing['min']):>10}"
+                  f"  (median {_format_seconds(timing['median'])}, n={timing['repeats']})")
+
+    return {
+        'id': datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ'),
+        'label': label,
+        'commit': _git_commit(),
+        'quick': quick,
+        'environment': _environment(),
+        'results': results,
+    }
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
+
+
+def find_run(history: Dict[str, list], ref: str) -> dict:
+    """
+    Find a run by negative index ('-1' is latest), id, label or commit prefix.
+    """
+    runs = history['runs']
+    if not runs:
+        raise ValueError("Benchmark history is empty")
+    if re.fullmatch(r'-\d+', ref):
+        index = int(ref)
+        if -index > len(runs):
+            raise ValueError(f"Only {len(runs)} runs in history")
+        return runs[index]
+    for run in reversed(runs):
+        if ref in (run['id'], run.get('label')) or (run.get('commit') or '').startswith(ref):
+            return run
+    raise ValueError(f"No run matches '{ref}'")
+
+
+def compare_runs(base: dict, head: dict, threshold: float = DEFAULT_THRESHOLD) -> List[dict]:
+    """
+    Compare best-of-repeats timings of two runs.
+
+    Returns:
+        One row per benchmark in both runs with the head/base ratio and a
+        status of 'regression', 'improvement' or 'ok'
+    """
+    rows = []
+    for key, head_timing in head['results'].items():
+        base_timing = base['results'].get(key)
+        if base_timing is None:
+            continue
+        ratio = head_timing['min'] / base_timing['min']
+        if ratio > 1 + threshold:
+            status = 'regression'
+        elif ratio < 1 / (1 + threshold):
+            status = 'improvement'
+        else:
+            status = 'ok'
+        rows.append({'benchmark': key, 'base': base_timing['min'],
+                     'head': head_timing['min'], 'ratio': ratio, 'status': status})
+    return rows
+
+
+def print_comparison(base: dict, head: dict, rows: List[dict], threshold: float):
+    print("\n" + "=" * 78)
+    print("NEXVIGILANT B-R TOOLKIT BENCHMARK COMPARISON")
+    print("=" * 78)
+    print(f"Base: {base['id']} ({base.get('label') or base.get('commit') or '-'})")
+    print(f"Head: {head['id']} ({head.get('label') or head.get('commit') or '-'})")
+    if base['environment'].get('platform') != head['environment'].get('platform'):
+        print("Note: runs come from different platforms")
+    print()
+
+    marks = {'regression': '❌ slower', 'improvement': '✅ faster', 'ok': ''}
+    for row in rows:
+        print(f"  {row['benchmark']:<45} {_format_seconds(row['base']):>10} -> "
+              f"{_format_seconds(row['head']):>10}  x{row['ratio']:.2f}  {marks[row['status']]}")
+
+    regressions = sum(row['status'] == 'regression' for row in rows)
+    print("\n" + "-" * 78)
+    print(f"SUMMARY: {len(rows)} benchmarks compared, {regressions} regressions "
+          f"(threshold {threshold:.0%})")
+    print("-" * 78)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="NexVigilant B-R Toolkit Benchmark Suite",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python benchmarks.py run --quick
+    python benchmarks.py run -k "door|mcda.score" --label my-branch
+    python benchmarks.py compare --base my-branch --head -1
+
+Educational Use Only - NexVigilant | Empowerment Through Vigilance
+        """
+    )
+    parser.add_argument('--history', type=Path, default=HISTORY_PATH,
+                        help=f"History file (default: {HISTORY_PATH.relative_to(REPO_ROOT)})")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="Run benchmarks and append to history")
+    run.add_argument('-k', dest='pattern', help="Regular expression selecting benchmarks")
+    run.add_argument('--quick', action='store_true', help="Small sizes only")
+    run.add_argument('--repeat', type=int, default=5, help="Minimum timed calls")
+    run.add_argument('--min-time', type=float, default=0.2,
+                     help="Minimum seconds spent timing each benchmark")
+    run.add_argument('--label', help="Label stored with the run")
+    run.add_argument('--no-save', action='store_true', help="Do not write to history")
+    run.add_argument('--compare', action='store_true',
+                     help="Compare against the previous run afterwards")
+    run.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+
+    compare = commands.add_parser('compare', help="Compare two runs from history")
+    compare.add_argument('--base', default='-2', help="Base run (default: -2)")
+    compare.add_argument('--head', default='-1', help="Head run (default: -1, latest)")
+    compare.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                         help="Relative slow-down flagged as a regression")
+
+    commands.add_parser('list', help="List registered benchmarks")
+
+    args = parser.parse_args()
+    history = load_history(args.history)
+
+    if args.command == 'list':
+        for bench in BENCHMARKS.values():
+            print(f"{bench.name:<32} {bench.description}")
+            print(f"{'':<32} params: {bench.params}")
+        return
+
+    if args.command == 'run':
+        print("NexVigilant B-R Toolkit Benchmarks")
+        print("-" * 40)
+        record = run_benchmarks(args.pattern, args.quick, args.repeat, args.min_time, args.label)
+        if not args.no_save:
+            history['runs'].append(record)
+            save_history(history, args.history)
+            print(f"\nSaved run {record['id']} to {args.history}")
+        if not args.compare:
+            return
+        base_ref, head = '-2' if not args.no_save else '-1', record
+    else:
+        base_ref, head = args.base, None
+
+    try:
+        base = find_run(history, base_ref)
+        head = head or find_run(history, args.head)
+    except ValueError as e:
+        print(f"Cannot compare: {e}")
+        sys.exit(2)
+
+    rows = compare_runs(base, head, args.threshold)
+    print_comparison(base, head, rows, args.threshold)
+    sys.exit(1 if any(row['status'] == 'regression' for row in rows) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+"""
+NexVigilant Documentation Link Graph
+
+One in-memory directed graph of the documentation site:
+1. Nodes are docs pages, with the anchors each page defines
+2. Edges are markdown links between pages, links to other repository
+   files (notebooks, templates), mkdocs.yml nav entries, and GitHub/Colab
+   URLs that point back into this repository
+3. Link checks are queries over the graph: broken edges, missing anchors,
+   pages unreachable from the nav, and cycles in "next module" navigation
+
+Pages are parsed independently (parse_page), so the graph is updated one
+file at a time when pages change, are added or are deleted, and queries
+never re-read the tree.
+
+Usage:
+    python doc_graph.py                 # Summary and problems for this repo
+    python doc_graph.py --orphans       # List pages unreachable from the nav
+
+Educational Use Only:
+    NexVigilant | Empowerment Through Vigilance
+"""
+
+import argparse
+import os
+import posixpath
+import re
+import sys
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+REPO_ROOT = Path(__file__).parent.parent
+
+LINK_PATTERN = re.compile(r'\[([^\]]*)\]\(([^)]+)\)')
+FENCE_PATTERN = re.compile(r'^\s*(```|~~~)')
+ATX_HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+ATTR_ID_PATTERN = re.compile(r'\{[^}]*#([\w-]+)[^}]*\}\s*$')
+HTML_ID_PATTERN = re.compile(r'<[^>]+\b(?:id|name)\s*=\s*["\']([^"\']+)["\']')
+EXTERNAL_PREFIXES = ('http://', 'https://', 'mailto:', 'ftp://', 'tel:')
+
+# Modules whose "Continue to ... →" links form the next-module chain
+MODULES_PREFIX = "docs/modules/"
+NEXT_MARKER = "→"
+
+
+@dataclass(frozen=True)
+class Edge:
+    """
+    A link from a page (or mkdocs.yml) to a repository path.
+
+    Attributes:
+        source: Repo-relative path of the linking file
+        target: Repo-relative path linked to ("" for a same-page anchor)
+        anchor: Fragment without '#', or ""
+        kind: "link" (relative markdown link), "repo" (GitHub/Colab URL to
+              a file in this repository) or "nav" (mkdocs.yml nav entry)
+        text: Link text or nav title
+        raw: Link target as written
+    """
+    source: str
+    target: str
+    anchor: str
+    kind: str
+    text: str
+    raw: str
+
+
+# =============================================================================
+# PARSING
+# =============================================================================
+
+def slugify(text: str) -> str:
+    """Heading id as generated by Python-Markdown's toc extension."""
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    text = re.sub(r'[^\w\s-]', '', text).strip().lower()
+    return re.sub(r'[-\s]+', '-', text)
+
+
+def _heading_text(markdown: str) -> str:
+    """Visible text of a heading, as the toc extension sees it after rendering."""
+    text = ATTR_ID_PATTERN.sub('', markdown)
+    text = re.sub(r'\{[^}]*\}\s*$', '', text)                 # Other attribute lists
+    text = re.sub(r'!?\[([^\]]*)\]\([^)]*\)', r'\1', text)     # Links and images
+    text = re.sub(r'<[^>]+>', '', text)                        # Inline HTML
+    text = re.sub(r':[a-z0-9_+-]+:', '', text)                 # Emoji shortcodes
+    text = text.replace('&amp;', '&')
+    return re.sub(r'[*`]', '', text)
+
+
+def parse_page(text: str) -> dict:
+    """
+    Links and anchors of one markdown page.
+
+    Links are taken from the whole text, as mkdocs' own link validation
+    does; headings inside fenced code blocks are not anchors.
+
+    Returns:
+        {"links": [[text, target], ...], "anchors": [id, ...]} - JSON
+        types only, so results can be cached per file
+    """
+    anchors: List[str] = []
+    used: Set[str] = set()
+    in_fence = False
+    for line in text.splitlines():
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        heading = ATX_HEADING_PATTERN.match(line)
+        if heading:
+            explicit = ATTR_ID_PATTERN.search(heading.group(2))
+            anchor = explicit.group(1) if explicit else slugify(_heading_text(heading.group(2)))
+            # toc de-duplicates repeated headings as id, id_1, id_2, ...
+            unique, n = anchor, 0
+            while unique in used:
+                n += 1
+                unique = f"{anchor}_{n}"
+            used.add(unique)
+            anchors.append(unique)
+        for match in HTML_ID_PATTERN.finditer(line):
+            anchors.append(match.group(1))
+        explicit = ATTR_ID_PATTERN.search(line)
+        if explicit and not heading:
+            anchors.append(explicit.group(1))
+    return {"links": [list(link) for link in LINK_PATTERN.findall(text)], "anchors": anchors}
+
+
+@lru_cache(maxsize=1)
+def _mkdocs_loader():
+    """SafeLoader that reads mkdocs' !!python/name and !ENV tags as plain values."""
+    import yaml
+
+    class MkDocsLoader(yaml.SafeLoader):
+        pass
+
+    MkDocsLoader.add_multi_constructor(
+        "tag:yaml.org,2002:python/", lambda loader, suffix, node: None)
+    MkDocsLoader.add_multi_constructor(
+        "!", lambda loader, suffix, node: (loader.construct_scalar(node)
+                                           if isinstance(node, yaml.ScalarNode) else None))
+    return MkDocsLoader
+
+
+def load_mkdocs_config(text: str) -> dict:
+    """
+    Parse mkdocs.yml. PyYAML is imported on first use, so the rest of this
+    module (and qa_suite checks that never read mkdocs.yml) needs only the
+    standard library.
+
+    Raises:
+        ValueError: If the file is not valid YAML or not a mapping
+    """
+    import yaml
+
+    try:
+        config = yaml.load(text, Loader=_mkdocs_loader())
+    except yaml.YAMLError as e:
+        raise ValueError(f"invalid YAML: {e}") from e
+    if not isinstance(config, dict):
+        raise ValueError("mkdocs.yml is not a mapping")
+    return config
+
+
+def nav_entries(nav) -> List[Tuple[str, str]]:
+    """(title, path) of every page in an mkdocs nav tree, in nav order."""
+    entries = []
+
+    def walk(item, title=""):
+        if isinstance(item, str):
+            entries.append((title, item))
+        elif isinstance(item, list):
+            for child in item:
+                walk(child)
+        elif isinstance(item, dict):
+            for key, value in item.items():
+                walk(value, str(key))
+
+    walk(nav or [])
+    return entries
+
+
+# =============================================================================
+# GRAPH
+# =============================================================================
+
+class DocGraph:
+    """
+    Directed link graph of a documentation tree.
+
+    Args:
+        root: Repository root; all node names are POSIX paths relative to it
+        docs_dir: Directory mkdocs serves (absolute links resolve here)
+        exists: Existence test for the filesystem path of a non-page target
+                (default os.path.exists); memoize it for large trees
+        repo_url: GitHub URL of this repository; links to files in it
+                  (including Colab links to its notebooks) become "repo" edges
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        docs_dir: Path,
+        exists: Optional[Callable[[str], bool]] = None,
+        repo_url: Optional[str] = None
+    ):
+        self.root = Path(root)
+        self.docs_prefix = Path(docs_dir).relative_to(self.root).as_posix()
+        self._exists = exists or os.path.exists
+        self._repo_pattern = None
+        self.set_repo_url(repo_url)
+        self.pages: Dict[str, List[str]] = {}       # page -> anchors, in insertion order
+        self._out: Dict[str, List[Edge]] = {}       # source -> edges, in link order
+        # source -> kind -> edges, and source -> links with an anchor, so
+        # queries about one kind of edge skip the others
+        self._by_kind: Dict[str, Dict[str, List[Edge]]] = {}
+        self._anchored: Dict[str, List[Edge]] = {}
+        self._reachable: Optional[Set[str]] = None  # Until pages or link targets change
+        # target -> {source: edge count}; edges are found again through _out
+        self._in: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self._resolved: Dict[Tuple[str, str], str] = {}
+        self.nav: List[Edge] = []
+
+    def set_repo_url(self, repo_url: Optional[str]):
+        """Recognise links back into this repository (GitHub blob/raw, Colab)."""
+        if not repo_url:
+            self._repo_pattern = None
+            return
+        slug = re.escape(re.sub(r'^https?://github\.com/', '', repo_url.rstrip('/')))
+        self._repo_pattern = re.compile(
+            rf'^https?://(?:github\.com/{slug}/(?:blob|raw|tree)|'
+            rf'colab\.research\.google\.com/github/{slug}/blob)/[^/]+/([^?#]+)')
+
+    # -------------------------------------------------------------------------
+    # Incremental updates
+    # -------------------------------------------------------------------------
+
+    def set_page(self, page: str, record: dict):
+        """Add or replace a page from its parse_page() record."""
+        base = posixpath.dirname(page)
+        edges = [edge for text, raw in record["links"]
+                 for edge in [self._edge(page, base, text, raw)] if edge is not None]
+        if page not in self.pages or \
+                [edge.target for edge in edges] != [edge.target for edge in self._out[page]]:
+            self._reachable = None
+        self._unlink(self._out.get(page, []))
+        self.pages[page] = list(record["anchors"])
+        self._out[page] = edges
+        by_kind: Dict[str, List[Edge]] = {}
+        for edge in edges:
+            by_kind.setdefault(edge.kind, []).append(edge)
+        self._by_kind[page] = by_kind
+        self._anchored[page] = [edge for edge in edges if edge.anchor]
+        self._link(edges)
+
+    def remove_page(self, page: str):
+        """Drop a page and its outgoing links (links to it become broken)."""
+        if page in self.pages:
+            self._reachable = None
+        self.pages.pop(page, None)
+        self._by_kind.pop(page, None)
+        self._anchored.pop(page, None)
+        self._unlink(self._out.pop(page, []))
+
+    def update(self, path: Path):
+        """Re-read one page after it changed, or drop it if it was deleted."""
+        page = Path(path).resolve().relative_to(self.root.resolve()).as_posix()
+        if Path(path).exists():
+            self.set_page(page, parse_page(Path(path).read_text(encoding='utf-8')))
+        else:
+            self.remove_page(page)
+
+    def set_nav(self, entries: Iterable[Tuple[str, str]]):
+        """Replace the nav edges from (title, docs-relative path) pairs."""
+        self._unlink(self.nav)
+        self._reachable = None
+        self.nav = []
+        for title, raw in entries:
+            if raw.startswith(EXTERNAL_PREFIXES):
+                continue
+            path, _, anchor = raw.partition('#')
+            edge = Edge("mkdocs.yml", posixpath.normpath(posixpath.join(self.docs_prefix, path)),
+                        anchor, "nav", title, raw)
+            self.nav.append(edge)
+        self._link(self.nav)
+
+    def _link(self, edges: List[Edge]):
+        for edge in edges:
+            sources = self._in[edge.target]
+            sources[edge.source] = sources.get(edge.source, 0) + 1
+
+    def _unlink(self, edges: List[Edge]):
+        for edge in edges:
+            sources = self._in[edge.target]
+            sources[edge.source] -= 1
+            if not sources[edge.source]:
+                del sources[edge.source]
+
+    def _edge(self, page: str, base: str, text: str, raw: str) -> Optional[Edge]:
+        if raw.startswith(EXTERNAL_PREFIXES):
+            match = self._repo_pattern.match(raw) if self._repo_pattern else None
+            if match is None:
+                return None
+            return Edge(page, posixpath.normpath(match.group(1)), "", "repo", text, raw)
+        path, _, anchor = raw.partition('#')
+        if not path:
+            return Edge(page, "", anchor, "link", text, raw)
+        # Pages link to the same few targets, so each is resolved once
+        target = self._resolved.get((base, path))
+        if target is None:
+            target = self._resolved[base, path] = self._resolve(base, path)
+        return Edge(page, target, anchor, "link", text, raw)
+
+    def _resolve(self, base: str, path: str) -> str:
+        # Drop a link title (page.md "Title") and query string
+        if ' ' in path:
+            path = re.sub(r'\s+(["\']).*\1$', '', path)
+        path = path.split('?')[0]
+        if path.startswith('/'):
+            return posixpath.normpath(posixpath.join(self.docs_prefix, path.lstrip('/')))
+        return posixpath.normpath(posixpath.join(base, path))
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def edges(self, kinds: Iterable[str] = ("link",)) -> List[Edge]:
+        """Edges of the given kinds: pages in insertion order, then kind, then link order."""
+        kinds = tuple(kinds)
+        found = [edge for by_kind in self._by_kind.values()
+                 for kind in kinds for edge in by_kind.get(kind, ())]
+        return found + (self.nav if "nav" in kinds else [])
+
+    def outgoing(self, page: str) -> List[Edge]:
+        """Edges from a page, in link order."""
+        return list(self._out.get(page, ()))
+
+    def count(self, kinds: Iterable[str] = ("link",)) -> int:
+        """Number of edges of the given kinds."""
+        kinds = tuple(kinds)
+        return sum(len(by_kind.get(kind, ())) for by_kind in self._by_kind.values()
+                   for kind in kinds) + (len(self.nav) if "nav" in kinds else 0)
+
+    def incoming(self, target: str) -> Set[Edge]:
+        """Edges pointing at a path."""
+        return {edge for source in self._in.get(target, ())
+                for edge in (self.nav if source == "mkdocs.yml" else self._out[source])
+                if edge.target == target}
+
+    def exists(self, target: str) -> bool:
+        return target in self.pages or self._exists(os.path.join(self.root, target))
+
+    def broken_edges(self, kinds: Iterable[str] = ("link", "repo", "nav")) -> List[Edge]:
+        """Edges whose target file does not exist."""
+        return [edge for edge in self.edges(kinds)
+                if edge.target and not self.exists(edge.target)]
+
+    def missing_anchors(self) -> List[Edge]:
+        """Links to an anchor the target page does not define."""
+        missing = []
+        anchored = [edge for edges in self._anchored.values() for edge in edges]
+        for edge in anchored + [edge for edge in self.nav if edge.anchor]:
+            target = edge.target or edge.source
+            anchors = self.pages.get(target)
+            if anchors is not None and edge.anchor not in anchors:
+                missing.append(edge)
+        return missing
+
+    def reachable(self) -> Set[str]:
+        """Pages reachable from the nav by following links."""
+        if self._reachable is not None:
+            return set(self._reachable)
+        seen: Set[str] = set()
+        stack = [edge.target for edge in self.nav if edge.target in self.pages]
+        while stack:
+            page = stack.pop()
+            if page in seen:
+                continue
+            seen.add(page)
+            stack.extend(edge.target for edge in self._out.get(page, ())
+                         if edge.target in self.pages and edge.target not in seen)
+        self._reachable = seen
+        return set(seen)
+
+    def orphans(self) -> List[str]:
+        """Pages that cannot be reached from the nav."""
+        reachable = self.reachable()
+        return [page for page in self.pages if page not in reachable]
+
+    def next_edges(self) -> List[Edge]:
+        """"Next module" links: forward (→) links from one module page to another."""
+        return [edge for page, by_kind in self._by_kind.items() if page.startswith(MODULES_PREFIX)
+                for edge in by_kind.get("link", ())
+                if NEXT_MARKER in edge.text and edge.target.startswith(MODULES_PREFIX)
+                and edge.target in self.pages]
+
+    def next_cycles(self) -> List[List[str]]:
+        """Cycles in next-module navigation, each listed from its first page."""
+        following = defaultdict(list)
+        for edge in self.next_edges():
+            following[edge.source].append(edge.target)
+
+        cycles, state, path = [], {}, []
+
+        def visit(page):
+            state[page] = "active"
+            path.append(page)
+            for nxt in following[page]:
+                if state.get(nxt) == "active":
+                    cycles.append(path[path.index(nxt):] + [nxt])
+                elif nxt not in state:
+                    visit(nxt)
+            path.pop()
+            state[page] = "done"
+
+        for page in list(following):
+            if page not in state:
+                visit(page)
+        return cycles
+
+
+def build_graph(root: Path = REPO_ROOT) -> DocGraph:
+    """Graph of a repository's docs/ tree and mkdocs.yml nav."""
+    config = load_mkdocs_config((root / "mkdocs.yml").read_text(encoding='utf-8'))
+    docs_dir = root / config.get("docs_dir", "docs")
+    graph = DocGraph(root, docs_dir, repo_url=config.get("repo_url"))
+    for path in sorted(docs_dir.glob("**/*.md")):
+        graph.set_page(path.relative_to(root).as_posix(),
+                       parse_page(path.read_text(encoding='utf-8')))
+    graph.set_nav(nav_entries(config.get("nav")))
+    return graph
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Summarise the documentation link graph",
+        epilog="Educational Use Only - NexVigilant | Empowerment Through Vigilance"
+    )
+    parser.add_argument('--orphans', action='store_true', help="Only list orphan pages")
+    args = parser.parse_args()
+
+    graph = build_graph()
+    if args.orphans:
+        for page in graph.orphans():
+            print(page)
+        return
+
+    print("=" * 70)
+    print("NEXVIGILANT DOCUMENTATION LINK GRAPH")
+    print("=" * 70)
+    print(f"{len(graph.pages)} pages, {len(graph.edges(('link',)))} links, "
+          f"{len(graph.edges(('repo',)))} repository URLs, {len(graph.nav)} nav entries")
+
+    problems = (
+        [f"broken: {e.source} -> {e.raw}" for e in graph.broken_edges()] +
+        [f"missing anchor: {e.source} -> {e.raw}" for e in graph.missing_anchors()] +
+        [f"orphan: {page}" for page in graph.orphans()] +
+        [f"next-module cycle: {' → '.join(cycle)}" for cycle in graph.next_cycles()]
+    )
+    for problem in problems:
+        print(f"  - {problem}")
+    print(f"\n{len(problems)} problems")
+    sys.exit(0 if not problems else 1)
+
+
+if __name__ == "__main__":
+    main()
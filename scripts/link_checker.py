@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+NexVigilant External Link Checker
+
+Checks that external http(s) links are reachable:
+1. Deduplicates URLs (fragments are never sent, so they are dropped)
+2. Sends HEAD requests, falling back to GET for servers that reject HEAD
+3. Keeps one pool of keep-alive connections per host, with a per-host
+   and an overall concurrency limit
+4. Retries timeouts, connection errors, 429 and 5xx with exponential
+   backoff (honouring Retry-After)
+5. Caches results on disk with a TTL so repeated runs do not hit the same
+   hosts again
+
+Built on asyncio streams only, so it has no dependencies beyond the
+standard library and can be tested against a local http.server.
+
+Usage:
+    python link_checker.py https://cioms.ch/ https://www.ema.europa.eu/
+    python link_checker.py --ttl 0 --per-host 1 URL ...   # Ignore cache, gentle
+
+Educational Use Only:
+    NexVigilant | Empowerment Through Vigilance
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import ssl
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urldefrag, urljoin, urlsplit
+
+
+# Default cache location relative to script location
+CACHE_PATH = Path(__file__).parent.parent / ".cache" / "external_links.json"
+CACHE_FORMAT = 1
+
+DEFAULT_TTL = 7 * 24 * 3600      # Reachable links are re-checked weekly
+FAILURE_TTL = 6 * 3600           # Broken links sooner, in case they were transient
+USER_AGENT = "NexVigilant-LinkChecker/1.0 (+https://nexvigilant.com)"
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 5
+MAX_RETRY_AFTER = 30.0           # Seconds; longer Retry-After values are capped
+MAX_HEADER_BYTES = 64 * 1024
+
+
+@dataclass
+class LinkStatus:
+    """Outcome of checking one URL."""
+    url: str
+    ok: bool
+    status: Optional[int] = None     # Final HTTP status, None if no response
+    error: Optional[str] = None      # Connection/timeout error, if any
+    checked_at: float = 0.0          # Time of the check (clock seconds)
+    cached: bool = False             # Taken from the on-disk cache
+
+    def describe(self) -> str:
+        return f"HTTP {self.status}" if self.status is not None else (self.error or "no response")
+
+
+class HTTPError(Exception):
+    """Malformed or unexpected HTTP response."""
+    pass
+
+
+@dataclass
+class _Response:
+    status: int
+    headers: Dict[str, str]
+    reusable: bool
+
+
+class _HostPool:
+    """Idle keep-alive connections to one (scheme, host, port) and its request limit."""
+
+    def __init__(self, limit: int):
+        self.semaphore = asyncio.Semaphore(limit)
+        self.idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+    def close(self):
+        for _, writer in self.idle:
+            writer.close()
+        self.idle.clear()
+
+
+class LinkChecker:
+    """
+    Concurrent reachability checker for external URLs.
+
+    Args:
+        cache_path: JSON file for cached results (None disables the cache)
+        ttl: Seconds a reachable result stays valid; broken results are kept
+             for at most FAILURE_TTL. 0 ignores existing entries.
+        concurrency: URLs checked at once overall
+        per_host: Simultaneous requests (and pooled connections) per host
+        timeout: Seconds allowed for connecting and for reading a response head
+        retries: Extra attempts after a timeout, connection error, 429 or 5xx
+        backoff: First retry delay in seconds; doubles on each retry
+        ssl_context: Context for https (default: system trust store)
+        clock: Time source for cache timestamps (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        cache_path: Optional[Path] = CACHE_PATH,
+        ttl: float = DEFAULT_TTL,
+        concurrency: int = 20,
+        per_host: int = 2,
+        timeout: float = 10.0,
+        retries: int = 2,
+        backoff: float = 0.5,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        if concurrency < 1 or per_host < 1:
+            raise ValueError("concurrency and per_host must be at least 1")
+        if retries < 0 or ttl < 0:
+            raise ValueError("retries and ttl must be non-negative")
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.ssl_context = ssl_context
+        self.clock = clock
+        self.requests = 0       # HTTP requests sent (HEAD, GET and redirect hops)
+        self.connections = 0    # TCP connections opened
+        self._cache: Dict[str, dict] = self._load_cache()
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Cache
+    # -------------------------------------------------------------------------
+
+    def _load_cache(self) -> Dict[str, dict]:
+        if self.cache_path is None:
+            return {}
+        try:
+            stored = json.loads(self.cache_path.read_text(encoding='utf-8'))
+            if stored.get("format") == CACHE_FORMAT:
+                return stored["urls"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return {}
+
+    def _fresh(self, entry: dict, now: float) -> bool:
+        ttl = self.ttl if entry["ok"] else min(self.ttl, FAILURE_TTL)
+        return now - entry["checked_at"] < ttl
+
+    def cached(self, url: str) -> Optional[LinkStatus]:
+        """Cached result for a URL if still within its TTL."""
+        entry = self._cache.get(url)
+        if entry is None or not self._fresh(entry, self.clock()):
+            return None
+        return LinkStatus(url=url, cached=True, **entry)
+
+    def save(self):
+        """Write the cache, dropping entries older than any default TTL would keep."""
+        if self.cache_path is None:
+            return
+        now = self.clock()
+        with self._lock:
+            # A short --ttl only decides what is re-checked; it should not
+            # discard results a later default run could still use
+            urls = {url: entry for url, entry in self._cache.items()
+                    if now - entry["checked_at"] < max(self.ttl, DEFAULT_TTL)}
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"format": CACHE_FORMAT, "urls": urls}, indent=1),
+                           encoding='utf-8')
+            os.replace(tmp, self.cache_path)
+
+    # -------------------------------------------------------------------------
+    # Checking
+    # -------------------------------------------------------------------------
+
+    def check(self, urls: Iterable[str]) -> Dict[str, LinkStatus]:
+        """
+        Check URLs, returning a status for every URL given.
+
+        Duplicates (including URLs differing only in #fragment) are
+        requested once. Fresh cached results are reused; new results are
+        added to the cache, which is saved before returning.
+        """
+        return asyncio.run(self.check_async(urls))
+
+    async def check_async(self, urls: Iterable[str]) -> Dict[str, LinkStatus]:
+        """Coroutine form of check() for callers already in an event loop."""
+        urls = list(urls)
+        targets = {url: urldefrag(url)[0] for url in urls}
+        results: Dict[str, LinkStatus] = {}
+        pending = []
+        for target in dict.fromkeys(targets.values()):
+            hit = self.cached(target) if self.ttl > 0 else None
+            if hit is not None:
+                results[target] = hit
+            else:
+                pending.append(target)
+
+        if pending:
+            pools: Dict[Tuple[str, str, int], _HostPool] = {}
+            limit = asyncio.Semaphore(self.concurrency)
+
+            async def run(target):
+                async with limit:
+                    return await self._check_url(target, pools)
+
+            try:
+                for status in await asyncio.gather(*(run(t) for t in pending)):
+                    results[status.url] = status
+                    with self._lock:
+                        self._cache[status.url] = {
+                            "ok": status.ok, "status": status.status,
+                            "error": status.error, "checked_at": status.checked_at}
+            finally:
+                for pool in pools.values():
+                    pool.close()
+            self.save()
+
+        statuses = {}
+        for url, target in targets.items():
+            status = results[target]
+            if url != target:
+                status = LinkStatus(**{**asdict(status), "url": url})
+            statuses[url] = status
+        return statuses
+
+    async def _check_url(self, url: str, pools) -> LinkStatus:
+        """HEAD (then GET) with retries; never raises for network failures or bad URLs."""
+        try:
+            parts = urlsplit(url)
+            parts.port  # Parsed lazily; raises for a port out of range
+        except ValueError as e:
+            return LinkStatus(url=url, ok=False, error=f"invalid URL: {e}",
+                              checked_at=self.clock())
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            return LinkStatus(url=url, ok=False, error="not an http(s) URL",
+                              checked_at=self.clock())
+
+        status, error = None, None
+        for attempt in range(self.retries + 1):
+            delay = self.backoff * 2 ** attempt
+            try:
+                response = await self._fetch("HEAD", url, pools)
+                if response.status >= 400 and response.status not in RETRY_STATUSES:
+                    # Some servers reject or mishandle HEAD; ask the way a browser would
+                    response = await self._fetch("GET", url, pools)
+                status, error = response.status, None
+                if status not in RETRY_STATUSES:
+                    break
+                retry_after = response.headers.get("retry-after", "")
+                if retry_after.isdigit():
+                    delay = min(float(retry_after), MAX_RETRY_AFTER)
+            except asyncio.TimeoutError:
+                status, error = None, f"timed out after {self.timeout:g}s"
+            except (OSError, HTTPError, asyncio.IncompleteReadError) as e:
+                status, error = None, f"{type(e).__name__}: {e}"
+            except ValueError as e:  # Malformed redirect target
+                status, error = None, f"invalid URL: {e}"
+            if attempt < self.retries:
+                await asyncio.sleep(delay)
+
+        return LinkStatus(url=url, ok=status is not None and status < 400,
+                          status=status, error=error, checked_at=self.clock())
+
+    async def _fetch(self, method: str, url: str, pools) -> _Response:
+        """One request, following redirects."""
+        for _ in range(MAX_REDIRECTS + 1):
+            response = await self._request(method, url, pools)
+            location = response.headers.get("location")
+            if response.status not in REDIRECT_STATUSES or not location:
+                return response
+            url = urljoin(url, location)
+            if urlsplit(url).scheme not in ("http", "https"):
+                raise HTTPError(f"redirect to non-http URL {url}")
+        raise HTTPError(f"more than {MAX_REDIRECTS} redirects")
+
+    async def _request(self, method: str, url: str, pools) -> _Response:
+        parts = urlsplit(url)
+        https = parts.scheme == "https"
+        host = parts.hostname
+        port = parts.port or (443 if https else 80)
+        key = (parts.scheme, host, port)
+        if key not in pools:
+            pools[key] = _HostPool(self.per_host)
+        pool = pools[key]
+
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        host_header = host if parts.port is None else f"{host}:{parts.port}"
+        request = (f"{method} {path} HTTP/1.1\r\nHost: {host_header}\r\n"
+                   f"User-Agent: {USER_AGENT}\r\nAccept: */*\r\n"
+                   f"Connection: keep-alive\r\n\r\n").encode("latin-1")
+
+        async with pool.semaphore:
+            while True:
+                reused = bool(pool.idle)
+                if reused:
+                    reader, writer = pool.idle.pop()
+                else:
+                    if https and self.ssl_context is None:
+                        self.ssl_context = ssl.create_default_context()
+                    ssl_arg = self.ssl_context if https else None
+                    reader, writer = await asyncio.wait_for(
+                        asyncio.open_connection(host, port, ssl=ssl_arg,
+                                                limit=MAX_HEADER_BYTES),
+                        self.timeout)
+                    self.connections += 1
+                try:
+                    self.requests += 1
+                    writer.write(request)
+                    await writer.drain()
+                    response = await asyncio.wait_for(_read_head(reader), self.timeout)
+                except (OSError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if reused:
+                        continue  # Server dropped an idle connection; open a fresh one
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                # A GET body is never read, so that connection cannot be reused
+                if response.reusable and method == "HEAD":
+                    pool.idle.append((reader, writer))
+                else:
+                    writer.close()
+                return response
+
+
+async def _read_head(reader: asyncio.StreamReader) -> _Response:
+    """Read a status line and headers, skipping interim 1xx responses."""
+    while True:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.LimitOverrunError:
+            raise HTTPError("response headers too large")
+        lines = head.decode("latin-1").split("\r\n")
+        fields = lines[0].split(None, 2)
+        if len(fields) < 2 or not fields[0].startswith("HTTP/") or not fields[1].isdigit():
+            raise HTTPError(f"bad status line {lines[0][:80]!r}")
+        status = int(fields[1])
+        if 100 <= status < 200:
+            continue
+        headers = {}
+        for line in lines[1:]:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+        connection = headers.get("connection", "").lower()
+        reusable = (fields[0] != "HTTP/1.0" or connection == "keep-alive") and connection != "close"
+        return _Response(status=status, headers=headers, reusable=reusable)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check that external links are reachable",
+        epilog="Educational Use Only - NexVigilant | Empowerment Through Vigilance"
+    )
+    parser.add_argument('urls', nargs='+', help="URLs to check")
+    parser.add_argument('--ttl', type=float, default=DEFAULT_TTL,
+                        help="Seconds cached results stay valid (0 = ignore cache)")
+    parser.add_argument('--concurrency', type=int, default=20, help="URLs checked at once")
+    parser.add_argument('--per-host', type=int, default=2, help="Simultaneous requests per host")
+    parser.add_argument('--timeout', type=float, default=10.0, help="Seconds per request")
+    parser.add_argument('--retries', type=int, default=2, help="Retries on transient failures")
+    args = parser.parse_args()
+
+    checker = LinkChecker(ttl=args.ttl, concurrency=args.concurrency, per_host=args.per_host,
+                          timeout=args.timeout, retries=args.retries)
+    results = checker.check(args.urls)
+
+    broken = 0
+    for url, status in results.items():
+        broken += not status.ok
+        mark = "OK  " if status.ok else "FAIL"
+        source = " (cached)" if status.cached else ""
+        print(f"{mark} {url} - {status.describe()}{source}")
+    print(f"\n{len(results)} URLs, {broken} broken, {checker.requests} requests")
+    sys.exit(0 if broken == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
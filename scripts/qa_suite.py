@@ -9,9 +9,13 @@ Usage:
     python qa_suite.py --check links      # Run specific check
     python qa_suite.py --verbose          # Detailed output
     python qa_suite.py --fix              # Auto-fix where possible
+    python qa_suite.py --jobs 4 --json    # Parallel checks, timings in JSON
+    python qa_suite.py --since main       # Re-check only files changed since a git ref
+    python qa_suite.py --no-cache         # Ignore the result cache
+    python qa_suite.py --watch            # Re-check affected files as they are saved
 
 Checks:
-    1. links       - Validate internal/external links
+    1. links       - Validate internal/external links and the link graph
     2. notebooks   - Validate notebook structure and execution
     3. templates   - Check template completeness
     4. branding    - Verify NexVigilant branding consistency
@@ -19,22 +23,50 @@ Checks:
     6. glossary    - Verify glossary term coverage
     7. structure   - Validate module structure
     8. references  - Cross-reference validation
+    9. urls        - External link reachability (network; only with --check urls)
+
+All checks read from one DocumentIndex built per run: every file is read
+once, and its term hits are extracted once, however many checks use them.
+Link, cross-reference and mkdocs.yml checks are queries over one
+DocGraph (doc_graph.py) of pages, anchors, links and nav entries.
+
+Per-file findings are cached in .cache/qa_suite.json keyed by path,
+content hash and check version. Later runs re-analyse only files that
+changed, or whose link targets appeared or disappeared, and produce the
+same report as a full run. Whole-graph queries are cached with a digest
+of every page, so an unchanged tree is checked without building the graph.
+
+With --watch (qa_watch.py) the index is kept between runs and only the
+checks that read the kinds of file saved are re-run; each save prints
+what changed in the results.
 
 Educational Use Only:
     NexVigilant | Empowerment Through Vigilance
 """
 
 import argparse
+import fnmatch
+import hashlib
 import io
 import json
 import os
+import posixpath
 import re
+import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, Iterable, List, Dict, Optional, Sequence, Set, Tuple
 from collections import defaultdict
 
+from doc_graph import DocGraph, load_mkdocs_config, nav_entries, parse_page
+from link_checker import LinkChecker
+from term_scanner import Term, TermScanner
+
 # Handle Windows console encoding
 if sys.platform == "win32":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
@@ -65,12 +97,19 @@ class CheckResult:
     message: str
     details: List[str] = field(default_factory=list)
     fixable: bool = False
+    duration: float = 0.0  # Wall time in seconds
+    files: int = 0         # Files examined by the check
 
 
 @dataclass
 class QAReport:
     """Overall QA report."""
     results: List[CheckResult] = field(default_factory=list)
+    cancelled: List[str] = field(default_factory=list)  # Checks skipped by --fail-fast
+    duration: float = 0.0
+    files_read: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
 
     @property
     def passed(self) -> int:
@@ -90,96 +129,731 @@ class QAReport:
 
 
 # =============================================================================
-# CHECK FUNCTIONS
+# DOCUMENT INDEX
 # =============================================================================
 
-def check_internal_links(verbose: bool = False) -> CheckResult:
-    """Check all internal markdown links are valid."""
-    issues = []
-    checked = 0
+MODULE_REF_PATTERN = re.compile(r'(\.\./)?(modules/)?(\d{2}-[a-z-]+\.md)')
+
+BRANDING = "NexVigilant"
+TAGLINE = "Empowerment Through Vigilance"
+
+DISCLAIMER_PHRASES = (
+    "educational purpose only",
+    "educational purposes only",
+    "educational use only",
+    "educational disclaimer",
+    "for learning purposes",
+)
+
+# Terms every glossary must define
+KEY_TERMS = (
+    "BRAD", "Effects Table", "Value Tree", "DOOR", "MCDA",
+    "NNT", "NNH", "CIOMS", "SBRF", "RMP", "REMS",
+    "Win Ratio", "ICH", "PrOACT-URL"
+)
+
+# Abbreviations that must be in the glossary if any page uses them
+ABBREVIATIONS = (
+    "ADR", "AE", "ARR", "BRA", "CHMP", "CI", "CTD", "DSUR", "EMA", "ETASU",
+    "FDA", "GVP", "HCP", "HR", "HTA", "ICER", "MACE", "MAH", "MedDRA", "NICE",
+    "OR", "PASS", "PBRER", "PDUFA", "PFDD", "PMDA", "PRAC", "PRIME", "PSUR",
+    "QALY", "RMM", "RR", "RRR", "SAE", "SmPC", "SUSAR", "TGA", "USPI", "WR",
+)
+
+
+def _capitalisations(phrase: str) -> Tuple[str, ...]:
+    """Phrase with each word's first letter in either case."""
+    spellings = [""]
+    for word in phrase.split():
+        spellings = [f"{s} {w}".strip() for s in spellings
+                     for w in (word[0].lower() + word[1:], word[0].upper() + word[1:])]
+    return tuple(spellings)
+
+
+# Everything the checks look for in document text, matched in one pass
+# per document (see term_scanner.py)
+CONTENT_TERMS = [
+    Term.of("branding", BRANDING, case_sensitive=True),
+    Term.of("tagline", TAGLINE, case_sensitive=True),
+    Term.of("disclaimer", *DISCLAIMER_PHRASES),
+    Term.of("educational"),
+    Term.of("nexvigilant"),
+    Term.of("learning_objectives", *_capitalisations("learning objectives"),
+            case_sensitive=True),
+    Term.of("key_takeaways", *_capitalisations("key takeaways"), case_sensitive=True),
+]
+GLOSSARY_TERMS = [Term.of(term, case_sensitive=True, whole_word=True) for term in KEY_TERMS] + [
+    Term.of(abbreviation, abbreviation, abbreviation + "s",
+            case_sensitive=True, whole_word=True)
+    for abbreviation in ABBREVIATIONS if abbreviation not in KEY_TERMS
+]
+TERM_SCANNER = TermScanner(CONTENT_TERMS + GLOSSARY_TERMS)
+
+# Structural patterns that are not plain phrases; searched separately
+TERM_PATTERNS = {
+    "navigation": re.compile(r"\[.*→.*\]\(.*\.md\)"),
+}
 
-    # Regex for markdown links: [text](path)
-    link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
 
-    for md_file in DOCS_DIR.rglob("*.md"):
-        content = md_file.read_text(encoding='utf-8')
+@dataclass
+class Document:
+    """
+    A markdown file read once per QA run.
+
+    Terms are extracted on first use and kept, so they are found at most
+    once per file however many checks use them. Links and anchors live in
+    the index's DocGraph.
+    """
+    path: Path
+    text: str
+    term_hits: Dict[str, bool] = field(default_factory=dict)
+
+    @cached_property
+    def terms(self) -> Set[str]:
+        """Names of the TERM_SCANNER terms present, found in one pass."""
+        return TERM_SCANNER.scan(self.text)
+
+    def has(self, term: str) -> bool:
+        """Whether a TERM_SCANNER term or TERM_PATTERNS pattern occurs in the document."""
+        if term not in TERM_PATTERNS:
+            return term in self.terms
+        if term not in self.term_hits:
+            self.term_hits[term] = TERM_PATTERNS[term].search(self.text) is not None
+        return self.term_hits[term]
+
+
+class DocumentIndex:
+    """
+    Every file the checks need, each read and parsed at most once.
+
+    Groups (docs, modules, templates, notebooks) are listed on first use
+    and files are read only when a check needs their content, so a file
+    whose findings come from the result cache is never opened. Loading is
+    guarded by a lock so checks can share the index across threads.
+
+    An index can outlive one run (watch mode): invalidate() forgets the
+    files that changed and updates the link graph page by page, so the
+    next run re-reads only those.
+    """
+
+    def __init__(self, cache: Optional["ResultCache"] = None):
+        self.repo_root = REPO_ROOT
+        self.docs_dir = DOCS_DIR
+        self.modules_dir = MODULES_DIR
+        self.templates_dir = TEMPLATES_DIR
+        self.notebooks_dir = NOTEBOOKS_DIR
+        self.cache = cache
+        self._bytes: Dict[Path, Optional[bytes]] = {}
+        self._documents: Dict[Path, Optional[Document]] = {}
+        self._exists: Dict[str, bool] = {}
+        self._groups: Dict[str, List[Path]] = {}
+        self._findings: Dict[Tuple[Path, str], object] = {}
+        self._dependencies: Dict[Tuple[Path, str], Set[str]] = {}
+        self._terms: Dict[Path, Set[str]] = {}
+        self._graph: Optional[DocGraph] = None
+        self._lock = threading.RLock()
+        self._graph_lock = threading.Lock()
+        self.files_read = 0
+
+    def read(self, path: Path) -> Optional[bytes]:
+        """Raw content of a file, or None if it does not exist."""
+        with self._lock:
+            if path not in self._bytes:
+                try:
+                    self._bytes[path] = path.read_bytes()
+                    self.files_read += 1
+                except FileNotFoundError:
+                    self._bytes[path] = None
+            return self._bytes[path]
+
+    def document(self, path: Path) -> Optional[Document]:
+        """Parsed markdown file, or None if it does not exist."""
+        with self._lock:
+            if path not in self._documents:
+                data = self.read(path)
+                self._documents[path] = (None if data is None
+                                         else Document(path, data.decode('utf-8')))
+            return self._documents[path]
+
+    def text(self, path: Path) -> Optional[str]:
+        """Text of a non-markdown file (e.g. mkdocs.yml), or None."""
+        data = self.read(path)
+        return None if data is None else data.decode('utf-8')
+
+    def exists(self, path: str) -> bool:
+        """os.path.exists, remembered for the rest of the run (link targets repeat)."""
+        if path not in self._exists:
+            self._exists[path] = os.path.exists(path)
+        return self._exists[path]
+
+    def _group_specs(self) -> Dict[str, Tuple[Path, str]]:
+        return {
+            "docs": (self.docs_dir, "**/*.md"),
+            "modules": (self.modules_dir, "*.md"),
+            "templates": (self.templates_dir, "*.md"),
+            "notebooks": (self.notebooks_dir, "*.ipynb"),
+        }
 
-        for match in link_pattern.finditer(content):
-            link_text, link_path = match.groups()
+    def _group(self, name: str) -> List[Path]:
+        with self._lock:
+            if name not in self._groups:
+                directory, pattern = self._group_specs()[name]
+                self._groups[name] = list(directory.glob(pattern))
+            return self._groups[name]
 
-            # Skip external links and anchors
-            if link_path.startswith(('http://', 'https://', '#', 'mailto:')):
-                continue
+    @property
+    def docs(self) -> List[Path]:
+        return self._group("docs")
+
+    @property
+    def modules(self) -> List[Path]:
+        return self._group("modules")
 
-            # Handle relative paths
-            checked += 1
+    @property
+    def templates(self) -> List[Path]:
+        return self._group("templates")
+
+    @property
+    def notebooks(self) -> List[Path]:
+        return self._group("notebooks")
 
-            # Remove anchor from path
-            clean_path = link_path.split('#')[0]
-            if not clean_path:
+    def kinds(self, path: Path) -> Set[str]:
+        """
+        What a file is to the checks (see CHECK_INPUTS): the groups whose
+        pattern it matches, "mkdocs" for mkdocs.yml, or "other" for any
+        other file under the docs, templates or notebooks directories.
+        Decided from the path alone, so deleted files have kinds too.
+        """
+        kinds = set()
+        for name, (directory, pattern) in self._group_specs().items():
+            try:
+                rel = path.relative_to(directory)
+            except ValueError:
                 continue
+            recursive = pattern.startswith("**/")
+            if (recursive or len(rel.parts) == 1) and \
+                    fnmatch.fnmatch(rel.name, pattern[3:] if recursive else pattern):
+                kinds.add(name)
+        if path == self.repo_root / "mkdocs.yml":
+            kinds.add("mkdocs")
+        elif not kinds and any(directory in path.parents
+                               for directory, _ in self._group_specs().values()):
+            kinds.add("other")
+        return kinds
+
+    def findings(self, path: Path, check: str, analyse: Callable[[Path], Tuple[object, List[str]]]):
+        """
+        One check's findings for one file, from the cache when still valid.
+
+        Args:
+            path: File the findings are about
+            check: Key in CHECK_VERSIONS
+            analyse: Computes (findings, dependencies) for the file; the
+                     dependencies are paths whose existence the findings
+                     depend on (link targets). Findings must be JSON types.
+        """
+        value = self._findings.get((path, check), MISSING)
+        if value is not MISSING:
+            return value
+        dependencies = []
+        if self.cache is None:
+            value, dependencies = analyse(path)
+        else:
+            key = f"{check}@{CHECK_VERSIONS[check]}"
+            value = self.cache.lookup(self, path, key)
+            if value is MISSING:
+                value, dependencies = analyse(path)
+                self.cache.store(path, key, value, dependencies)
+        with self._lock:
+            self._findings[path, check] = value
+            if dependencies:
+                self._dependencies[path, check] = {os.path.normpath(d) for d in dependencies}
+        return value
+
+    def invalidate(self, changed: Iterable[Path], moved: Iterable[Path] = ()):
+        """
+        Forget files that changed since they were read.
+
+        Args:
+            changed: Files whose content changed
+            moved: Files created or deleted; group listings, existence
+                   tests and findings that depend on these files are
+                   refreshed as well
+        """
+        moved = set(moved)
+        changed = set(changed) | moved
+        mkdocs = self.repo_root / "mkdocs.yml"
+        with self._lock:
+            repo_url = (self._findings.get((mkdocs, "mkdocs")) or {}).get("repo_url")
+            stale = {(path, check) for (path, check), deps in self._dependencies.items()
+                     if deps & {os.path.normpath(p) for p in moved}}
+            if self.cache is not None:
+                cached = self.cache.invalidate(changed, moved)
+                stale |= {(path, check) for path, check in self._findings
+                          if (self.cache._key(path), f"{check}@{CHECK_VERSIONS[check]}") in cached}
+            for path in changed:
+                self._bytes.pop(path, None)
+                self._documents.pop(path, None)
+                self._terms.pop(path, None)
+                stale |= {(path, check) for check in CHECK_VERSIONS}
+            for key in stale:
+                self._findings.pop(key, None)
+                self._dependencies.pop(key, None)
+
+            if moved:
+                self._exists.clear()
+                for name, paths in self._groups.items():
+                    for path in moved:
+                        if name in self.kinds(path):
+                            if path in paths:
+                                paths.remove(path)
+                            if path.exists():
+                                paths.append(path)
+
+            if mkdocs in changed:
+                config = self.mkdocs_config()
+                if self._graph is not None and config["repo_url"] != repo_url:
+                    self._graph = None  # Repository URLs resolve differently; rebuild
+                elif self._graph is not None:
+                    self._graph.set_nav(config["nav"])
+
+            if self._graph is not None:
+                for path in changed:
+                    if "docs" not in self.kinds(path):
+                        continue
+                    page = path.relative_to(self.repo_root).as_posix()
+                    if path.exists():
+                        self._graph.set_page(page, self.page(path))
+                    else:
+                        self._graph.remove_page(page)
+
+    def page(self, path: Path) -> dict:
+        """
+        Links and anchors of a docs page (doc_graph.parse_page, cached like
+        findings). The record is cached as compact JSON text, which the
+        cache file loads as one string rather than as thousands of lists,
+        and is decoded only when the graph is built.
+        """
+        def analyse(path: Path):
+            return json.dumps(parse_page(self.document(path).text), separators=(',', ':')), []
+
+        return json.loads(self.findings(path, "page_graph", analyse))
+
+    def mkdocs_config(self) -> dict:
+        """
+        What the checks use from mkdocs.yml (cached like findings): its
+        top-level "keys", "repo_url", "nav" as (title, path) pairs, and
+        "error" if the file is missing or not a valid config.
+        """
+        def analyse(path: Path):
+            summary = {"keys": [], "repo_url": None, "nav": [], "error": None}
+            text = self.text(path)
+            if text is None:
+                return dict(summary, error="mkdocs.yml not found"), []
+            try:
+                config = load_mkdocs_config(text)
+            except ValueError as e:
+                return dict(summary, error=str(e)), []
+            repo_url = config.get("repo_url")
+            return dict(summary, keys=[str(key) for key in config],
+                        repo_url=repo_url if isinstance(repo_url, str) else None,
+                        nav=[list(entry) for entry in nav_entries(config.get("nav"))]), []
+
+        return self.findings(self.repo_root / "mkdocs.yml", "mkdocs", analyse)
+
+    @property
+    def graph(self) -> DocGraph:
+        """Link graph of every docs page plus the mkdocs nav, built once per run."""
+        # Built under its own lock: page records are looked up in the
+        # result cache, which must not be entered while holding _lock
+        with self._graph_lock:
+            if self._graph is None:
+                config = self.mkdocs_config()
+                graph = DocGraph(self.repo_root, self.docs_dir,
+                                 exists=self.exists,
+                                 repo_url=config["repo_url"])
+                for path in self.docs:
+                    graph.set_page(path.relative_to(self.repo_root).as_posix(), self.page(path))
+                graph.set_nav(config["nav"])
+                self._graph = graph
+            return self._graph
+
+    def graph_findings(self, check: str, analyse: Callable[[DocGraph], Tuple[object, List[str]]]):
+        """
+        Findings about the whole link graph rather than one page.
+
+        They are cached on mkdocs.yml's entry with a digest of every docs
+        page, and reused while no page, mkdocs.yml or dependency changed,
+        so an unchanged tree is checked without building the graph.
+
+        Args:
+            check: Key in CHECK_VERSIONS
+            analyse: Computes (findings, dependencies) from the graph
+        """
+        if self.cache is None:
+            return analyse(self.graph)[0]
+        mkdocs = self.repo_root / "mkdocs.yml"
+        key = f"{check}@{CHECK_VERSIONS[check]}"
+        pages = self.cache.digest(self, self.docs)
+        value = self.cache.lookup(self, mkdocs, key, stamp=pages)
+        if value is MISSING:
+            value, dependencies = analyse(self.graph)
+            self.cache.store(mkdocs, key, value, dependencies, stamp=pages)
+        return value
+
+    def terms(self, path: Path) -> Set[str]:
+        """TERM_SCANNER terms present in a markdown file (cached like findings)."""
+        terms = self._terms.get(path)
+        if terms is None:
+            terms = set(self.findings(
+                path, "terms", lambda p: (sorted(self.document(p).terms), [])))
+            with self._lock:
+                terms = self._terms.setdefault(path, terms)
+        return terms
+
+
+# =============================================================================
+# RESULT CACHE
+# =============================================================================
+
+CACHE_PATH = Path(".cache") / "qa_suite.json"  # Relative to REPO_ROOT
+LINK_CACHE_PATH = Path(".cache") / "external_links.json"
+CACHE_FORMAT = 1
+
+# Bump a check's version whenever its per-file analysis changes, so
+# findings cached by older code are recomputed
+CHECK_VERSIONS = {
+    "page_graph": 2,
+    "internal_links": 2,
+    "external_links": 2,
+    "cross_references": 2,
+    "notebook": 1,
+    "notebook_verbose": 1,
+    "terms": TERM_SCANNER.fingerprint,  # Changes with the vocabulary
+    "module_structure": 2,
+    "mkdocs": 2,
+    "nav": 1,
+    "link_graph": 1,
+}
+
+MISSING = object()
+
+
+def git_changed_files(root: Path, ref: str) -> Set[str]:
+    """Paths (relative to root) changed since a git ref, plus untracked files."""
+    commands = [
+        ["git", "diff", "--name-only", "--relative", ref, "--"],
+        ["git", "ls-files", "--others", "--exclude-standard"],
+    ]
+    changed = set()
+    for command in commands:
+        result = subprocess.run(command, cwd=root, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise ValueError(f"{' '.join(command[:2])} failed: {result.stderr.strip()}")
+        changed.update(line for line in result.stdout.splitlines() if line)
+    return changed
+
+
+class ResultCache:
+    """
+    Per-file findings keyed by file path, content hash and check version.
+
+    A cached finding is reused when the file is unchanged and none of its
+    dependencies (link targets) has appeared or disappeared. Targets are
+    tracked through a reverse-dependency map (target -> findings that
+    depend on it), so a deleted page invalidates exactly the pages that
+    link to it.
+
+    Files count as unchanged when size and mtime match the cache, or
+    their content hash does. With `since`, only files git reports as
+    changed since that ref (plus untracked files) are considered, and the
+    cache is trusted for everything else.
+    """
+
+    def __init__(self, root: Path, path: Optional[Path] = None, since: Optional[str] = None):
+        self.root = root
+        self.path = path or root / CACHE_PATH
+        self.entries: Dict[str, dict] = {}
+        self.targets: Dict[str, bool] = {}
+        self.changed = git_changed_files(root, since) if since else None
+        self.hits = 0
+        self.misses = 0
+        self._verified: Dict[str, bool] = {}
+        self._keys: Dict[object, str] = {}
+        self._prefix = os.path.join(os.path.abspath(root), "")
+        self._lock = threading.RLock()
 
-            # Resolve relative path
-            if clean_path.startswith('/'):
-                target = DOCS_DIR / clean_path.lstrip('/')
+        try:
+            stored = json.loads(self.path.read_text(encoding='utf-8'))
+            if stored.get("format") == CACHE_FORMAT:
+                self.entries = stored["entries"]
+                self.targets = stored["targets"]
+        except (OSError, ValueError, KeyError):
+            pass
+        self._stale = self._stale_findings()
+
+    def _key(self, path) -> str:
+        """Cache key of a path: POSIX form relative to the root."""
+        key = self._keys.get(path)
+        if key is None:
+            name = os.fspath(path)
+            if name.startswith(self._prefix):  # Most paths; relpath is slow
+                key = posixpath.normpath(name[len(self._prefix):].replace(os.sep, "/"))
             else:
-                target = md_file.parent / clean_path
+                key = Path(os.path.relpath(path, self.root)).as_posix()
+            self._keys[path] = key
+        return key
+
+    def _stale_findings(self) -> Set[Tuple[str, str]]:
+        """(file, check) findings whose dependency targets appeared or vanished."""
+        if self.changed is not None:
+            moved = self.changed
+        else:
+            moved = {target for target, state in self.targets.items()
+                     if os.path.exists(self.root / target) != state}
+        if not moved:
+            return set()
+        return {(rel, key) for rel, entry in self.entries.items()
+                for key, finding in entry["findings"].items()
+                if finding["deps"] and not moved.isdisjoint(finding["deps"])}
+
+    def _unchanged(self, index: DocumentIndex, path: Path, rel: str) -> bool:
+        """
+        Whether the file matches its entry; a changed file gets a fresh entry.
+
+        The file is read and hashed outside the cache lock, so the cache
+        never waits for the index's lock while holding its own (the index
+        may look findings up while holding its lock, as invalidate() does).
+        """
+        with self._lock:
+            if rel in self._verified:
+                return self._verified[rel]
+            entry = self.entries.get(rel)
+            if entry is not None and self.changed is not None and rel not in self.changed:
+                self._verified[rel] = True
+                return True
+        try:
+            stat = path.stat()
+        except OSError:
+            stat = None
+        digest = None
+        if entry is None or stat is None or \
+                [stat.st_mtime_ns, stat.st_size] != [entry["mtime_ns"], entry["size"]]:
+            digest = hashlib.sha256(index.read(path) or b"").hexdigest()
+
+        with self._lock:
+            if rel in self._verified:  # Verified by another thread meanwhile
+                return self._verified[rel]
+            unchanged = digest is None or (entry is not None and digest == entry["hash"])
+            if not unchanged:
+                entry = self.entries[rel] = {"hash": digest, "findings": {}}
+            if digest is not None and stat is not None:
+                entry["mtime_ns"], entry["size"] = stat.st_mtime_ns, stat.st_size
+            self._verified[rel] = unchanged
+        return unchanged
+
+    def lookup(self, index: DocumentIndex, path: Path, key: str, stamp: Optional[str] = None):
+        """
+        Cached findings, or MISSING if they must be recomputed.
+
+        Args:
+            stamp: Fingerprint of inputs other than the file itself; the
+                   findings are reused only if stored with the same stamp
+        """
+        rel = self._key(path)
+        fresh = self._unchanged(index, path, rel)
+        with self._lock:
+            finding = self.entries[rel]["findings"].get(key) if fresh else None
+            if finding is None or finding.get("stamp") != stamp or (rel, key) in self._stale:
+                self.misses += 1
+                return MISSING
+            self.hits += 1
+            return finding["value"]
+
+    def digest(self, index: DocumentIndex, paths: Iterable[Path]) -> str:
+        """Fingerprint of a set of files: their paths and content hashes."""
+        files = sorted((self._key(path), path) for path in paths)
+        for rel, path in files:
+            self._unchanged(index, path, rel)
+        digest = hashlib.sha256()
+        with self._lock:
+            for rel, _ in files:
+                digest.update(f"{rel}\0{self.entries[rel]['hash']}\n".encode('utf-8'))
+        return digest.hexdigest()
+
+    def invalidate(self, paths: Iterable[Path], moved: Iterable[Path] = ()) -> Set[Tuple[str, str]]:
+        """
+        Re-verify files on their next lookup, and mark stale the findings
+        that depend on files created or deleted since the cache was loaded.
+
+        Returns:
+            The (file, check) findings newly marked stale
+        """
+        moved = {self._key(path) for path in moved}
+        stale = set()
+        with self._lock:
+            for path in paths:
+                rel = self._key(path)
+                self._verified.pop(rel, None)
+                if self.changed is not None:
+                    self.changed.add(rel)
+            if moved:
+                for rel, entry in self.entries.items():
+                    for key, finding in entry["findings"].items():
+                        if moved.intersection(finding["deps"]):
+                            stale.add((rel, key))
+                self._stale |= stale
+        return stale
+
+    def store(self, path: Path, key: str, value, dependencies: Sequence[str],
+              stamp: Optional[str] = None):
+        rel = self._key(path)
+        deps = [self._key(target) for target in dependencies]
+        with self._lock:
+            finding = {"value": value, "deps": deps}
+            if stamp is not None:
+                finding["stamp"] = stamp
+            self.entries[rel]["findings"][key] = finding
+            self._stale.discard((rel, key))
+            for target, dep in zip(dependencies, deps):
+                self.targets[dep] = os.path.exists(target)
+
+    def save(self):
+        """Write the cache, dropping files that no longer exist."""
+        with self._lock:
+            entries = {rel: entry for rel, entry in self.entries.items()
+                       if (self.root / rel).exists()}
+            referenced = {dep for entry in entries.values()
+                          for finding in entry["findings"].values() for dep in finding["deps"]}
+            targets = {t: state for t, state in self.targets.items() if t in referenced}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"format": CACHE_FORMAT, "entries": entries,
+                                       "targets": targets}), encoding='utf-8')
+            os.replace(tmp, self.path)
+
+
+# =============================================================================
+# CHECK FUNCTIONS
+# =============================================================================
+
+def _page_name(page: str) -> str:
+    return posixpath.basename(page)
+
+
+def _outgoing(index: DocumentIndex, path: Path):
+    """Graph edges from a docs page."""
+    return index.graph.outgoing(path.relative_to(index.repo_root).as_posix())
+
+
+def check_internal_links(index: DocumentIndex, verbose: bool = False) -> CheckResult:
+    """Check all internal markdown links are valid."""
+    def analyse(path: Path):
+        # Same-page anchors are left to check_link_graph
+        links = [edge for edge in _outgoing(index, path) if edge.kind == "link" and edge.target]
+        issues = [f"{path.name}: broken link '{edge.raw}'"
+                  for edge in links if not index.graph.exists(edge.target)]
+        targets = dict.fromkeys(os.path.join(index.repo_root, edge.target) for edge in links)
+        return {"checked": len(links), "issues": issues}, list(targets)
 
-            # Check if target exists
-            if not target.exists():
-                issues.append(f"{md_file.name}: broken link '{link_path}'")
+    issues = []
+    checked = 0
+    for path in index.docs:
+        found = index.findings(path, "internal_links", analyse)
+        checked += found["checked"]
+        issues.extend(found["issues"])
 
     return CheckResult(
         name="Internal Links",
         passed=len(issues) == 0,
         message=f"Checked {checked} links, {len(issues)} broken",
-        details=issues[:20]  # Limit details
+        details=issues[:20],  # Limit details
+        files=len(index.docs)
     )
 
 
-def check_external_links(verbose: bool = False) -> CheckResult:
-    """Check external links are properly formatted (doesn't verify reachability)."""
-    issues = []
-    external_links = set()
-
-    link_pattern = re.compile(r'\[([^\]]+)\]\((https?://[^)]+)\)')
-
-    for md_file in DOCS_DIR.rglob("*.md"):
-        content = md_file.read_text(encoding='utf-8')
+def _external_links(index: DocumentIndex, path: Path) -> dict:
+    """External URLs of a docs page and their format issues (cached like findings)."""
 
-        for match in link_pattern.finditer(content):
-            link_text, url = match.groups()
-            external_links.add(url)
+    def analyse(path: Path):
+        issues, urls = [], []
+        for link_text, url in index.page(path)["links"]:
+            if not url.startswith(('http://', 'https://')):
+                continue
+            urls.append(url)
 
             # Check for common issues
             if ' ' in url and '%20' not in url:
-                issues.append(f"{md_file.name}: unescaped space in URL '{url[:50]}...'")
+                issues.append(f"{path.name}: unescaped space in URL '{url[:50]}...'")
 
             if url.endswith('.'):
-                issues.append(f"{md_file.name}: URL ends with period '{url[:50]}...'")
+                issues.append(f"{path.name}: URL ends with period '{url[:50]}...'")
+        return {"urls": list(dict.fromkeys(urls)), "issues": issues}, []
+
+    return index.findings(path, "external_links", analyse)
+
+
+def check_external_links(index: DocumentIndex, verbose: bool = False) -> CheckResult:
+    """Check external links are properly formatted (doesn't verify reachability)."""
+    issues = []
+    external_links = set()
+    for path in index.docs:
+        found = _external_links(index, path)
+        external_links.update(found["urls"])
+        issues.extend(found["issues"])
 
     return CheckResult(
         name="External Links Format",
         passed=len(issues) == 0,
         message=f"Found {len(external_links)} unique external links, {len(issues)} format issues",
-        details=issues
+        details=issues,
+        files=len(index.docs)
+    )
+
+
+def check_external_reachability(index: DocumentIndex, verbose: bool = False) -> CheckResult:
+    """
+    Check external links respond, each unique URL requested once.
+
+    Needs network access, so only runs when asked for (--check urls).
+    Results are cached in .cache/external_links.json for LinkChecker's
+    TTL unless the run uses --no-cache.
+    """
+    pages = defaultdict(list)
+    for path in index.docs:
+        for url in _external_links(index, path)["urls"]:
+            pages[url].append(path.name)
+
+    cache_path = index.repo_root / LINK_CACHE_PATH if index.cache is not None else None
+    checker = LinkChecker(cache_path=cache_path)
+    statuses = checker.check(pages)
+
+    issues = [f"{page}: {url} ({status.describe()})"
+              for url, status in statuses.items() if not status.ok for page in pages[url]]
+    cached = sum(status.cached for status in statuses.values())
+
+    return CheckResult(
+        name="External Links Reachable",
+        passed=len(issues) == 0,
+        message=f"Checked {len(statuses)} unique external links ({cached} cached, "
+                f"{checker.requests} requests), {len(issues)} broken",
+        details=issues,
+        files=len(index.docs)
     )
 
 
-def check_notebook_structure(verbose: bool = False) -> CheckResult:
+def check_notebook_structure(index: DocumentIndex, verbose: bool = False) -> CheckResult:
     """Validate Jupyter notebook structure."""
-    issues = []
-    notebooks = list(NOTEBOOKS_DIR.glob("*.ipynb"))
 
-    for nb_path in notebooks:
+    def analyse(nb_path: Path):
+        issues = []
         try:
-            with open(nb_path, 'r', encoding='utf-8') as f:
-                nb = json.load(f)
+            nb = json.loads(index.read(nb_path).decode('utf-8'))
 
             # Check required keys
             if 'cells' not in nb:
                 issues.append(f"{nb_path.name}: missing 'cells' key")
-                continue
+                return issues, []
 
             if nb.get('nbformat', 0) < 4:
                 issues.append(f"{nb_path.name}: outdated notebook format")
@@ -212,117 +886,109 @@ def check_notebook_structure(verbose: bool = False) -> CheckResult:
             issues.append(f"{nb_path.name}: invalid JSON - {e}")
         except Exception as e:
             issues.append(f"{nb_path.name}: error - {e}")
+        return issues, []
+
+    issues = []
+    notebooks = index.notebooks
+    for nb_path in notebooks:
+        issues.extend(index.findings(nb_path, "notebook_verbose" if verbose else "notebook",
+                                     analyse))
 
     return CheckResult(
         name="Notebook Structure",
         passed=len(issues) == 0,
         message=f"Validated {len(notebooks)} notebooks, {len(issues)} issues",
-        details=issues
+        details=issues,
+        files=len(notebooks)
     )
 
 
-def check_template_completeness(verbose: bool = False) -> CheckResult:
+def check_template_completeness(index: DocumentIndex, verbose: bool = False) -> CheckResult:
     """Check all templates have required sections."""
-    issues = []
-    templates = list(TEMPLATES_DIR.glob("*.md"))
-
     required_sections = [
-        "Educational",  # Must mention educational use
-        "NexVigilant",  # Branding
+        ("Educational", "educational"),  # Must mention educational use
+        ("NexVigilant", "nexvigilant"),  # Branding
     ]
 
-    for template in templates:
-        content = template.read_text(encoding='utf-8')
-        content_lower = content.lower()
-
-        for section in required_sections:
-            if section.lower() not in content_lower:
-                issues.append(f"{template.name}: missing '{section}' reference")
+    issues = []
+    templates = index.templates
+    for path in templates:
+        terms = index.terms(path)
+        issues.extend(f"{path.name}: missing '{section}' reference"
+                      for section, term in required_sections if term not in terms)
 
     return CheckResult(
         name="Template Completeness",
         passed=len(issues) == 0,
         message=f"Checked {len(templates)} templates, {len(issues)} missing elements",
-        details=issues
+        details=issues,
+        files=len(templates)
     )
 
 
-def check_branding_consistency(verbose: bool = False) -> CheckResult:
+def check_branding_consistency(index: DocumentIndex, verbose: bool = False) -> CheckResult:
     """Verify NexVigilant branding is consistent across all files."""
     issues = []
 
-    required_branding = "NexVigilant"
-    tagline = "Empowerment Through Vigilance"
-
-    for md_file in DOCS_DIR.rglob("*.md"):
-        content = md_file.read_text(encoding='utf-8')
-
+    for path in index.docs:
         # Check for NexVigilant mention
-        if required_branding not in content:
-            issues.append(f"{md_file.name}: missing NexVigilant branding")
+        if "branding" not in index.terms(path):
+            issues.append(f"{path.name}: missing NexVigilant branding")
 
     # Check modules specifically for tagline
-    for module in MODULES_DIR.glob("*.md"):
-        content = module.read_text(encoding='utf-8')
-        if tagline not in content:
-            issues.append(f"{module.name}: missing tagline")
+    for path in index.modules:
+        if "tagline" not in index.terms(path):
+            issues.append(f"{path.name}: missing tagline")
 
     return CheckResult(
         name="Branding Consistency",
         passed=len(issues) == 0,
         message=f"Checked branding, {len(issues)} files missing",
         details=issues,
-        fixable=True
+        fixable=True,
+        files=len(index.docs) + len(index.modules)
     )
 
 
-def check_educational_disclaimers(verbose: bool = False) -> CheckResult:
+def check_educational_disclaimers(index: DocumentIndex, verbose: bool = False) -> CheckResult:
     """Verify educational disclaimers are present in all modules."""
     issues = []
 
-    disclaimer_patterns = [
-        r"educational\s+purposes?\s+only",
-        r"educational\s+use\s+only",
-        r"educational\s+disclaimer",
-        r"for\s+learning\s+purposes"
-    ]
-
-    for module in MODULES_DIR.glob("*.md"):
-        content = module.read_text(encoding='utf-8')
-
-        has_disclaimer = any(
-            re.search(pattern, content, re.IGNORECASE) for pattern in disclaimer_patterns
-        )
-
-        if not has_disclaimer:
-            issues.append(f"{module.name}: missing educational disclaimer")
+    for path in index.modules:
+        if "disclaimer" not in index.terms(path):
+            issues.append(f"{path.name}: missing educational disclaimer")
 
     # Also check templates
-    for template in TEMPLATES_DIR.glob("*.md"):
-        content = template.read_text(encoding='utf-8')
-
-        has_disclaimer = any(
-            re.search(pattern, content, re.IGNORECASE) for pattern in disclaimer_patterns
-        )
-
-        if not has_disclaimer:
-            issues.append(f"templates/{template.name}: missing educational disclaimer")
+    for path in index.templates:
+        if "disclaimer" not in index.terms(path):
+            issues.append(f"templates/{path.name}: missing educational disclaimer")
 
     return CheckResult(
         name="Educational Disclaimers",
         passed=len(issues) == 0,
         message=f"Checked disclaimers, {len(issues)} missing",
         details=issues,
-        fixable=True
+        fixable=True,
+        files=len(index.modules) + len(index.templates)
     )
 
 
-def check_glossary_coverage(verbose: bool = False) -> CheckResult:
-    """Check that key terms in modules are defined in glossary."""
-    issues = []
+def term_usage(index: DocumentIndex, terms: Sequence[str]) -> Dict[str, List[str]]:
+    """Term -> names of the docs pages using it, for TERM_SCANNER terms."""
+    usage = defaultdict(list)
+    wanted = set(terms)
+    for path in index.docs:
+        for term in index.terms(path) & wanted:
+            usage[term].append(path.name)
+    return dict(usage)
+
 
-    glossary_path = DOCS_DIR / "reference" / "glossary.md"
-    if not glossary_path.exists():
+def check_glossary_coverage(index: DocumentIndex, verbose: bool = False) -> CheckResult:
+    """
+    Check that key terms, and any abbreviation a page uses, are in the glossary.
+    """
+    glossary_path = index.docs_dir / "reference" / "glossary.md"
+    if not index.exists(str(glossary_path)):
         return CheckResult(
             name="Glossary Coverage",
             passed=False,
@@ -330,36 +996,37 @@ def check_glossary_coverage(verbose: bool = False) -> CheckResult:
             details=["reference/glossary.md does not exist"]
         )
 
-    glossary_content = glossary_path.read_text(encoding='utf-8')
+    # Key terms appear in the glossary, exactly as written and as whole words
+    defined = index.terms(glossary_path)
+    issues = [f"Term not in glossary: {term}" for term in KEY_TERMS if term not in defined]
 
-    # Key terms that should be in glossary
-    key_terms = [
-        "BRAD", "Effects Table", "Value Tree", "DOOR", "MCDA",
-        "NNT", "NNH", "CIOMS", "SBRF", "RMP", "REMS",
-        "Win Ratio", "ICH", "PrOACT-URL"
-    ]
-
-    for term in key_terms:
-        # Check if term appears in glossary (case-insensitive)
-        if term.lower() not in glossary_content.lower():
-            issues.append(f"Term not in glossary: {term}")
+    # Abbreviations used anywhere else must be defined too
+    usage = term_usage(index, [term.name for term in GLOSSARY_TERMS])
+    undefined = [term.name for term in GLOSSARY_TERMS
+                 if term.name in usage and term.name not in defined and term.name not in KEY_TERMS]
+    for term in undefined:
+        pages = usage[term]
+        shown = ", ".join(pages[:3]) + (f" and {len(pages) - 3} more" if len(pages) > 3 else "")
+        issues.append(f"Used but not in glossary: {term} ({shown})")
 
     return CheckResult(
         name="Glossary Coverage",
         passed=len(issues) == 0,
-        message=f"Checked {len(key_terms)} key terms, {len(issues)} missing",
-        details=issues
+        message=f"Checked {len(KEY_TERMS)} key terms and {len(usage)} terms in use, "
+                f"{len(issues)} missing",
+        details=issues,
+        files=len(index.docs)
     )
 
 
-def check_module_structure(verbose: bool = False) -> CheckResult:
+def check_module_structure(index: DocumentIndex, verbose: bool = False) -> CheckResult:
     """Validate all modules have consistent structure."""
     issues = []
 
     required_elements = [
-        ("Learning Objectives", r"[Ll]earning [Oo]bjectives"),
-        ("Key Takeaways", r"[Kk]ey [Tt]akeaways"),
-        ("Navigation", r"\[.*→.*\]\(.*\.md\)"),  # Navigation links
+        ("Learning Objectives", "learning_objectives"),
+        ("Key Takeaways", "key_takeaways"),
+        ("Navigation", "navigation"),  # Navigation links
     ]
 
     expected_modules = [
@@ -373,93 +1040,137 @@ def check_module_structure(verbose: bool = False) -> CheckResult:
         "08-regulatory-reference.md",
     ]
 
+    def analyse(path: Path):
+        module = index.document(path)
+        return [f"{path.name}: missing {element_name}"
+                for element_name, term in required_elements if not module.has(term)], []
+
     # Check all expected modules exist
+    found = 0
     for module_name in expected_modules:
-        module_path = MODULES_DIR / module_name
-        if not module_path.exists():
+        module_path = index.modules_dir / module_name
+        if not index.exists(str(module_path)):
             issues.append(f"Missing module: {module_name}")
             continue
-
-        content = module_path.read_text(encoding='utf-8')
-
-        for element_name, pattern in required_elements:
-            if not re.search(pattern, content):
-                issues.append(f"{module_name}: missing {element_name}")
+        found += 1
+        issues.extend(index.findings(module_path, "module_structure", analyse))
 
     return CheckResult(
         name="Module Structure",
         passed=len(issues) == 0,
         message=f"Validated {len(expected_modules)} modules, {len(issues)} issues",
-        details=issues
+        details=issues,
+        files=found
     )
 
 
-def check_cross_references(verbose: bool = False) -> CheckResult:
+def check_cross_references(index: DocumentIndex, verbose: bool = False) -> CheckResult:
     """Validate cross-references between modules are accurate."""
-    issues = []
-
-    # Find all module references
-    module_ref_pattern = re.compile(r'\[.*?\]\((\.\./)?(modules/)?(\d{2}-[a-z-]+\.md)\)')
 
-    for md_file in DOCS_DIR.rglob("*.md"):
-        content = md_file.read_text(encoding='utf-8')
-
-        for match in module_ref_pattern.finditer(content):
+    def analyse(path: Path):
+        issues, modules = [], []
+        for edge in _outgoing(index, path):
+            match = MODULE_REF_PATTERN.fullmatch(edge.raw) if edge.kind == "link" else None
+            if not match:
+                continue
             ref_module = match.group(3)
 
             # Check if referenced module exists
-            target = MODULES_DIR / ref_module
-            if not target.exists():
-                issues.append(f"{md_file.name}: references non-existent module '{ref_module}'")
+            module_path = os.path.join(index.modules_dir, ref_module)
+            modules.append(module_path)
+            if not index.exists(module_path):
+                issues.append(f"{path.name}: references non-existent module '{ref_module}'")
+        return issues, modules
+
+    issues = []
+    for path in index.docs:
+        issues.extend(index.findings(path, "cross_references", analyse))
 
     return CheckResult(
         name="Cross References",
         passed=len(issues) == 0,
         message=f"Validated cross-references, {len(issues)} broken",
-        details=issues
+        details=issues,
+        files=len(index.docs)
     )
 
 
-def check_mkdocs_config(verbose: bool = False) -> CheckResult:
+def check_mkdocs_config(index: DocumentIndex, verbose: bool = False) -> CheckResult:
     """Validate mkdocs.yml configuration."""
-    issues = []
-
-    mkdocs_path = REPO_ROOT / "mkdocs.yml"
-    if not mkdocs_path.exists():
+    config = index.mkdocs_config()
+    error = config["error"]
+    if error is not None:
         return CheckResult(
             name="MkDocs Config",
             passed=False,
-            message="mkdocs.yml not found",
-            details=["mkdocs.yml does not exist in repository root"]
+            message=error,
+            details=["mkdocs.yml does not exist in repository root"
+                     if error == "mkdocs.yml not found" else f"mkdocs.yml: {error}"]
         )
 
-    content = mkdocs_path.read_text(encoding='utf-8')
+    issues = []
 
     # Check for required configurations
-    required_configs = [
-        ("site_name", r"site_name:"),
-        ("theme", r"theme:"),
-        ("nav", r"nav:"),
-        ("plugins", r"plugins:"),
-    ]
-
-    for config_name, pattern in required_configs:
-        if not re.search(pattern, content):
+    for config_name in ("site_name", "theme", "nav", "plugins"):
+        if config_name not in config["keys"]:
             issues.append(f"Missing configuration: {config_name}")
 
     # Check all nav items point to existing files
-    nav_pattern = re.compile(r":\s+([a-z-/]+\.md)")
-    for match in nav_pattern.finditer(content):
-        nav_file = match.group(1)
-        target = DOCS_DIR / nav_file
-        if not target.exists():
-            issues.append(f"Nav points to missing file: {nav_file}")
+    def analyse(graph: DocGraph):
+        broken = [f"Nav points to missing file: {edge.raw}"
+                  for edge in graph.broken_edges(("nav",))]
+        return broken, [os.path.join(index.repo_root, edge.target) for edge in graph.nav]
+
+    issues.extend(index.graph_findings("nav", analyse))
 
     return CheckResult(
         name="MkDocs Config",
         passed=len(issues) == 0,
         message=f"Validated mkdocs.yml, {len(issues)} issues",
-        details=issues
+        details=issues,
+        files=1
+    )
+
+
+def check_link_graph(index: DocumentIndex, verbose: bool = False) -> CheckResult:
+    """
+    Query the link graph: missing anchors, links to repository files that
+    do not exist, pages unreachable from the nav, next-module cycles.
+    """
+    def analyse(graph: DocGraph):
+        issues = []
+
+        for edge in graph.missing_anchors():
+            target = _page_name(edge.target) if edge.target else "this page"
+            issues.append(f"{_page_name(edge.source)}: no anchor '#{edge.anchor}' in {target}")
+
+        for edge in graph.broken_edges(("repo",)):
+            issues.append(f"{_page_name(edge.source)}: "
+                          f"links to missing repository file '{edge.target}'")
+
+        for page in graph.orphans():
+            issues.append(f"Orphan page (not reachable from nav): {page}")
+
+        for cycle in graph.next_cycles():
+            issues.append("Next-module navigation cycle: " +
+                          " → ".join(_page_name(page) for page in cycle))
+
+        # Only repository links test the filesystem; pages come from the digest
+        targets = dict.fromkeys(os.path.join(index.repo_root, edge.target)
+                                for edge in graph.edges(("repo",)))
+        return {"pages": len(graph.pages), "edges": graph.count(("link", "repo", "nav")),
+                "issues": issues}, list(targets)
+
+    found = index.graph_findings("link_graph", analyse)
+    issues = found["issues"]
+
+    return CheckResult(
+        name="Link Graph",
+        passed=len(issues) == 0,
+        message=f"Queried {found['pages']} pages and {found['edges']} "
+                f"edges, {len(issues)} issues",
+        details=issues,
+        files=len(index.docs)
     )
 
 
@@ -468,7 +1179,7 @@ def check_mkdocs_config(verbose: bool = False) -> CheckResult:
 # =============================================================================
 
 ALL_CHECKS = {
-    "links": [check_internal_links, check_external_links],
+    "links": [check_internal_links, check_external_links, check_link_graph],
     "notebooks": [check_notebook_structure],
     "templates": [check_template_completeness],
     "branding": [check_branding_consistency],
@@ -476,28 +1187,105 @@ ALL_CHECKS = {
     "glossary": [check_glossary_coverage],
     "structure": [check_module_structure, check_mkdocs_config],
     "references": [check_cross_references],
+    "urls": [check_external_reachability],
+}
+
+# Checks that need network access; run only when named with --check
+ONLINE_CHECKS = {"urls"}
+
+# Kinds of file each check reads (DocumentIndex.kinds), plus "paths" for
+# checks that depend on which files exist; watch mode re-runs a check only
+# when a file of one of its kinds changes
+CHECK_INPUTS = {
+    check_internal_links: {"docs", "paths"},
+    check_external_links: {"docs"},
+    check_link_graph: {"docs", "mkdocs", "paths"},
+    check_notebook_structure: {"notebooks"},
+    check_template_completeness: {"templates"},
+    check_branding_consistency: {"docs"},
+    check_educational_disclaimers: {"modules", "templates"},
+    check_glossary_coverage: {"docs"},
+    check_module_structure: {"modules"},
+    check_mkdocs_config: {"mkdocs", "paths"},
+    check_cross_references: {"docs", "paths"},
+    check_external_reachability: {"docs"},
 }
 
 
+def _timed(check_func, index: DocumentIndex, verbose: bool) -> CheckResult:
+    """Run one check and record its wall time."""
+    start = time.perf_counter()
+    result = check_func(index, verbose=verbose)
+    result.duration = time.perf_counter() - start
+    return result
+
+
 def run_checks(
     checks: Optional[List[str]] = None,
-    verbose: bool = False
+    verbose: bool = False,
+    index: Optional[DocumentIndex] = None,
+    jobs: Optional[int] = None,
+    fail_fast: bool = False,
+    functions: Optional[Sequence[Callable]] = None
 ) -> QAReport:
-    """Run specified checks and return report."""
+    """
+    Run specified checks against one shared document index and return report.
+
+    Checks run concurrently on a thread pool of `jobs` workers (default:
+    CPU count; 1 runs them in order). Threads rather than processes, so
+    every check shares the same in-memory index. A check's duration
+    includes reading any files it is the first to need.
+
+    With fail_fast, checks not yet started when the first failure arrives
+    are cancelled and listed in report.cancelled. By default every check
+    except ONLINE_CHECKS runs; `functions` runs those check functions
+    instead of the `checks` groups.
+    """
     report = QAReport()
+    if index is None:
+        index = DocumentIndex()
 
     if checks is None:
-        checks = list(ALL_CHECKS.keys())
+        checks = [name for name in ALL_CHECKS if name not in ONLINE_CHECKS]
 
-    for check_name in checks:
+    funcs = list(functions or [])
+    for check_name in checks if functions is None else []:
         if check_name not in ALL_CHECKS:
             print(f"Unknown check: {check_name}")
             continue
+        funcs.extend(ALL_CHECKS[check_name])
 
-        for check_func in ALL_CHECKS[check_name]:
-            result = check_func(verbose=verbose)
-            report.results.append(result)
+    start = time.perf_counter()
+    results: List[Optional[CheckResult]] = [None] * len(funcs)
+    jobs = jobs or os.cpu_count() or 1
 
+    if jobs == 1 or len(funcs) <= 1:
+        for i, check_func in enumerate(funcs):
+            results[i] = _timed(check_func, index, verbose)
+            if fail_fast and not results[i].passed:
+                break
+    else:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(funcs))) as pool:
+            futures = {pool.submit(_timed, check_func, index, verbose): i
+                       for i, check_func in enumerate(funcs)}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                if fail_fast and not future.result().passed:
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        # Checks already running at the failure still finish; keep them
+        for future, i in futures.items():
+            if results[i] is None and future.done() and not future.cancelled():
+                results[i] = future.result()
+
+    report.results = [r for r in results if r is not None]
+    report.cancelled = [func.__name__ for func, r in zip(funcs, results) if r is None]
+    report.duration = time.perf_counter() - start
+    report.files_read = index.files_read
+    if index.cache is not None:
+        report.cache_hits = index.cache.hits
+        report.cache_misses = index.cache.misses
     return report
 
 
@@ -509,7 +1297,7 @@ def print_report(report: QAReport, verbose: bool = False):
 
     for result in report.results:
         status = SYMBOLS['pass'] if result.passed else SYMBOLS['fail']
-        print(f"\n{status} | {result.name}")
+        print(f"\n{status} | {result.name} ({result.duration:.2f}s, {result.files} files)")
         print(f"       {result.message}")
 
         if not result.passed and result.details:
@@ -528,6 +1316,14 @@ def print_report(report: QAReport, verbose: bool = False):
     if report.failed > 0:
         print(f"         {report.failed} checks need attention")
 
+    if report.cancelled:
+        print(f"         Stopped at first failure; cancelled: {', '.join(report.cancelled)}")
+
+    print(f"         {report.duration:.2f}s, {report.files_read} files read")
+    if report.cache_hits or report.cache_misses:
+        print(f"         Cache: {report.cache_hits} findings reused, "
+              f"{report.cache_misses} recomputed")
+
     print("-" * 60)
     print("Educational Use Only - NexVigilant | Empowerment Through Vigilance")
     print()
@@ -539,7 +1335,7 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Available checks:
-    links       - Internal and external link validation
+    links       - Internal/external links, anchors, orphans, next-module cycles
     notebooks   - Jupyter notebook structure validation
     templates   - Template completeness checks
     branding    - NexVigilant branding consistency
@@ -547,11 +1343,14 @@ Available checks:
     glossary    - Glossary term coverage
     structure   - Module structure validation
     references  - Cross-reference validation
+    urls        - External link reachability (network; not run by default)
 
 Examples:
     python qa_suite.py                    # Run all checks
     python qa_suite.py --check links      # Run only link checks
     python qa_suite.py --check structure --verbose
+    python qa_suite.py --since origin/main  # Only files changed since a ref
+    python qa_suite.py --watch --check links  # Re-run link checks on every save
 
 Educational Use Only - NexVigilant | Empowerment Through Vigilance
         """
@@ -580,18 +1379,81 @@ Educational Use Only - NexVigilant | Empowerment Through Vigilance
     parser.add_argument(
         '--fail-fast',
         action='store_true',
-        help="Stop on first failure"
+        help="Stop on first failure, cancelling checks not yet started"
+    )
+
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help="Checks to run concurrently (default: CPU count; 1 = sequential)"
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Analyse every file, ignoring and not updating .cache/qa_suite.json"
+    )
+
+    parser.add_argument(
+        '--since',
+        metavar='REF',
+        help="Trust cached findings for files unchanged since this git ref"
+    )
+
+    parser.add_argument(
+        '--watch', '-w',
+        action='store_true',
+        help="Keep running; re-check affected files whenever docs are saved"
+    )
+
+    parser.add_argument(
+        '--debounce',
+        type=float,
+        default=0.2,
+        metavar='SECONDS',
+        help="With --watch: quiet time that ends a burst of saves (default: 0.2)"
+    )
+
+    parser.add_argument(
+        '--poll',
+        action='store_true',
+        help="With --watch: poll file stats even if watchdog is installed"
     )
 
     args = parser.parse_args()
+    if args.no_cache and args.since:
+        parser.error("--since needs the result cache; drop --no-cache")
+    if args.watch and (args.json or args.fail_fast):
+        parser.error("--watch cannot be combined with --json or --fail-fast")
+
+    cache = None
+    if not args.no_cache:
+        try:
+            cache = ResultCache(REPO_ROOT, since=args.since)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if not args.json:
+        print("NexVigilant B-R Toolkit QA Suite")
+        print("-" * 40)
+
+    if args.watch:
+        from qa_watch import QAWatcher
 
-    print("NexVigilant B-R Toolkit QA Suite")
-    print("-" * 40)
+        QAWatcher(args.checks, verbose=args.verbose, jobs=args.jobs,
+                  cache=cache).run(debounce=args.debounce, poll=args.poll)
+        sys.exit(0)
 
     report = run_checks(
         checks=args.checks,
-        verbose=args.verbose
+        verbose=args.verbose,
+        index=DocumentIndex(cache=cache),
+        jobs=args.jobs,
+        fail_fast=args.fail_fast
     )
+    if cache is not None:
+        cache.save()
 
     if args.json:
         # JSON output for CI integration
@@ -600,12 +1462,19 @@ Educational Use Only - NexVigilant | Empowerment Through Vigilance
             "failed": report.failed,
             "total": report.total,
             "success_rate": report.success_rate,
+            "duration": round(report.duration, 4),
+            "files_read": report.files_read,
+            "cancelled": report.cancelled,
+            "cache_hits": report.cache_hits,
+            "cache_misses": report.cache_misses,
             "results": [
                 {
                     "name": r.name,
                     "passed": r.passed,
                     "message": r.message,
-                    "details": r.details
+                    "details": r.details,
+                    "duration": round(r.duration, 4),
+                    "files": r.files
                 }
                 for r in report.results
             ]
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+NexVigilant QA Watch Mode
+
+Keeps qa_suite results current while documentation is edited:
+1. File events come from watchdog (inotify, FSEvents, ReadDirectoryChanges)
+   when it is installed, and from polling file stats otherwise
+2. A burst of saves is debounced into one batch
+3. Only the checks that read the kinds of file changed (CHECK_INPUTS) are
+   re-run, against one DocumentIndex kept between runs: changed files are
+   re-read, the link graph is updated page by page, and everything else
+   is answered from memory
+4. Each batch prints what changed in the results since the previous one
+
+Usage:
+    python qa_suite.py --watch
+    python qa_suite.py --watch --check links --debounce 0.5
+
+Educational Use Only:
+    NexVigilant | Empowerment Through Vigilance
+"""
+
+import os
+import queue
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from qa_suite import (
+    ALL_CHECKS, CHECK_INPUTS, ONLINE_CHECKS, SYMBOLS, CheckResult, DocumentIndex,
+    QAReport, ResultCache, print_report, run_checks
+)
+
+
+DEBOUNCE = 0.2        # Seconds without events that end a burst of saves
+POLL_INTERVAL = 0.5   # Seconds between stat scans when watchdog is missing
+
+# (path, "created" | "modified" | "deleted")
+FileEvent = Tuple[Path, str]
+
+
+def _ignored(path: Path) -> bool:
+    """Editor swap/backup files and hidden directories (.cache, .git)."""
+    return path.name.endswith(('~', '.swp', '.swx', '.tmp')) or \
+        any(part.startswith(('.', '#')) for part in path.parts)
+
+
+# =============================================================================
+# EVENT SOURCES
+# =============================================================================
+
+class PollingSource:
+    """
+    File events found by comparing (mtime, size) snapshots.
+
+    Args:
+        roots: Directories (searched recursively) and single files to watch
+        interval: Seconds between scans
+    """
+
+    def __init__(self, roots: Sequence[Path], interval: float = POLL_INTERVAL):
+        self.roots = list(roots)
+        self.interval = interval
+        self._snapshot = self.snapshot()
+
+    def snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """Path -> (mtime_ns, size) of every watched file."""
+        files = {}
+        stack = []
+        for root in self.roots:
+            if root.is_dir():
+                stack.append(str(root))
+            elif root.exists():
+                stat = root.stat()
+                files[str(root)] = (stat.st_mtime_ns, stat.st_size)
+        while stack:
+            try:
+                entries = list(os.scandir(stack.pop()))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    def poll(self) -> List[FileEvent]:
+        """Events since the previous scan."""
+        before, after = self._snapshot, self.snapshot()
+        self._snapshot = after
+        events = [(Path(p), "created") for p in after.keys() - before.keys()]
+        events += [(Path(p), "deleted") for p in before.keys() - after.keys()]
+        events += [(Path(p), "modified") for p in after.keys() & before.keys()
+                   if after[p] != before[p]]
+        return events
+
+    def wait(self, timeout: Optional[float] = None) -> List[FileEvent]:
+        """Events within timeout seconds (None: block until there are some)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None:
+                remaining = max(0.0, min(self.interval, remaining))
+            time.sleep(self.interval if remaining is None else remaining)
+            events = self.poll()
+            if events or (deadline is not None and time.monotonic() >= deadline):
+                return events
+
+    def stop(self):
+        pass
+
+
+class WatchdogSource:
+    """
+    File events from the operating system through watchdog.
+
+    Raises:
+        ImportError: If watchdog is not installed
+    """
+
+    def __init__(self, roots: Sequence[Path]):
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        self._queue: "queue.Queue[FileEvent]" = queue.Queue()
+        put = self._queue.put
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                if event.event_type == "moved":
+                    put((Path(os.fsdecode(event.src_path)), "deleted"))
+                    put((Path(os.fsdecode(event.dest_path)), "created"))
+                elif event.event_type in ("created", "modified", "deleted"):
+                    put((Path(os.fsdecode(event.src_path)), event.event_type))
+
+        self._observer = Observer()
+        watched = set()
+        for root in roots:
+            # Single files are watched through their directory
+            directory = root if root.is_dir() else root.parent
+            if directory.exists() and directory not in watched:
+                self._observer.schedule(Handler(), str(directory), recursive=root.is_dir())
+                watched.add(directory)
+        self._observer.start()
+
+    def wait(self, timeout: Optional[float] = None) -> List[FileEvent]:
+        """Events within timeout seconds (None: block until there are some)."""
+        try:
+            events = [self._queue.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        while not self._queue.empty():
+            events.append(self._queue.get_nowait())
+        return events
+
+    def stop(self):
+        self._observer.stop()
+        self._observer.join()
+
+
+def debounced(source, debounce: float = DEBOUNCE) -> List[FileEvent]:
+    """Block for the next burst of events: until debounce seconds pass without one."""
+    events = source.wait()
+    while True:
+        more = source.wait(debounce)
+        if not more:
+            return events
+        events.extend(more)
+
+
+# =============================================================================
+# WATCHER
+# =============================================================================
+
+@dataclass
+class ResultChange:
+    """How one check's result differs from the previous run."""
+    name: str
+    passed: bool
+    was_passed: Optional[bool]          # None for a check not run before
+    message: str
+    added: List[str] = field(default_factory=list)
+    resolved: List[str] = field(default_factory=list)
+
+
+@dataclass
+class WatchUpdate:
+    """One batch of file changes and its effect on the results."""
+    paths: List[str]                    # Relative to the repository root
+    checks: List[str]                   # Names of the checks re-run
+    changes: List[ResultChange]
+    duration: float                     # Seconds to refresh the index and re-run checks
+
+
+class QAWatcher:
+    """
+    qa_suite results kept current across file changes.
+
+    Args:
+        checks: Check groups to run (default: all except ONLINE_CHECKS)
+        verbose: Passed to the checks
+        jobs: Checks to run concurrently in the first, full run; updates
+              run in order, as they are small and would only contend for
+              the GIL
+        cache: Result cache for the first run; saved by run() on exit
+    """
+
+    def __init__(
+        self,
+        checks: Optional[List[str]] = None,
+        verbose: bool = False,
+        jobs: Optional[int] = None,
+        cache: Optional[ResultCache] = None
+    ):
+        names = checks or [name for name in ALL_CHECKS if name not in ONLINE_CHECKS]
+        for name in names:
+            if name not in ALL_CHECKS:
+                raise ValueError(f"Unknown check: {name}")
+        self.functions = [func for name in names for func in ALL_CHECKS[name]]
+        self.verbose = verbose
+        self.jobs = jobs
+        self.index = DocumentIndex(cache)
+        self.results: Dict[str, CheckResult] = {}
+
+    @property
+    def roots(self) -> List[Path]:
+        """Directories and files whose changes can affect the checks."""
+        index = self.index
+        return [index.docs_dir, index.templates_dir, index.notebooks_dir,
+                index.repo_root / "mkdocs.yml"]
+
+    def start(self) -> QAReport:
+        """Full run that later batches are compared against."""
+        report = run_checks(verbose=self.verbose, index=self.index, jobs=self.jobs,
+                            functions=self.functions)
+        self.results = {result.name: result for result in report.results}
+        return report
+
+    def _local(self, path: Path) -> Path:
+        """An event path in the form the index lists files in."""
+        root = self.index.repo_root
+        return root / os.path.relpath(os.path.abspath(path), os.path.abspath(root))
+
+    def apply(self, events: Iterable[FileEvent]) -> Optional[WatchUpdate]:
+        """
+        Refresh the index for a batch of events and re-run affected checks.
+
+        Returns:
+            The update, or None if no event concerned a checked file
+        """
+        start = time.perf_counter()
+        first: Dict[Path, str] = {}
+        moved = set()
+        for path, kind in events:
+            path = self._local(path)
+            if _ignored(path.relative_to(self.index.repo_root)):
+                continue
+            first.setdefault(path, kind)
+            if kind != "modified":
+                moved.add(path)
+
+        changed = []
+        kinds = set()
+        for path, kind in first.items():
+            exists = path.exists()
+            if kind == "created" and not exists:
+                continue  # Created and deleted within the batch
+            path_kinds = self.index.kinds(path)
+            if path in moved:
+                path_kinds.add("paths")
+            if path_kinds:
+                changed.append(path)
+                kinds |= path_kinds
+        if not changed:
+            return None
+
+        self.index.invalidate(changed, [path for path in changed if path in moved])
+        functions = [func for func in self.functions if CHECK_INPUTS.get(func, set()) & kinds]
+        if not functions:
+            return None
+        report = run_checks(verbose=self.verbose, index=self.index, jobs=1, functions=functions)
+
+        changes = []
+        for result in report.results:
+            previous = self.results.get(result.name)
+            self.results[result.name] = result
+            change = _compare(previous, result)
+            if change is not None:
+                changes.append(change)
+
+        root = self.index.repo_root
+        return WatchUpdate(
+            paths=sorted(path.relative_to(root).as_posix() for path in changed),
+            checks=[result.name for result in report.results],
+            changes=changes,
+            duration=time.perf_counter() - start
+        )
+
+    def run(self, debounce: float = DEBOUNCE, poll: bool = False):
+        """Print the full report, then an update per batch until interrupted."""
+        source = None
+        if not poll:
+            try:
+                source = WatchdogSource(self.roots)
+            except ImportError:
+                pass
+        if source is None:
+            source = PollingSource(self.roots)
+
+        print_report(self.start(), verbose=self.verbose)
+        print(f"Watching {', '.join(_display(self.index, root) for root in self.roots)} "
+              f"({'watchdog' if isinstance(source, WatchdogSource) else 'polling'}); "
+              "Ctrl+C to stop")
+        try:
+            while True:
+                update = self.apply(debounced(source, debounce))
+                if update is not None:
+                    print_update(update)
+        except KeyboardInterrupt:
+            print("\nStopped watching")
+        finally:
+            source.stop()
+            if self.index.cache is not None:
+                self.index.cache.save()
+
+
+def _display(index: DocumentIndex, path: Path) -> str:
+    try:
+        return path.relative_to(index.repo_root).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def _compare(previous: Optional[CheckResult], result: CheckResult) -> Optional[ResultChange]:
+    """What changed in a check's result, or None if nothing did."""
+    before = [] if previous is None else previous.details
+    before_set, after_set = set(before), set(result.details)
+    added = [detail for detail in result.details if detail not in before_set]
+    resolved = [detail for detail in before if detail not in after_set]
+    was_passed = None if previous is None else previous.passed
+    if was_passed == result.passed and not added and not resolved:
+        return None
+    return ResultChange(result.name, result.passed, was_passed, result.message, added, resolved)
+
+
+def print_update(update: WatchUpdate):
+    """Print one batch as a diff against the previous results."""
+    shown = ", ".join(update.paths[:3]) + \
+        (f" and {len(update.paths) - 3} more" if len(update.paths) > 3 else "")
+    print(f"\n[{time.strftime('%H:%M:%S')}] {shown}: "
+          f"{len(update.checks)} checks in {update.duration * 1000:.0f} ms")
+    if not update.changes:
+        print("       No changes in results")
+    for change in update.changes:
+        status = SYMBOLS['pass'] if change.passed else SYMBOLS['fail']
+        flipped = "" if change.was_passed in (None, change.passed) else " (was " + \
+            ("passing" if change.was_passed else "failing") + ")"
+        print(f"{status} | {change.name}{flipped}: {change.message}")
+        for detail in change.added:
+            print(f"       + {detail}")
+        for detail in change.resolved:
+            print(f"       - {detail}")
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+NexVigilant Multi-Pattern Term Scanner
+
+Finds every term of a vocabulary (glossary terms, abbreviations, branding
+strings, disclaimer phrases) in one pass over a document, instead of one
+search per term:
+1. All phrases are merged into one regex of two tries, case-insensitive
+   and case-sensitive, so the engine walks shared prefixes once
+   ("Benefit-Risk", "Benefit-Risk Balance") and "OR" never matches "for"
+2. The document is searched once, restarting one character after each
+   match start, so overlapping terms ("Win Ratio", "Ratio") are all found
+3. Shorter phrases that are prefixes of the matched one are credited from
+   a table built at compile time rather than by searching again
+4. Whole-word rules are checked on the matched text
+
+Phrases match case-insensitively unless a term is case-sensitive, and
+each space in a phrase matches any run of whitespace, so phrases wrapped
+across markdown lines are still found.
+
+Usage:
+    python term_scanner.py docs/reference/glossary.md "Win Ratio" NNT DOOR
+
+Educational Use Only:
+    NexVigilant | Empowerment Through Vigilance
+"""
+
+import argparse
+import hashlib
+import re
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Set, Tuple
+
+
+@dataclass(frozen=True)
+class Term:
+    """
+    A named vocabulary entry.
+
+    Attributes:
+        name: Identifier reported when any phrase is found
+        phrases: Literal spellings; the term is present if any occurs
+        case_sensitive: Phrases must match with their exact capitalisation
+        whole_word: Phrases must not be part of a longer word ("PASS" is
+                    not found in "passage")
+    """
+    name: str
+    phrases: Tuple[str, ...]
+    case_sensitive: bool = False
+    whole_word: bool = False
+
+    @classmethod
+    def of(cls, name: str, *phrases: str, **options) -> "Term":
+        """Term whose phrases default to its name."""
+        return cls(name, tuple(phrases) or (name,), **options)
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class TermScanner:
+    """
+    Compiled matcher for a set of terms.
+
+    Args:
+        terms: Vocabulary to search for; names must be unique
+
+    Raises:
+        ValueError: On duplicate names or empty phrases
+    """
+
+    def __init__(self, terms: Iterable[Term]):
+        self.terms = tuple(terms)
+        names = [term.name for term in self.terms]
+        if len(set(names)) != len(names):
+            raise ValueError("term names must be unique")
+
+        # Phrases keyed by whitespace-folded form, lowercased unless case-
+        # sensitive; one key can serve several terms
+        self._entries: Tuple[Dict[str, List[Term]], ...] = (defaultdict(list), defaultdict(list))
+        for term in self.terms:
+            for phrase in term.phrases:
+                phrase = _normalize(phrase)
+                if not phrase:
+                    raise ValueError(f"term {term.name!r} has an empty phrase")
+                if term.case_sensitive:
+                    self._entries[1][phrase].append(term)
+                else:
+                    self._entries[0][phrase.lower()].append(term)
+
+        keys = [sorted(entries) for entries in self._entries]
+        tries = [_trie_regex(group) for group in keys]
+        self._patterns = (re.compile(f"(?i:{tries[0]})" if keys[0] else "(?!)"),
+                          re.compile(tries[1] if keys[1] else "(?!)"))
+        # One search covers both groups. Where the case-insensitive branch
+        # wins, the case-sensitive one is then tried at that position too.
+        if all(keys):
+            self._pattern = re.compile(f"(?P<i>(?i:{tries[0]}))|{tries[1]}")
+            self._only = None
+        else:
+            self._only = 0 if keys[0] else 1
+            self._pattern = self._patterns[self._only]
+        self._phrase_patterns = [{key: re.compile(_trie_regex([key]), flags)
+                                  for key in group}
+                                 for group, flags in zip(keys, (re.IGNORECASE, 0))]
+        # Phrases found wherever a longer phrase is found (at the same start)
+        self._prefixes = [{key: [other for other in group if other != key and key.startswith(other)]
+                           for key in group}
+                          for group in keys]
+        self.fingerprint = hashlib.sha256(repr(self.terms).encode()).hexdigest()[:12]
+
+    def scan(self, text: str) -> Set[str]:
+        """Names of the terms present in text."""
+        found: Set[str] = set()
+        search = self._pattern.search
+        position = 0
+        while True:
+            match = search(text, position)
+            if match is None:
+                return found
+            start = match.start()
+            if self._only is not None:
+                hits = [(self._only, match)]
+            elif match.group("i") is not None:
+                hits = [(0, match), (1, self._patterns[1].match(text, start))]
+            else:
+                hits = [(1, match)]
+            for group, hit in hits:
+                if hit is None:
+                    continue
+                key = _normalize(hit.group())
+                key = key.lower() if group == 0 else key
+                self._credit(text, start, group, key, hit.end(), found)
+                for prefix in self._prefixes[group][key]:
+                    self._credit(text, start, group, prefix, None, found)
+            position = start + 1
+
+    def _credit(self, text: str, start: int, group: int, key: str, end, found: Set[str]):
+        """Record the terms of one phrase key matched at start."""
+        for term in self._entries[group][key]:
+            if term.name in found:
+                continue
+            if term.whole_word:
+                if end is None:
+                    end = self._phrase_patterns[group][key].match(text, start).end()
+                if (start > 0 and _is_word_char(text[start - 1])) or \
+                        (end < len(text) and _is_word_char(text[end])):
+                    continue
+            found.add(term.name)
+
+    def index(self, documents: Mapping[str, str]) -> Dict[str, List[str]]:
+        """
+        Term -> documents index.
+
+        Args:
+            documents: Document name -> text
+
+        Returns:
+            Dict mapping each term found anywhere to the documents it occurs
+            in, in the order documents were given
+        """
+        usage: Dict[str, List[str]] = defaultdict(list)
+        for name, text in documents.items():
+            for term in self.scan(text):
+                usage[term].append(name)
+        return dict(usage)
+
+
+def _trie_regex(keys: List[str]) -> str:
+    """Regex matching any key, longest first, sharing common prefixes."""
+    trie: dict = {}
+    for key in keys:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _node_regex(trie)
+
+
+def _node_regex(node: dict) -> str:
+    branches = [(r"\s+" if char == " " else re.escape(char)) + _node_regex(child)
+                for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    if len(branches) == 1 and "" not in node:
+        return branches[0]
+    # Continuing is tried before stopping, so the longest phrase wins
+    return "(?:" + "|".join(branches) + ")" + ("?" if "" in node else "")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="List which terms occur in markdown files",
+        epilog="Educational Use Only - NexVigilant | Empowerment Through Vigilance"
+    )
+    parser.add_argument('path', type=Path, help="File or directory (searched for *.md)")
+    parser.add_argument('terms', nargs='+', help="Terms to look for")
+    parser.add_argument('--case-sensitive', action='store_true')
+    parser.add_argument('--whole-word', action='store_true')
+    args = parser.parse_args()
+
+    files = sorted(args.path.rglob("*.md")) if args.path.is_dir() else [args.path]
+    scanner = TermScanner(Term.of(term, case_sensitive=args.case_sensitive,
+                                  whole_word=args.whole_word) for term in args.terms)
+    usage = scanner.index({str(f): f.read_text(encoding='utf-8') for f in files})
+
+    for term in args.terms:
+        documents = usage.get(term, [])
+        print(f"{term}: {len(documents)} file(s)")
+        for document in documents:
+            print(f"    {document}")
+    sys.exit(0 if usage else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,11 +7,23 @@ Validates Jupyter notebooks by:
 2. Optionally executing notebooks to verify code runs without errors
 3. Reporting any issues found
 
+Notebooks are executed in-process with nbclient on a pool of pre-started
+kernels (KernelPool), several at a time with --jobs. A kernel is reset
+between notebooks rather than restarted, so only the first notebook on
+each kernel pays for kernel startup.
+
+Execution results are cached in .cache/notebook_results.json, keyed by a
+hash of the notebook's code cells, the kernel name and the installed
+package versions (ExecutionCache). A notebook whose key is unchanged is not
+executed again, so editing markdown cells or docs costs no kernel time.
+
 Usage:
     python validate_notebooks.py                      # Validate all notebooks
     python validate_notebooks.py --execute            # Validate and execute
     python validate_notebooks.py notebooks/DOOR*.ipynb  # Specific notebooks
     python validate_notebooks.py --timeout 120       # Custom timeout per notebook
+    python validate_notebooks.py --execute --jobs 4  # Four notebooks at a time
+    python validate_notebooks.py --execute --refresh # Re-execute, update cache
 
 Educational Use Only:
     This tool is provided by NexVigilant for educational and learning purposes.
@@ -20,17 +32,42 @@ NexVigilant | Empowerment Through Vigilance
 """
 
 import argparse
+import asyncio
+import atexit
+import hashlib
 import json
 import os
-import subprocess
+import re
 import sys
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import List, Tuple, Optional
-import tempfile
+from typing import Callable, List, Tuple, Optional
 
 
 # Default notebook directory relative to script location
-NOTEBOOKS_DIR = Path(__file__).parent.parent / "notebooks"
+REPO_ROOT = Path(__file__).parent.parent
+NOTEBOOKS_DIR = REPO_ROOT / "notebooks"
+
+CACHE_PATH = REPO_ROOT / ".cache" / "notebook_results.json"
+CACHE_FORMAT = 1
+
+# Longest error message kept per notebook
+MAX_ERROR_LENGTH = 500
+
+# Run in a pooled kernel before each notebook: drop the previous notebook's
+# variables, figures and sys.path changes, and start in the notebook's
+# directory as nbconvert does. Imported modules stay loaded.
+RESET_CODE = """\
+import os, sys
+sys.path[:] = sys.__dict__.setdefault("_pool_path", list(sys.path))
+if "matplotlib.pyplot" in sys.modules:
+    sys.modules["matplotlib.pyplot"].close("all")
+os.chdir({cwd!r})
+get_ipython().run_line_magic("reset", "-f")
+"""
+
+ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*m')
 
 
 class NotebookValidationError(Exception):
@@ -109,6 +146,261 @@ def count_cells_by_type(notebook_path: Path) -> dict:
     return counts
 
 
+def _error_message(error: Exception) -> str:
+    """Readable, truncated text of an execution error."""
+    error_msg = ANSI_ESCAPE.sub('', str(error)).strip() or type(error).__name__
+    # Truncate long errors
+    if len(error_msg) > MAX_ERROR_LENGTH:
+        error_msg = error_msg[:MAX_ERROR_LENGTH] + "... (truncated)"
+    return error_msg
+
+
+def environment_hash() -> str:
+    """
+    Hash of the Python version and every installed package version.
+
+    These are the validator's own packages; the 'python3' kernel normally
+    runs in the same environment.
+    """
+    from importlib import metadata
+
+    packages = sorted({(dist.metadata['Name'] or '').lower(): dist.version
+                       for dist in metadata.distributions()}.items())
+    return hashlib.sha256(json.dumps([sys.version, packages]).encode()).hexdigest()
+
+
+class ExecutionCache:
+    """
+    Notebook execution results keyed by code, kernel and environment.
+
+    One entry is kept per notebook path, holding the key it was executed
+    under with its outcome (passed, error, seconds). A lookup hits only if
+    the notebook's current key matches; markdown cells and outputs are not
+    part of the key. Only conclusive outcomes are stored: a pass, or an
+    error raised by a cell. Timeouts and kernel failures are retried on
+    the next run.
+
+    Args:
+        path: JSON file for the cache
+        kernel: Kernel name notebooks are executed with
+        refresh: Miss on every lookup but still store results
+    """
+
+    def __init__(self, path: Path = CACHE_PATH, kernel: str = 'python3', refresh: bool = False):
+        self.path = Path(path)
+        self.kernel = kernel
+        self.refresh = refresh
+        self.environment = environment_hash()
+        self.hits = 0
+        self.entries: dict = {}
+        try:
+            stored = json.loads(self.path.read_text(encoding='utf-8'))
+            if stored.get("format") == CACHE_FORMAT:
+                self.entries = stored["notebooks"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    @staticmethod
+    def _name(notebook_path: Path) -> str:
+        return Path(os.path.relpath(notebook_path.resolve(), REPO_ROOT.resolve())).as_posix()
+
+    def key(self, notebook_path: Path) -> str:
+        """Hash of a notebook's code cell sources, the kernel and the environment."""
+        with open(notebook_path, 'r', encoding='utf-8') as f:
+            notebook = json.load(f)
+        sources = []
+        for cell in notebook.get('cells', []):
+            if cell.get('cell_type') == 'code':
+                source = cell.get('source', '')
+                sources.append(''.join(source) if isinstance(source, list) else source)
+        payload = json.dumps([sources, self.kernel, self.environment])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def lookup(self, notebook_path: Path) -> Optional[Tuple[bool, Optional[str], float]]:
+        """Cached (success, error_message, seconds), or None to execute."""
+        entry = self.entries.get(self._name(notebook_path))
+        if self.refresh or entry is None or entry["key"] != self.key(notebook_path):
+            return None
+        self.hits += 1
+        return entry["passed"], entry["error"], entry["seconds"]
+
+    def store(self, notebook_path: Path, success: bool, error: Optional[str], seconds: float):
+        self.entries[self._name(notebook_path)] = {
+            "key": self.key(notebook_path),
+            "passed": success,
+            "error": error,
+            "seconds": round(seconds, 2),
+        }
+
+    def save(self):
+        """Write the cache, dropping notebooks that no longer exist."""
+        entries = {name: entry for name, entry in self.entries.items()
+                   if (REPO_ROOT / name).exists()}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"format": CACHE_FORMAT, "notebooks": entries}, indent=1),
+                       encoding='utf-8')
+        os.replace(tmp, self.path)
+
+
+class KernelPool:
+    """
+    Pre-started Jupyter kernels shared by notebook executions.
+
+    All kernels start concurrently when the pool is entered (async with),
+    and each notebook borrows one. A kernel is handed back as it is; the
+    next notebook resets it with RESET_CODE. A kernel whose notebook timed
+    out, or that died, is restarted first.
+
+    Args:
+        size: Number of kernels
+        kernel: Kernel name (e.g. 'python3')
+    """
+
+    def __init__(self, size: int = 1, kernel: str = 'python3'):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self.kernel = kernel
+        self.restarts = 0
+        self._managers = []
+        self._idle: Optional[asyncio.Queue] = None
+
+    async def __aenter__(self) -> "KernelPool":
+        from jupyter_client.manager import AsyncKernelManager
+
+        self._idle = asyncio.Queue()
+        self._managers = [AsyncKernelManager(kernel_name=self.kernel) for _ in range(self.size)]
+        try:
+            await asyncio.gather(*(self._start(km) for km in self._managers))
+        except BaseException:
+            await self.__aexit__(None, None, None)
+            raise
+        for km in self._managers:
+            self._idle.put_nowait(km)
+        return self
+
+    async def _start(self, km):
+        # No IPython history file, as nbclient does for the kernels it starts
+        await km.start_kernel(extra_arguments=["--HistoryManager.hist_file=:memory:"])
+
+    async def __aexit__(self, *exc_info):
+        await asyncio.gather(*(km.shutdown_kernel(now=True) for km in self._managers
+                               if km.has_kernel), return_exceptions=True)
+
+    @asynccontextmanager
+    async def kernel_manager(self):
+        """Borrow an idle kernel's manager, waiting for one if all are busy."""
+        km = await self._idle.get()
+        healthy = False
+        try:
+            yield km
+            healthy = True
+        finally:
+            try:
+                if not healthy or not await km.is_alive():
+                    self.restarts += 1
+                    await km.restart_kernel(now=True)
+            finally:
+                self._idle.put_nowait(km)
+
+
+async def _execute_on(
+    pool: KernelPool,
+    notebook_path: Path,
+    timeout: int
+) -> Tuple[bool, Optional[str], float, bool]:
+    """
+    Execute one notebook on a pooled kernel.
+
+    Returns:
+        (success, error_message, seconds, conclusive); seconds exclude
+        waiting for a kernel, and conclusive is False for timeouts and
+        kernel failures
+    """
+    import nbformat
+    from nbclient import NotebookClient
+    from nbclient.exceptions import CellExecutionError, CellTimeoutError
+
+    notebook = nbformat.read(str(notebook_path), as_version=4)
+    cwd = str(notebook_path.resolve().parent)
+    notebook.cells.insert(0, nbformat.v4.new_code_cell(RESET_CODE.format(cwd=cwd)))
+
+    start = None
+    try:
+        async with pool.kernel_manager() as km:
+            start = time.perf_counter()
+            client = NotebookClient(notebook, km=km, timeout=timeout, kernel_name=pool.kernel,
+                                    resources={'metadata': {'path': cwd}})
+            try:
+                # timeout applies per cell, as ExecutePreprocessor.timeout
+                # did; the extra buffer bounds the notebook as a whole
+                await asyncio.wait_for(client.async_execute(), timeout + 30)
+            except CellExecutionError as e:
+                # The kernel is fine; the next notebook resets it
+                return False, _error_message(e), time.perf_counter() - start, True
+            finally:
+                # nbclient leaves a borrowed kernel's client open
+                atexit.unregister(client._cleanup_kernel)
+                if client.kc is not None:
+                    client.kc.stop_channels()
+    except (CellTimeoutError, asyncio.TimeoutError):
+        success, error = False, f"Execution timed out after {timeout}s"
+    except Exception as e:
+        success, error = False, _error_message(e)
+    else:
+        success, error = True, None
+    return success, error, 0.0 if start is None else time.perf_counter() - start, success
+
+
+def execute_notebooks(
+    notebook_paths: List[Path],
+    timeout: int = 300,
+    kernel: str = 'python3',
+    jobs: int = 1,
+    progress: Optional[Callable[[Path, bool, Optional[str], float], None]] = None,
+    cache: Optional[ExecutionCache] = None
+) -> List[Tuple[bool, Optional[str], float]]:
+    """
+    Execute notebooks concurrently on a pool of warm kernels.
+
+    Args:
+        notebook_paths: Notebooks to execute
+        timeout: Seconds allowed per notebook, and per cell
+        kernel: Kernel name
+        jobs: Kernels in the pool, i.e. notebooks executed at a time
+        progress: Called with (path, success, error, seconds) as each
+                  notebook finishes
+        cache: Receives conclusive results; it is not consulted here
+
+    Returns:
+        (success, error_message, seconds) per notebook, in input order
+    """
+    if not notebook_paths:
+        return []
+
+    async def run_all():
+        async with KernelPool(min(jobs, len(notebook_paths)), kernel) as pool:
+
+            async def run_one(path):
+                success, error, seconds, conclusive = await _execute_on(pool, path, timeout)
+                if cache is not None and conclusive:
+                    cache.store(path, success, error, seconds)
+                if progress is not None:
+                    progress(path, success, error, seconds)
+                return success, error, seconds
+
+            return await asyncio.gather(*(run_one(path) for path in notebook_paths))
+
+    try:
+        return asyncio.run(run_all())
+    except ImportError:
+        error = "nbclient not found. Install with: pip install nbclient"
+    except Exception as e:
+        error = _error_message(e)  # e.g. the kernel could not be started
+    return [(False, error, 0.0) for _ in notebook_paths]
+
+
 def execute_notebook(
     notebook_path: Path,
     timeout: int = 300,
@@ -117,56 +409,27 @@ def execute_notebook(
     """
     Execute a notebook and return (success, error_message).
 
-    Requires nbconvert to be installed.
+    Requires nbclient to be installed.
     """
-    try:
-        # Create temp directory for output
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / notebook_path.name
-
-            # Execute notebook using nbconvert
-            result = subprocess.run(
-                [
-                    sys.executable, '-m', 'nbconvert',
-                    '--to', 'notebook',
-                    '--execute',
-                    '--ExecutePreprocessor.timeout=' + str(timeout),
-                    '--ExecutePreprocessor.kernel_name=' + kernel,
-                    '--output', str(output_path),
-                    str(notebook_path)
-                ],
-                capture_output=True,
-                text=True,
-                timeout=timeout + 30  # Extra buffer for nbconvert overhead
-            )
-
-            if result.returncode != 0:
-                # Extract useful error info
-                error_msg = result.stderr.strip() or result.stdout.strip()
-                # Truncate long errors
-                if len(error_msg) > 500:
-                    error_msg = error_msg[:500] + "... (truncated)"
-                return False, error_msg
-
-            return True, None
-
-    except subprocess.TimeoutExpired:
-        return False, f"Execution timed out after {timeout}s"
-    except FileNotFoundError:
-        return False, "nbconvert not found. Install with: pip install nbconvert"
-    except Exception as e:
-        return False, str(e)
+    success, error, _ = execute_notebooks([notebook_path], timeout, kernel)[0]
+    return success, error
 
 
 def validate_notebooks(
     notebook_paths: List[Path],
     execute: bool = False,
     timeout: int = 300,
-    verbose: bool = False
+    verbose: bool = False,
+    jobs: int = 1,
+    cache: Optional[ExecutionCache] = None
 ) -> dict:
     """
     Validate a list of notebooks.
 
+    Structure is checked first; notebooks with a valid structure are then
+    executed, `jobs` at a time. With a cache, notebooks whose cached result
+    still applies are not executed.
+
     Returns a summary dict with results.
     """
     results = {
@@ -174,6 +437,7 @@ def validate_notebooks(
         'valid': 0,
         'executed': 0,
         'failed': 0,
+        'cached': 0,
         'details': []
     }
 
@@ -186,6 +450,8 @@ def validate_notebooks(
             'execution_attempted': False,
             'execution_passed': False,
             'execution_error': None,
+            'execution_time': None,
+            'execution_cached': False,
             'cell_counts': {}
         }
 
@@ -212,26 +478,52 @@ def validate_notebooks(
                 print(f"    Cells: {counts.get('code', 0)} code, "
                       f"{counts.get('markdown', 0)} markdown")
 
-        # Execution (only if structure is valid)
-        if execute and detail['structure_valid']:
-            print(f"  Executing (timeout: {timeout}s)...")
-            detail['execution_attempted'] = True
-
-            success, error = execute_notebook(nb_path, timeout)
-
-            if success:
-                print(f"  Execution: PASSED")
-                detail['execution_passed'] = True
-                results['executed'] += 1
-            else:
-                print(f"  Execution: FAILED")
-                print(f"    Error: {error}")
-                detail['execution_error'] = error
-                results['failed'] += 1
-                results['valid'] -= 1  # Demote from valid if execution fails
-
         results['details'].append(detail)
 
+    # Execution (only if structure is valid)
+    runnable = [d for d in results['details'] if d['structure_valid']] if execute else []
+    outcomes = {}
+
+    def report(path, success, error, seconds, cached=False):
+        status = 'PASSED' if success else 'FAILED'
+        print(f"  {path.name}: {status} ({'cached, ' if cached else ''}{seconds:.1f}s)")
+        if error:
+            print(f"    Error: {error}")
+
+    if cache is not None:
+        for detail in runnable:
+            hit = cache.lookup(Path(detail['path']))
+            if hit is not None:
+                outcomes[detail['path']] = hit
+                detail['execution_cached'] = True
+                results['cached'] += 1
+        if outcomes:
+            print(f"\nReusing {len(outcomes)} cached result(s):")
+            for detail in runnable:
+                if detail['execution_cached']:
+                    report(Path(detail['path']), *outcomes[detail['path']], cached=True)
+
+    pending = [d for d in runnable if not d['execution_cached']]
+    if pending:
+        kernels = min(jobs, len(pending))
+        print(f"\nExecuting {len(pending)} notebook(s) on {kernels} kernel(s) "
+              f"(timeout: {timeout}s)...")
+        executed = execute_notebooks([Path(d['path']) for d in pending], timeout,
+                                     jobs=jobs, progress=report, cache=cache)
+        outcomes.update(zip((d['path'] for d in pending), executed))
+
+    for detail in runnable:
+        success, error, seconds = outcomes[detail['path']]
+        detail['execution_attempted'] = True
+        detail['execution_time'] = round(seconds, 2)
+        if success:
+            detail['execution_passed'] = True
+            results['executed'] += 1
+        else:
+            detail['execution_error'] = error
+            results['failed'] += 1
+            results['valid'] -= 1  # Demote from valid if execution fails
+
     return results
 
 
@@ -253,6 +545,8 @@ def print_summary(results: dict):
 
     if any(d['execution_attempted'] for d in results['details']):
         print(f"Execution passed: {results['executed']}")
+        if results.get('cached'):
+            print(f"Cached results: {results['cached']}")
 
     print(f"Failed: {results['failed']}")
 
@@ -275,6 +569,8 @@ Examples:
     python validate_notebooks.py --execute         # Validate + execute
     python validate_notebooks.py notebooks/*.ipynb # Specific files
     python validate_notebooks.py --verbose         # Show cell counts
+    python validate_notebooks.py -e --jobs 4       # Execute 4 notebooks at a time
+    python validate_notebooks.py -e --no-cache     # Execute every notebook
 
 Educational Use Only - NexVigilant | Empowerment Through Vigilance
         """
@@ -300,6 +596,25 @@ Educational Use Only - NexVigilant | Empowerment Through Vigilance
         help="Timeout per notebook in seconds (default: 300)"
     )
 
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help="Notebooks to execute at a time, one warm kernel each (default: CPU count)"
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Execute every notebook, ignoring and not updating .cache/notebook_results.json"
+    )
+
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help="Execute every notebook and replace its cached result"
+    )
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -314,6 +629,10 @@ Educational Use Only - NexVigilant | Empowerment Through Vigilance
     )
 
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.no_cache and args.refresh:
+        parser.error("--refresh updates the cache; drop --no-cache")
 
     print("NexVigilant Notebook Validator")
     print("=" * 50)
@@ -337,13 +656,21 @@ Educational Use Only - NexVigilant | Empowerment Through Vigilance
     else:
         print("Execution: DISABLED (structure check only)")
 
+    cache = None
+    if args.execute and not args.no_cache:
+        cache = ExecutionCache(refresh=args.refresh)
+
     # Run validation
     results = validate_notebooks(
         notebook_paths,
         execute=args.execute,
         timeout=args.timeout,
-        verbose=args.verbose
+        verbose=args.verbose,
+        jobs=args.jobs or os.cpu_count() or 1,
+        cache=cache
     )
+    if cache is not None:
+        cache.save()
 
     # Print summary
     print_summary(results)